@@ -1,15 +1,99 @@
+import io
+import mmap
 import os
 import subprocess
+import sys
+import tokenize
+from codecs import getincrementaldecoder
+from concurrent.futures import ThreadPoolExecutor
 
-def mostrar_codigo(ruta_script):
+TAMANO_BLOQUE = 64 * 1024  # bytes que se decodifican y escriben de una vez
+UMBRAL_MMAP = 1024 * 1024  # archivos más grandes se leen con mmap, por bloques
+
+# Un hilo lee por adelantado el siguiente script de la lista mientras el usuario
+# mira el actual; _precargados: ruta -> Future de (firma, codificación, bytes)
+_precarga = ThreadPoolExecutor(max_workers=1)
+_precargados = {}
+
+def detectar_codificacion(inicio):
+    """Codificación declarada en las dos primeras líneas (PEP 263) o BOM; utf-8 si no hay."""
+    try:
+        codificacion, _ = tokenize.detect_encoding(io.BytesIO(inicio).readline)
+    except SyntaxError:  # cookie con una codificación desconocida
+        codificacion = "utf-8"
+    return codificacion
+
+def _leer_inicio(archivo):
+    # Un archivo chico se lee completo; de uno grande solo el primer bloque
+    estado = os.fstat(archivo.fileno())
+    firma = (estado.st_mtime_ns, estado.st_size)
+    inicio = archivo.read(estado.st_size if estado.st_size <= UMBRAL_MMAP else TAMANO_BLOQUE)
+    return firma, detectar_codificacion(inicio), inicio
+
+def _leer_inicio_ruta(ruta):
+    with open(ruta, 'rb') as archivo:
+        return _leer_inicio(archivo)
+
+def precargar(ruta_script):
+    """Empieza a leer el script en segundo plano; mostrar_codigo lo usa si no cambió."""
+    ruta = os.path.abspath(ruta_script)
+    if ruta not in _precargados:
+        _precargados.clear()  # solo interesa el siguiente de la lista
+        _precargados[ruta] = _precarga.submit(_leer_inicio_ruta, ruta)
+
+def _bloques(archivo, inicio, tamano):
+    # Los bytes ya leídos (inicio) y luego el resto del archivo, de a TAMANO_BLOQUE
+    yield inicio
+    desde = len(inicio)
+    if desde >= tamano:
+        return
+    if tamano > UMBRAL_MMAP:
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            for i in range(desde, len(mapa), TAMANO_BLOQUE):
+                yield mapa[i:i + TAMANO_BLOQUE]
+    else:
+        archivo.seek(desde)
+        while True:
+            bloque = archivo.read(TAMANO_BLOQUE)
+            if not bloque:
+                return
+            yield bloque
+
+def mostrar_codigo(ruta_script, salida=None):
+    """Muestra el script por bloques, sin cargarlo completo en memoria.
+    Retorna la cantidad de caracteres mostrados, o None si no se pudo leer."""
     # Asegúrate de que la ruta al script es absoluta
     ruta_script_absoluta = os.path.abspath(ruta_script)
+    salida = salida or sys.stdout
     try:
-        with open(ruta_script_absoluta, 'r') as archivo:
-            codigo = archivo.read()
-            print(f"\n--- Código de {ruta_script} ---\n")
-            print(codigo)
-            return codigo
+        futuro = _precargados.pop(ruta_script_absoluta, None)
+        with open(ruta_script_absoluta, 'rb') as archivo:
+            estado = os.fstat(archivo.fileno())
+            firma = (estado.st_mtime_ns, estado.st_size)
+            precargado = futuro.result() if futuro is not None and futuro.exception() is None else None
+            if precargado is None or precargado[0] != firma:
+                precargado = _leer_inicio(archivo)
+            _, codificacion, inicio = precargado
+            # Caracteres inválidos se muestran como � en vez de abortar; \r\n pasa a \n
+            decodificador = io.IncrementalNewlineDecoder(
+                getincrementaldecoder(codificacion)(errors='replace'), translate=True)
+            # La consola puede no ser UTF-8: lo que no pueda mostrar se reemplaza
+            consola = getattr(salida, 'encoding', None) or 'utf-8'
+
+            def escribir(texto):
+                salida.write(texto.encode(consola, 'replace').decode(consola))
+
+            escribir(f"\n--- Código de {ruta_script} ({codificacion}) ---\n\n")
+            mostrados = 0
+            for bloque in _bloques(archivo, inicio, estado.st_size):
+                texto = decodificador.decode(bloque)
+                if texto:
+                    escribir(texto)
+                    mostrados += len(texto)
+            texto = decodificador.decode(b"", final=True)
+            escribir(texto + "\n")
+            salida.flush()
+            return mostrados + len(texto)
     except FileNotFoundError:
         print("El archivo no se encontró.")
         return None
@@ -77,6 +161,8 @@ def mostrar_sub_menu(ruta_unidad):
 
 def mostrar_scripts(ruta_sub_carpeta):
     scripts = [f.name for f in os.scandir(ruta_sub_carpeta) if f.is_file() and f.name.endswith('.py')]
+    if scripts:
+        precargar(os.path.join(ruta_sub_carpeta, scripts[0]))
 
     while True:
         print("\nScripts - Selecciona un script para ver y ejecutar")
@@ -96,8 +182,11 @@ def mostrar_scripts(ruta_sub_carpeta):
                 eleccion_script = int(eleccion_script) - 1
                 if 0 <= eleccion_script < len(scripts):
                     ruta_script = os.path.join(ruta_sub_carpeta, scripts[eleccion_script])
-                    codigo = mostrar_codigo(ruta_script)
-                    if codigo:
+                    mostrados = mostrar_codigo(ruta_script)
+                    # Mientras se lee este, se carga el siguiente de la lista
+                    if eleccion_script + 1 < len(scripts):
+                        precargar(os.path.join(ruta_sub_carpeta, scripts[eleccion_script + 1]))
+                    if mostrados:
                         ejecutar = input("¿Desea ejecutar el script? (1: Sí, 0: No): ")
                         if ejecutar == '1':
                             ejecutar_codigo(ruta_script)
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class DispositivoElectronico(ABC):
+    encendido = False
+
     @abstractmethod
     def encender(self):
         pass
@@ -9,15 +11,20 @@ class DispositivoElectronico(ABC):
     def apagar(self):
         pass
 
+    def estado(self):
+        return f"{type(self).__name__}: {'encendido' if self.encendido else 'apagado'}"
+
 class Laptop(DispositivoElectronico):
     def encender(self):
+        self.encendido = True
         print("La laptop se está encendiendo...")
 
     def apagar(self):
+        self.encendido = False
         print("La laptop se está apagando...")
 
 # Ejemplo de uso
 if __name__ == "__main__":
     mi_laptop = Laptop()
     mi_laptop.encender()
-    mi_laptop.apagar()
\ No newline at end of file
+    mi_laptop.apagar()
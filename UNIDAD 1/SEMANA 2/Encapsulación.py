@@ -1,18 +1,38 @@
+import sys
+import threading
+from collections import Counter
+from itertools import count
+
+
 class CuentaBancaria:
-    def __init__(self, titular, saldo_inicial=0):
+    def __init__(self, titular, saldo_inicial=0, numero=None):
         self.__titular = titular
         self.__saldo = saldo_inicial
+        self.numero = numero
+        # Protege el saldo: depositar y retirar desde varios hilos no pierde movimientos
+        self._candado = threading.Lock()
+
+    @property
+    def titular(self):
+        return self.__titular
+
+    @property
+    def saldo(self):
+        """Solo lectura: el saldo cambia únicamente con depósitos, retiros y transferencias."""
+        return self.__saldo
 
     def depositar(self, cantidad):
         if cantidad > 0:
-            self.__saldo += cantidad
+            with self._candado:
+                self._acreditar(cantidad)
             print(f"Depósito exitoso. Nuevo saldo: ${self.__saldo}")
         else:
             print("Cantidad no válida para depósito.")
 
     def retirar(self, cantidad):
-        if 0 < cantidad <= self.__saldo:
-            self.__saldo -= cantidad
+        with self._candado:
+            exitoso = 0 < cantidad and self._debitar(cantidad)
+        if exitoso:
             print(f"Retiro exitoso. Saldo restante: ${self.__saldo}")
         else:
             print("Fondos insuficientes o cantidad inválida.")
@@ -20,8 +40,291 @@ class CuentaBancaria:
     def mostrar_saldo(self):
         print(f"Saldo actual de {self.__titular}: ${self.__saldo}")
 
-# Ejemplo de uso
-if __name__ == "__main__":
+    # Sin validar ni tomar el candado: lo hace quien llama (depositar, retirar o LibroContable)
+    def _acreditar(self, cantidad):
+        self.__saldo += cantidad
+
+    def _debitar(self, cantidad):
+        if cantidad > self.__saldo:
+            return False
+        self.__saldo -= cantidad
+        return True
+
+
+# Motivos de rechazo de una operación
+CANTIDAD_INVALIDA = "cantidad inválida"
+CUENTA_INEXISTENTE = "cuenta inexistente"
+MISMA_CUENTA = "misma cuenta"
+FONDOS_INSUFICIENTES = "fondos insuficientes"
+
+
+class ReporteLote:
+    """Resultado de LibroContable.aplicar_lote: un solo informe para todo el lote."""
+    __slots__ = ("aplicadas", "rechazadas", "movido", "depositado", "retirado", "primeros_rechazos")
+
+    def __init__(self):
+        self.aplicadas = 0
+        self.rechazadas = Counter()  # motivo -> cantidad
+        self.movido = 0  # suma de todas las operaciones aplicadas
+        self.depositado = 0  # de ellas, depósitos (entra dinero al libro)
+        self.retirado = 0  # y retiros (sale dinero del libro)
+        self.primeros_rechazos = []  # (posición en el lote, motivo), hasta 10
+
+    def __str__(self):
+        rechazos = ", ".join(f"{motivo}: {n:,}" for motivo, n in self.rechazadas.most_common()) or "ninguna"
+        return (f"{self.aplicadas:,} operaciones aplicadas (${self.movido:,} movidos, "
+                f"${self.depositado:,} depositados, ${self.retirado:,} retirados); rechazadas: {rechazos}")
+
+
+class LibroContable:
+    """Cuentas con transferencias atómicas entre ellas.
+
+    Una operación es (origen, destino, cantidad) con números de cuenta; origen
+    None es un depósito y destino None un retiro. Cada operación toma el
+    candado de las cuentas que toca, así que nadie ve el dinero fuera de una
+    cuenta y todavía no en la otra. Los candados de una transferencia se toman
+    siempre en orden de número de cuenta: si un hilo transfiere de A a B y otro
+    de B a A, ambos piden primero el de la cuenta menor y no pueden quedar
+    esperándose mutuamente (deadlock).
+
+    Las operaciones rechazadas no modifican nada. Para que la suma de los
+    saldos sea exacta con millones de operaciones, usar enteros (centavos).
+    """
+
+    def __init__(self):
+        self._cuentas = {}
+        self._numeros = count(1)
+
+    def abrir_cuenta(self, titular, saldo_inicial=0):
+        """Crea una cuenta y retorna su número."""
+        numero = next(self._numeros)
+        self._cuentas[numero] = CuentaBancaria(titular, saldo_inicial, numero)
+        return numero
+
+    def cuenta(self, numero):
+        return self._cuentas[numero]
+
+    def depositar(self, numero, cantidad):
+        return self._aplicar(None, numero, cantidad) is None
+
+    def retirar(self, numero, cantidad):
+        return self._aplicar(numero, None, cantidad) is None
+
+    def transferir(self, origen, destino, cantidad):
+        """Mueve `cantidad` de una cuenta a otra, todo o nada. False si se rechaza."""
+        return self._aplicar(origen, destino, cantidad) is None
+
+    def _aplicar(self, origen, destino, cantidad):
+        # Retorna None si se aplicó o el motivo del rechazo
+        if not cantidad > 0:  # también rechaza NaN
+            return CANTIDAD_INVALIDA
+        cuentas = self._cuentas
+        if origen is None or destino is None:
+            cuenta = cuentas.get(destino if origen is None else origen)
+            if cuenta is None:
+                return CUENTA_INEXISTENTE
+            with cuenta._candado:
+                if origen is None:
+                    cuenta._acreditar(cantidad)
+                elif not cuenta._debitar(cantidad):
+                    return FONDOS_INSUFICIENTES
+            return None
+        de, a = cuentas.get(origen), cuentas.get(destino)
+        if de is None or a is None:
+            return CUENTA_INEXISTENTE
+        if de is a:
+            return MISMA_CUENTA
+        primera, segunda = (de, a) if origen < destino else (a, de)
+        with primera._candado, segunda._candado:
+            if not de._debitar(cantidad):
+                return FONDOS_INSUFICIENTES
+            a._acreditar(cantidad)
+        return None
+
+    def aplicar_lote(self, operaciones):
+        """Aplica un iterable de (origen, destino, cantidad) sin imprimir nada por
+        operación. Retorna un ReporteLote."""
+        reporte = ReporteLote()
+        aplicar = self._aplicar
+        aplicadas = movido = depositado = retirado = 0
+        rechazadas = reporte.rechazadas
+        for posicion, (origen, destino, cantidad) in enumerate(operaciones):
+            motivo = aplicar(origen, destino, cantidad)
+            if motivo is None:
+                aplicadas += 1
+                movido += cantidad
+                if origen is None:
+                    depositado += cantidad
+                elif destino is None:
+                    retirado += cantidad
+            else:
+                rechazadas[motivo] += 1
+                if len(reporte.primeros_rechazos) < 10:
+                    reporte.primeros_rechazos.append((posicion, motivo))
+        reporte.aplicadas = aplicadas
+        reporte.movido = movido
+        reporte.depositado = depositado
+        reporte.retirado = retirado
+        return reporte
+
+    def saldo_total(self):
+        """Suma de todos los saldos en un mismo instante: toma todos los candados
+        (en orden) para que ninguna transferencia quede a medias."""
+        cuentas = [self._cuentas[n] for n in sorted(self._cuentas)]
+        tomados = []
+        try:
+            for cuenta in cuentas:
+                cuenta._candado.acquire()
+                tomados.append(cuenta)
+            return sum(cuenta.saldo for cuenta in cuentas)
+        finally:
+            for cuenta in tomados:
+                cuenta._candado.release()
+
+    def __len__(self):
+        return len(self._cuentas)
+
+
+# ------------------ Benchmark y prueba de concurrencia ------------------
+def _operaciones_azar(n, cuentas, semilla, depositos=0.05, retiros=0.05):
+    import random
+
+    azar = random.Random(semilla)
+    operaciones = []
+    for _ in range(n):
+        x = azar.random()
+        cantidad = azar.randint(1, 500)
+        if x < depositos:
+            operaciones.append((None, azar.randint(1, cuentas), cantidad))
+        elif x < depositos + retiros:
+            operaciones.append((azar.randint(1, cuentas), None, cantidad))
+        else:
+            operaciones.append((azar.randint(1, cuentas), azar.randint(1, cuentas), cantidad))
+    return operaciones
+
+
+def benchmark(n=2_000_000, cuentas=10_000, hilos=4):
+    """Operaciones/s: retirar + depositar de CuentaBancaria (con sus prints) contra
+    LibroContable.transferir de a una, aplicar_lote y aplicar_lote en varios hilos."""
+    import contextlib
+    import os
+    import time
+
+    operaciones = _operaciones_azar(n, cuentas, semilla=1)
+
+    sueltas = [CuentaBancaria(f"Cliente {i}", 10_000) for i in range(cuentas + 1)]
+    muestra = operaciones[:n // 10]  # con prints es lento: una décima parte basta
+    inicio = time.perf_counter()
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        for origen, destino, cantidad in muestra:
+            if origen is not None:
+                sueltas[origen].retirar(cantidad)
+            if destino is not None:
+                sueltas[destino].depositar(cantidad)
+    t_base = (time.perf_counter() - inicio) / len(muestra)
+    print(f"CuentaBancaria.retirar + depositar (prints a /dev/null, no atómico): {1 / t_base:,.0f} op/s")
+
+    def nuevo_libro():
+        libro = LibroContable()
+        for i in range(cuentas):
+            libro.abrir_cuenta(f"Cliente {i}", 10_000)
+        return libro
+
+    libro = nuevo_libro()
+    transferir = libro.transferir
+    inicio = time.perf_counter()
+    for origen, destino, cantidad in operaciones:
+        transferir(origen, destino, cantidad)
+    t = time.perf_counter() - inicio
+    print(f"LibroContable.transferir de a una: {n / t:,.0f} op/s ({t_base * n / t:.1f}x)")
+
+    libro = nuevo_libro()
+    total = libro.saldo_total()
+    inicio = time.perf_counter()
+    reporte = libro.aplicar_lote(operaciones)
+    t = time.perf_counter() - inicio
+    print(f"aplicar_lote de {n:,} operaciones: {t:.2f} s, {n / t:,.0f} op/s ({t_base * n / t:.1f}x)")
+    print(f"  {reporte}")
+    assert libro.saldo_total() == total + reporte.depositado - reporte.retirado
+
+    libro = nuevo_libro()
+    partes = [operaciones[i::hilos] for i in range(hilos)]
+    reportes = [None] * hilos
+
+    def trabajar(i):
+        reportes[i] = libro.aplicar_lote(partes[i])
+
+    trabajadores = [threading.Thread(target=trabajar, args=(i,)) for i in range(hilos)]
+    inicio = time.perf_counter()
+    for h in trabajadores:
+        h.start()
+    for h in trabajadores:
+        h.join()
+    t = time.perf_counter() - inicio
+    print(f"aplicar_lote en {hilos} hilos: {n / t:,.0f} op/s "
+          f"({sum(r.aplicadas for r in reportes):,} aplicadas, CPU: {os.cpu_count()})")
+
+
+def prueba_concurrencia(operaciones=400_000, hilos=8, cuentas=20):
+    """Varios hilos transfieren al azar entre pocas cuentas (A->B y B->A a la vez)
+    mientras otro suma los saldos. El total nunca cambia, ningún saldo queda
+    negativo, cada saldo final coincide con las transferencias aplicadas y
+    ningún hilo queda bloqueado."""
+    libro = LibroContable()
+    for i in range(cuentas):
+        libro.abrir_cuenta(f"Cliente {i}", 1_000)
+    total = libro.saldo_total()
+    lotes = [_operaciones_azar(operaciones // hilos, cuentas, semilla=n, depositos=0, retiros=0)
+             for n in range(hilos)]
+    aplicadas = [[] for _ in range(hilos)]
+    terminado = threading.Event()
+    sumas = []
+
+    def trabajar(n):
+        transferir = libro.transferir
+        for origen, destino, cantidad in lotes[n]:
+            if transferir(origen, destino, cantidad):
+                aplicadas[n].append((origen, destino, cantidad))
+
+    def sumar():
+        while not terminado.is_set():
+            sumas.append(libro.saldo_total())
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # cambiar de hilo muy seguido para provocar carreras
+    try:
+        lector = threading.Thread(target=sumar)
+        trabajadores = [threading.Thread(target=trabajar, args=(n,)) for n in range(hilos)]
+        lector.start()
+        for t in trabajadores:
+            t.start()
+        for t in trabajadores:
+            t.join(timeout=300)
+        terminado.set()
+        lector.join(timeout=60)
+    finally:
+        sys.setswitchinterval(intervalo)
+    assert not any(t.is_alive() for t in trabajadores + [lector]), "Un hilo quedó bloqueado (deadlock)"
+    assert set(sumas) == {total}, "Una suma vio una transferencia a medias"
+    esperado = {n: 1_000 for n in range(1, cuentas + 1)}
+    for lista in aplicadas:
+        for origen, destino, cantidad in lista:
+            esperado[origen] -= cantidad
+            esperado[destino] += cantidad
+    finales = {n: libro.cuenta(n).saldo for n in esperado}
+    assert finales == esperado, "Se perdió o duplicó un movimiento"
+    assert min(finales.values()) >= 0
+    print(f"✔ {operaciones:,} transferencias con {hilos} hilos entre {cuentas} cuentas: "
+          f"{sum(map(len, aplicadas)):,} aplicadas, {len(sumas):,} sumas del total sin diferencias.")
+
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--estres":
+    # python Encapsulación.py --estres [operaciones]
+    prueba_concurrencia(int(sys.argv[2]) if len(sys.argv) > 2 else 400_000)
+elif __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+    # python Encapsulación.py --benchmark [operaciones]
+    benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000)
+elif __name__ == "__main__":
     cuenta = CuentaBancaria("María", 1000)
     cuenta.depositar(250)
     cuenta.retirar(500)
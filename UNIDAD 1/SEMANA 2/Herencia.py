@@ -3,16 +3,19 @@ class Vehiculo:
         self.marca = marca
         self.modelo = modelo
 
+    def texto(self):
+        return f"Vehículo: {self.marca} {self.modelo}"
+
     def descripcion(self):
-        print(f"Vehículo: {self.marca} {self.modelo}")
+        print(self.texto())
 
 class Motocicleta(Vehiculo):
     def __init__(self, marca, modelo, cilindrada):
         super().__init__(marca, modelo)
         self.cilindrada = cilindrada
 
-    def descripcion(self):
-        print(f"Motocicleta: {self.marca} {self.modelo}, {self.cilindrada}cc")
+    def texto(self):
+        return f"Motocicleta: {self.marca} {self.modelo}, {self.cilindrada}cc"
 
 # Ejemplo de uso
 if __name__ == "__main__":
@@ -1,14 +1,17 @@
 class Animal:
+    def sonido(self):
+        return "Este animal hace un sonido."
+
     def hacer_sonido(self):
-        print("Este animal hace un sonido.")
+        print(self.sonido())
 
 class Perro(Animal):
-    def hacer_sonido(self):
-        print("El perro dice: ¡Guau!")
+    def sonido(self):
+        return "El perro dice: ¡Guau!"
 
 class Gato(Animal):
-    def hacer_sonido(self):
-        print("El gato dice: ¡Miau!")
+    def sonido(self):
+        return "El gato dice: ¡Miau!"
 
 # Función que demuestra polimorfismo
 def reproducir_sonido(animal):
@@ -18,4 +21,4 @@ def reproducir_sonido(animal):
 if __name__ == "__main__":
     animales = [Perro(), Gato(), Animal()]
     for a in animales:
-        reproducir_sonido(a)
\ No newline at end of file
+        reproducir_sonido(a)
@@ -0,0 +1,223 @@
+# despacho.py
+"""
+Despacho por tipo para colecciones grandes y mezcladas de objetos de las
+jerarquías de esta semana (Animal, Vehiculo, DispositivoElectronico).
+
+El despacho clásico llama un método por objeto (animal.sonido()) o, si los
+objetos no comparten interfaz, recorre una cadena de isinstance (describir).
+Despachador es una tabla tipo -> manejador:
+
+- despachar(objeto): busca type(objeto) en un dict. Si el tipo no está
+  registrado se usa el manejador de la clase base más cercana (según el MRO)
+  y el resultado se guarda, así la búsqueda por el MRO ocurre una vez por tipo.
+- procesar(objetos): separa la colección en lotes de un solo tipo y llama
+  una vez por lote al manejador de lote (registrado con lote=True), que
+  recorre el lote sin llamar un método por objeto. Los resultados quedan
+  agrupados por tipo, en el orden original dentro de cada tipo.
+
+Un manejador de lote se aplica solo a objetos de exactamente su tipo: puede
+aprovechar cómo es esa clase (que todos los perros dicen lo mismo), y una
+subclase que sobrescriba el método invalidaría eso. Las subclases usan el
+manejador por objeto de la clase base más cercana que tenga uno.
+
+En CPython despachar() por objeto es más lento que llamar el método (son dos
+llamadas en vez de una); sirve para tipos sin interfaz común o registrados
+desde afuera. La ganancia está en procesar(), que paga el despacho una vez
+por tipo y no una vez por objeto.
+
+DESCRIPCIONES es un Despachador con el texto de cada clase de esta semana;
+benchmark() mide el despacho virtual, las cadenas de super(), los
+isinstance contra un ABC y las dos formas de despachar.
+"""
+import math
+import operator
+import sys
+from collections import defaultdict
+from itertools import repeat
+
+from Abstracción import DispositivoElectronico, Laptop
+from Herencia import Motocicleta, Vehiculo
+from Polimorfismo import Animal, Gato, Perro
+
+
+class Despachador:
+    def __init__(self):
+        self._manejadores = {}  # tipo -> (manejador, es de lote)
+        self._cache = {}  # tipo -> manejador de un objeto (incluye subclases resueltas)
+        self._cache_lotes = {}  # tipo -> manejador de una lista de objetos
+
+    def registrar(self, tipo, manejador=None, lote=False):
+        """Registra el manejador de `tipo` y sus subclases. Con lote=True el
+        manejador recibe una lista de objetos de ese tipo y retorna una lista de
+        resultados; se aplica solo a `tipo`, no a sus subclases. También se usa
+        como decorador: @d.registrar(Perro)."""
+        if manejador is None:
+            return lambda funcion: self.registrar(tipo, funcion, lote) or funcion
+        self._manejadores[tipo] = (manejador, lote)
+        self._cache.clear()
+        self._cache_lotes.clear()
+
+    def _resolver(self, tipo):
+        # Clase más cercana en el MRO con un manejador registrado; los de lote
+        # solo cuentan para su propio tipo
+        for base in tipo.__mro__:
+            registrado = self._manejadores.get(base)
+            if registrado is not None and (base is tipo or not registrado[1]):
+                return registrado
+        raise TypeError(f"No hay manejador para {tipo.__name__}.")
+
+    def manejador(self, tipo):
+        """Manejador de un objeto para `tipo` (uno de lote se aplica a [objeto])."""
+        funcion = self._cache.get(tipo)
+        if funcion is None:
+            funcion, lote = self._resolver(tipo)
+            if lote:
+                funcion = (lambda f: lambda objeto: f([objeto])[0])(funcion)
+            self._cache[tipo] = funcion
+        return funcion
+
+    def manejador_lote(self, tipo):
+        """Manejador de una lista de objetos de `tipo`."""
+        funcion = self._cache_lotes.get(tipo)
+        if funcion is None:
+            funcion, lote = self._resolver(tipo)
+            if not lote:
+                funcion = (lambda f: lambda objetos: list(map(f, objetos)))(funcion)
+            self._cache_lotes[tipo] = funcion
+        return funcion
+
+    def despachar(self, objeto):
+        try:
+            return self._cache[type(objeto)](objeto)
+        except KeyError:
+            return self.manejador(type(objeto))(objeto)
+
+    def procesar(self, objetos):
+        """Aplica el manejador a cada objeto, un lote por tipo. Retorna {tipo: resultados}."""
+        # Una sola pasada separa por tipo: un dict y un append por objeto son más
+        # baratos que una pasada en C por cada tipo distinto
+        lotes = defaultdict(list)
+        for objeto in objetos:
+            lotes[type(objeto)].append(objeto)
+        return {tipo: self.manejador_lote(tipo)(lote) for tipo, lote in lotes.items()}
+
+
+# ------------------ Textos de las clases de la semana ------------------
+def describir(objeto):
+    """Despacho clásico: una cadena de isinstance y un método por objeto."""
+    if isinstance(objeto, Animal):
+        return objeto.sonido()
+    if isinstance(objeto, Vehiculo):
+        return objeto.texto()
+    if isinstance(objeto, DispositivoElectronico):
+        return objeto.estado()
+    raise TypeError(f"No se puede describir {type(objeto).__name__}.")
+
+
+DESCRIPCIONES = Despachador()
+# Por objeto: el mismo método que usaría describir (llamado sobre el objeto,
+# así una subclase sin manejador propio usa su propia versión del método)
+DESCRIPCIONES.registrar(Animal, lambda animal: animal.sonido())
+DESCRIPCIONES.registrar(Vehiculo, lambda vehiculo: vehiculo.texto())
+DESCRIPCIONES.registrar(DispositivoElectronico, lambda dispositivo: dispositivo.estado())
+
+
+# Por lote: el texto de un tipo entero sin buscar el método en cada objeto.
+# Solo reciben objetos de exactamente ese tipo (una subclase como Scooter va
+# por el manejador por objeto y usa su propio texto()).
+@DESCRIPCIONES.registrar(Perro, lote=True)
+def _sonidos_perros(perros):
+    # Todos los perros dicen lo mismo: un llamado por lote
+    return [perros[0].sonido()] * len(perros) if perros else []
+
+
+@DESCRIPCIONES.registrar(Gato, lote=True)
+def _sonidos_gatos(gatos):
+    return [gatos[0].sonido()] * len(gatos) if gatos else []
+
+
+@DESCRIPCIONES.registrar(Motocicleta, lote=True)
+def _textos_motocicletas(motos):
+    # map sobre la función ya resuelta evita la búsqueda del método por objeto
+    return list(map(Motocicleta.texto, motos))
+
+
+@DESCRIPCIONES.registrar(Laptop, lote=True)
+def _estados_laptops(laptops):
+    # Hay un texto por estado: se pide una vez por lote a estado() de una laptop
+    # en ese estado, así siempre coincide con el despacho por objeto
+    encendidos = list(map(bool, map(operator.attrgetter("encendido"), laptops)))
+    textos = {valor: laptops[encendidos.index(valor)].estado()
+              for valor in (False, True) if valor in encendidos}
+    return list(map(textos.__getitem__, encendidos))
+
+
+# ------------------ Benchmark ------------------
+def _reproducir(animal):
+    # Como reproducir_sonido, sin imprimir
+    return animal.sonido()
+
+
+def benchmark(n=10_000_000, distintos=1_000):
+    """Despacho sobre colecciones de n objetos. Para no ocupar gigabytes, las
+    colecciones repiten `distintos` instancias en orden al azar (el costo del
+    despacho es el mismo)."""
+    import random
+    import time
+
+    random.seed(9)
+    fabricas = [Perro, Gato, Animal,
+                lambda: Vehiculo("Toyota", f"Modelo {random.randrange(100)}"),
+                lambda: Motocicleta("Yamaha", f"MT-{random.randrange(100):02d}", random.choice((125, 689))),
+                Laptop]
+    instancias = [random.choice(fabricas)() for _ in range(distintos)]
+    for dispositivo in instancias[::7]:
+        if isinstance(dispositivo, Laptop):
+            dispositivo.encendido = True
+
+    def medir(nombre, funcion, base=None, cantidad=n, repeticiones=1):
+        t = math.inf
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion()  # el resultado se descarta: millones de textos vivos a la vez distorsionan la medición
+            t = min(t, time.perf_counter() - inicio)
+        relacion = f" ({base / t:.1f}x)" if base else ""
+        print(f"  {nombre}: {t:.2f} s, {cantidad / t / 1e6:.1f} M/s{relacion}")
+        return t
+
+    print(f"Despacho virtual ({n:,} animales mezclados):")
+    animales = random.choices([i for i in instancias if isinstance(i, Animal)], k=n)
+    base = medir("a.sonido()", lambda: [a.sonido() for a in animales])
+    medir("reproducir_sonido(a) (función que llama al método)",
+          lambda: [_reproducir(a) for a in animales], base)
+
+    m = n // 10
+    print(f"Cadenas de super() ({m:,} constructores):")
+    base = medir("Vehiculo(...)", lambda: [Vehiculo("Yamaha", "MT-07") for _ in range(m)],
+                    cantidad=m, repeticiones=3)
+    t = medir("Motocicleta(...) con super().__init__",
+                 lambda: [Motocicleta("Yamaha", "MT-07", 689) for _ in range(m)], cantidad=m, repeticiones=3)
+    print(f"  costo de super(): {(t - base) / m * 1e9:.0f} ns por objeto")
+
+    print(f"isinstance ({n:,} objetos mezclados):")
+    mezclados = random.choices(instancias, k=n)
+    base = medir("clase común (Vehiculo)", lambda: sum(map(isinstance, mezclados, repeat(Vehiculo))))
+    medir("ABC (DispositivoElectronico)",
+          lambda: sum(map(isinstance, mezclados, repeat(DispositivoElectronico))), base)
+
+    print(f"Colección mezclada de las tres jerarquías ({n:,} objetos):")
+    base = medir("describir() con isinstance", lambda: [describir(o) for o in mezclados])
+    despachar = DESCRIPCIONES.despachar
+    medir("Despachador.despachar por objeto", lambda: [despachar(o) for o in mezclados], base)
+    medir("Despachador.procesar por lotes de un tipo", lambda: DESCRIPCIONES.procesar(mezclados), base)
+
+    # Los tres caminos dan los mismos textos
+    muestra = mezclados[:100_000]
+    assert [describir(o) for o in muestra] == [despachar(o) for o in muestra]
+    for tipo, textos in DESCRIPCIONES.procesar(muestra).items():
+        assert textos == [describir(o) for o in muestra if type(o) is tipo]
+
+
+if __name__ == "__main__":
+    # python despacho.py [n]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
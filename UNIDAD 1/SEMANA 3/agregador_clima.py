@@ -0,0 +1,148 @@
+# agregador_clima.py
+"""
+Agregador en línea de lecturas de temperatura de muchas estaciones.
+
+Las lecturas llegan de a una (registrar) o por lotes (registrar_lote). Cada
+estación guarda sus últimas `ventana` lecturas en un buffer circular sobre
+array('d') y la suma de ese buffer, así el promedio de la ventana se
+actualiza en O(1) por lectura y la memoria por estación es fija. La suma se
+recalcula exacta (math.fsum) cada vez que el buffer da la vuelta, para que
+los errores de redondeo no se acumulen en flujos largos.
+
+Los lectores (instantanea, instantaneas) nunca bloquean a quien escribe:
+cada estación tiene un contador de versión que el escritor incrementa antes
+y después de actualizarla (seqlock). Si el lector ve una versión impar, o
+distinta al terminar de copiar, la estación cambió mientras leía y vuelve a
+copiarla.
+"""
+import math
+import sys
+import time
+from array import array
+
+
+class _Estacion:
+    __slots__ = ("buffer", "posicion", "lecturas", "suma", "ultima", "minimo", "maximo", "version")
+
+    def __init__(self, ventana):
+        self.buffer = array("d", bytes(8 * ventana))
+        self.posicion = 0
+        self.lecturas = 0
+        self.suma = 0.0
+        self.ultima = math.nan
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.version = 0
+
+
+class AgregadorClima:
+    def __init__(self, ventana=168):
+        if ventana < 1:
+            raise ValueError("La ventana debe tener al menos una lectura.")
+        self.ventana = ventana
+        self._estaciones = {}
+
+    def registrar(self, estacion, temperatura):
+        e = self._estaciones.get(estacion)
+        if e is None:
+            e = self._estaciones[estacion] = _Estacion(self.ventana)
+        e.version += 1  # impar: actualización en curso
+        posicion = e.posicion
+        buffer = e.buffer
+        e.suma += temperatura - buffer[posicion]
+        buffer[posicion] = temperatura
+        posicion += 1
+        if posicion == self.ventana:
+            posicion = 0
+            e.suma = math.fsum(buffer)
+        e.posicion = posicion
+        e.lecturas += 1
+        e.ultima = temperatura
+        if temperatura < e.minimo:
+            e.minimo = temperatura
+        if temperatura > e.maximo:
+            e.maximo = temperatura
+        e.version += 1
+
+    def registrar_lote(self, estaciones, temperaturas):
+        """Lecturas en dos secuencias paralelas (p. ej. una lista de nombres y un array('d'))."""
+        registrar = self.registrar
+        for estacion, temperatura in zip(estaciones, temperaturas):
+            registrar(estacion, temperatura)
+
+    def instantanea(self, estacion):
+        """Estadísticas actuales de una estación (None si nunca registró lecturas)."""
+        e = self._estaciones.get(estacion)
+        if e is None:
+            return None
+        while True:
+            version = e.version
+            if not version & 1:
+                lecturas, suma, ultima, minimo, maximo = e.lecturas, e.suma, e.ultima, e.minimo, e.maximo
+                if e.version == version:
+                    break
+            time.sleep(0)  # ceder el turno al escritor
+        return {
+            "estacion": estacion,
+            "lecturas": lecturas,
+            "promedio_ventana": suma / min(lecturas, self.ventana),
+            "ultima": ultima,
+            "minimo": minimo,
+            "maximo": maximo,
+        }
+
+    def instantaneas(self):
+        """Estadísticas de todas las estaciones (cada una consistente por sí misma)."""
+        # list() copia las claves de una vez aunque otro hilo agregue estaciones
+        return [self.instantanea(estacion) for estacion in list(self._estaciones)]
+
+    def __len__(self):
+        return len(self._estaciones)
+
+
+# ------------------ Benchmark ------------------
+def benchmark(lecturas=5_000_000, estaciones=1_000, ventana=168):
+    """Ingesta de un solo hilo con y sin un lector tomando instantáneas en paralelo."""
+    import random
+    import threading
+
+    random.seed(8)
+    nombres = [f"EST-{i:04d}" for i in range(estaciones)]
+    origen = [nombres[random.randrange(estaciones)] for _ in range(lecturas)]
+    temperaturas = array("d", (random.gauss(15, 8) for _ in range(lecturas)))
+
+    agregador = AgregadorClima(ventana)
+    inicio = time.perf_counter()
+    agregador.registrar_lote(origen, temperaturas)
+    t = time.perf_counter() - inicio
+    print(f"{lecturas:,} lecturas de {estaciones:,} estaciones: {t:.2f} s ({lecturas / t:,.0f}/s)")
+
+    agregador = AgregadorClima(ventana)
+    terminado = threading.Event()
+    tomadas = [0]
+
+    def leer():
+        while not terminado.is_set():
+            agregador.instantaneas()
+            tomadas[0] += 1
+
+    lector = threading.Thread(target=leer)
+    inicio = time.perf_counter()
+    lector.start()
+    agregador.registrar_lote(origen, temperaturas)
+    terminado.set()
+    lector.join()
+    t = time.perf_counter() - inicio
+    print(f"Con un lector en paralelo: {t:.2f} s ({lecturas / t:,.0f}/s), "
+          f"{tomadas[0]:,} instantáneas de todas las estaciones")
+
+    # El promedio de la ventana coincide con recalcularlo desde cero
+    muestra = agregador.instantanea(nombres[0])
+    ultimas = [t for n, t in zip(origen, temperaturas) if n == nombres[0]][-ventana:]
+    assert abs(muestra["promedio_ventana"] - math.fsum(ultimas) / len(ultimas)) < 1e-9
+    print(muestra)
+
+
+if __name__ == "__main__":
+    # python agregador_clima.py [lecturas]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,287 @@
+# estadisticas_clima.py
+"""
+Estadísticas de temperatura para series largas (años de lecturas de sensores).
+
+Las lecturas se procesan por bloques de floats de 64 bits (array('d') o
+arrays de NumPy), nunca como una lista de floats de Python, así que la
+memoria no depende de cuántas lecturas haya:
+
+- bloques(fuente): divide en bloques un archivo de texto (una lectura por
+  línea), un archivo binario de float64 (.bin / .f64), un array o cualquier
+  iterable de números.
+- EstadisticasClima: cantidad, promedio, varianza, mínimo, máximo y
+  percentiles. Cada bloque se resume de forma vectorizada y se combina con el
+  acumulado (fórmula de Chan); agregar() suma una lectura suelta en O(1)
+  (Welford). Los percentiles salen de un histograma de resolución fija
+  (0.01 °C por defecto) en vez de guardar y ordenar todas las lecturas.
+- promedios_moviles(fuente, ventana): promedio de cada ventana de `ventana`
+  lecturas seguidas (7 = semana de lecturas diarias), también por bloques.
+
+Si NumPy está instalado los bloques se procesan con NumPy; si no, con
+funciones de la biblioteca estándar que iteran en C.
+"""
+import math
+import operator
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate, islice
+
+# NumPy es opcional: solo acelera el procesamiento de bloques
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except Exception:
+    NUMPY_DISPONIBLE = False
+
+TAMANO_BLOQUE = 1 << 20  # lecturas por bloque (8 MB en float64)
+EXTENSIONES_BINARIAS = (".bin", ".f64")
+
+
+# ------------------ Lectura por bloques ------------------
+def bloques(fuente, tamano=TAMANO_BLOQUE):
+    """Bloques de float64 de hasta `tamano` lecturas a partir de una ruta, un array
+    o un iterable. Los arrays se recorren con vistas, sin copiarlos."""
+    if isinstance(fuente, str):
+        if fuente.lower().endswith(EXTENSIONES_BINARIAS):
+            yield from _bloques_binarios(fuente, tamano)
+        else:
+            yield from _bloques_texto(fuente, tamano)
+    elif NUMPY_DISPONIBLE and isinstance(fuente, np.ndarray):
+        datos = fuente.astype(np.float64, copy=False).ravel()
+        for i in range(0, len(datos), tamano):
+            yield datos[i:i + tamano]
+    elif isinstance(fuente, array) and fuente.typecode == "d":
+        vista = memoryview(fuente)
+        for i in range(0, len(fuente), tamano):
+            yield vista[i:i + tamano]
+    else:
+        iterador = iter(fuente)
+        while True:
+            bloque = array("d", islice(iterador, tamano))
+            if not bloque:
+                return
+            yield bloque
+
+
+def _bloques_binarios(ruta, tamano):
+    with open(ruta, "rb") as f:
+        while True:
+            if NUMPY_DISPONIBLE:
+                bloque = np.fromfile(f, dtype=np.float64, count=tamano)
+            else:
+                bloque = array("d")
+                try:
+                    bloque.fromfile(f, tamano)
+                except EOFError:
+                    pass  # último bloque incompleto: fromfile ya cargó lo que había
+            if not len(bloque):
+                return
+            yield bloque
+
+
+def _bloques_texto(ruta, tamano):
+    # Se leen ~tamano*8 bytes y se corta en el último salto de línea; el resto
+    # pasa al bloque siguiente
+    with open(ruta, "rb") as f:
+        resto = b""
+        while True:
+            datos = f.read(tamano * 8)
+            if not datos:
+                break
+            datos = resto + datos
+            corte = datos.rfind(b"\n") + 1
+            resto = datos[corte:]
+            if corte:
+                yield _convertir(datos[:corte])
+        if resto.strip():
+            yield _convertir(resto)
+
+
+def _convertir(texto):
+    campos = texto.split()
+    if NUMPY_DISPONIBLE:
+        return np.array(campos, dtype=np.float64)
+    return array("d", map(float, campos))
+
+
+# ------------------ Estadísticas ------------------
+class EstadisticasClima:
+    """Acumulador de estadísticas con memoria constante.
+
+    Estructuras internas:
+        - n, _media, _m2: cantidad, promedio y suma de cuadrados de las
+          desviaciones (Welford); la varianza es _m2 / n.
+        - _cuentas: array('q') con las lecturas por casilla de `resolucion`
+          grados entre `limite_inferior` y `limite_superior` (las lecturas
+          fuera de ese rango cuentan en la primera o la última casilla).
+    """
+
+    def __init__(self, limite_inferior=-90.0, limite_superior=60.0, resolucion=0.01):
+        self.limite_inferior = limite_inferior
+        self.resolucion = resolucion
+        self._casillas = int(math.ceil((limite_superior - limite_inferior) / resolucion)) + 1
+        self._cuentas = array("q", bytes(8 * self._casillas))
+        self.n = 0
+        self._media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, temperatura):
+        """Una lectura suelta (O(1))."""
+        self.n += 1
+        delta = temperatura - self._media
+        self._media += delta / self.n
+        self._m2 += delta * (temperatura - self._media)
+        if temperatura < self.minimo:
+            self.minimo = temperatura
+        if temperatura > self.maximo:
+            self.maximo = temperatura
+        self._cuentas[self._casilla(temperatura)] += 1
+
+    def agregar_bloque(self, bloque):
+        """Un bloque de lecturas: se resume completo y se combina con lo acumulado."""
+        n = len(bloque)
+        if not n:
+            return
+        if NUMPY_DISPONIBLE:
+            datos = np.asarray(bloque, dtype=np.float64)
+            media = float(datos.mean())
+            m2 = float(((datos - media) ** 2).sum())
+            minimo, maximo = float(datos.min()), float(datos.max())
+            indices = np.clip(((datos - self.limite_inferior) / self.resolucion).astype(np.int64),
+                              0, self._casillas - 1)
+            np.frombuffer(self._cuentas, dtype=np.int64)[:] += np.bincount(indices, minlength=self._casillas)
+        else:
+            # Desplazar por la primera lectura evita perder precisión al restar
+            # cuadrados grandes parecidos
+            k = bloque[0]
+            desvios = array("d", map(k.__rsub__, bloque))
+            suma = math.fsum(desvios)
+            media = k + suma / n
+            m2 = max(math.fsum(map(operator.mul, desvios, desvios)) - suma * suma / n, 0.0)
+            minimo, maximo = min(bloque), max(bloque)
+            escala = 1 / self.resolucion
+            casillas = Counter(map(int, map(escala.__mul__, map((-self.limite_inferior).__add__, bloque))))
+            for casilla, cantidad in casillas.items():
+                self._cuentas[min(max(casilla, 0), self._casillas - 1)] += cantidad
+        self._combinar(n, media, m2)
+        self.minimo = min(self.minimo, minimo)
+        self.maximo = max(self.maximo, maximo)
+
+    def procesar(self, fuente, tamano=TAMANO_BLOQUE):
+        """Agrega todas las lecturas de una fuente (ver bloques()). Retorna self."""
+        for bloque in bloques(fuente, tamano):
+            self.agregar_bloque(bloque)
+        return self
+
+    def _combinar(self, n, media, m2):
+        total = self.n + n
+        delta = media - self._media
+        self._media += delta * n / total
+        self._m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+
+    def _casilla(self, temperatura):
+        i = int((temperatura - self.limite_inferior) / self.resolucion)
+        return min(max(i, 0), self._casillas - 1)
+
+    @property
+    def promedio(self):
+        return self._media if self.n else 0
+
+    @property
+    def varianza(self):
+        """Varianza poblacional."""
+        return self._m2 / self.n if self.n else 0.0
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+    def percentil(self, p):
+        """Percentil p (0-100), con error de a lo sumo media casilla de resolución."""
+        if not self.n:
+            raise ValueError("No hay lecturas.")
+        objetivo = p / 100 * (self.n - 1)
+        for casilla, acumulado in enumerate(accumulate(self._cuentas)):
+            if acumulado > objetivo:
+                centro = self.limite_inferior + (casilla + 0.5) * self.resolucion
+                return min(max(centro, self.minimo), self.maximo)
+        return self.maximo
+
+    def resumen(self, percentiles=(5, 50, 95)):
+        datos = {"lecturas": self.n, "promedio": self.promedio, "minimo": self.minimo,
+                 "maximo": self.maximo, "varianza": self.varianza}
+        datos.update({f"p{p}": self.percentil(p) for p in percentiles} if self.n else {})
+        return datos
+
+
+def promedios_moviles(fuente, ventana=7, tamano=TAMANO_BLOQUE):
+    """Promedio de cada `ventana` lecturas seguidas, bloque por bloque. Entre bloques
+    se conservan las últimas ventana - 1 lecturas, así el resultado es el mismo
+    que si toda la serie estuviera en memoria."""
+    cola = array("d")
+    for bloque in bloques(fuente, tamano):
+        if NUMPY_DISPONIBLE:
+            datos = np.concatenate((np.asarray(cola, dtype=np.float64), np.asarray(bloque, dtype=np.float64)))
+            if len(datos) >= ventana:
+                sumas = np.cumsum(datos)
+                sumas[ventana:] = sumas[ventana:] - sumas[:-ventana]
+                yield sumas[ventana - 1:] / ventana
+            cola = array("d", datos[len(datos) - ventana + 1:].tolist() if ventana > 1 else [])
+        else:
+            datos = cola + array("d", bloque)
+            if len(datos) >= ventana:
+                # Suma acumulada con un cero delante: suma de [i, i+ventana) = s[i+ventana] - s[i]
+                sumas = array("d", accumulate(datos, initial=0.0))
+                yield array("d", map((1 / ventana).__mul__,
+                                     map(operator.sub, sumas[ventana:], sumas[:len(sumas) - ventana])))
+            cola = datos[len(datos) - ventana + 1:] if ventana > 1 else array("d")
+
+
+# ------------------ Benchmark ------------------
+def benchmark(n=100_000_000, tamano=TAMANO_BLOQUE):
+    """Escribe n lecturas sintéticas en un archivo binario temporal y lo procesa:
+    lecturas/s y memoria máxima del proceso (que no debe crecer con n)."""
+    import os
+    import random
+    import tempfile
+    import time
+
+    random.seed(3)
+    ruta = os.path.join(tempfile.mkdtemp(), "lecturas.f64")
+    inicio = time.perf_counter()
+    with open(ruta, "wb") as f:
+        for escritas in range(0, n, tamano):
+            # Ciclo anual más ruido
+            cantidad = min(tamano, n - escritas)
+            base = 15 + 10 * math.sin(2 * math.pi * (escritas // 24) / 365)
+            array("d", (base + random.gauss(0, 4) for _ in range(cantidad))).tofile(f)
+    print(f"Generar {n:,} lecturas: {time.perf_counter() - inicio:.1f} s (NumPy: {NUMPY_DISPONIBLE})")
+
+    inicio = time.perf_counter()
+    estadisticas = EstadisticasClima().procesar(ruta, tamano)
+    t = time.perf_counter() - inicio
+    print(f"Estadísticas: {t:.1f} s ({n / t:,.0f} lecturas/s)")
+    print({k: round(v, 3) for k, v in estadisticas.resumen().items()})
+
+    inicio = time.perf_counter()
+    ventanas = sum(len(b) for b in promedios_moviles(ruta, ventana=7 * 24, tamano=tamano))
+    t = time.perf_counter() - inicio
+    print(f"Promedios móviles semanales (ventana 168): {ventanas:,} en {t:.1f} s ({n / t:,.0f} lecturas/s)")
+    os.remove(ruta)
+    try:
+        import resource  # solo Unix; ru_maxrss está en KB en Linux
+        print(f"Memoria máxima del proceso: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    except ImportError:
+        pass
+
+
+if __name__ == "__main__":
+    # python estadisticas_clima.py [n] | python estadisticas_clima.py <archivo>
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        print(EstadisticasClima().procesar(sys.argv[1]).resumen())
+    else:
+        benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000)
@@ -1,3 +1,11 @@
+import multiprocessing
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+
 # Clase base Persona
 class Persona:
     def __init__(self, nombre, cedula):
@@ -22,16 +30,108 @@ class Habitacion:
         self.numero = numero
         self.tipo = tipo
         self.precio = precio
-        self.disponible = True
+        # Calendario: reservas [entrada, salida) en días ordinales, ordenadas y sin
+        # solaparse. Saber si unas fechas chocan es una búsqueda binaria (O(log n)).
+        self._entradas = array("l")
+        self._salidas = array("l")
+        # Código de cada reserva en el calendario compartido (0 si no hay calendario)
+        self._codigos = array("l")
+        # Revisar y anotar deben ocurrir juntos: sin el candado dos hilos podrían
+        # ver la misma noche libre y reservarla ambos
+        self._candado = threading.Lock()
+        # (CalendarioCompartido, índice) si el hotel comparte el calendario entre procesos
+        self._compartido = None
+
+    def conectar(self, calendario, indice):
+        """Usa la fila `indice` de un CalendarioCompartido: las reservas se confirman
+        ahí, así las ven los demás procesos. Las de este proceso se siguen anotando aquí."""
+        if not 0 <= indice < calendario.habitaciones:
+            raise ValueError("El calendario no tiene lugar para esta habitación.")
+        self._compartido = (calendario, indice)
+
+    @property
+    def disponible(self):
+        """Libre esta noche."""
+        hoy = date.today()
+        return self.libre(hoy, hoy + timedelta(days=1))
+
+    def libre(self, entrada, salida):
+        """True si ninguna reserva ocupa noches entre entrada (incluida) y salida (excluida)."""
+        return self._libre(entrada.toordinal(), salida.toordinal())
+
+    def _libre(self, entrada, salida):
+        if self._compartido is not None:
+            calendario, indice = self._compartido
+            return calendario.libre(indice, calendario.dia(entrada), calendario.dia(salida))
+        with self._candado:
+            return self._posicion_libre(entrada, salida) is not None
+
+    def _posicion_libre(self, entrada, salida):
+        # Posición donde iría la reserva, o None si choca con la anterior o la siguiente
+        i = bisect_right(self._entradas, entrada)
+        if i and self._salidas[i - 1] > entrada:
+            return None
+        if i < len(self._entradas) and self._entradas[i] < salida:
+            return None
+        return i
 
-    def reservar(self):
-        if self.disponible:
-            self.disponible = False
-            return True
-        return False
+    def reservar(self, entrada=None, salida=None):
+        """Reserva de entrada a salida (por defecto, esta noche). False si ya está ocupada."""
+        entrada = entrada or date.today()
+        salida = salida or entrada + timedelta(days=1)
+        if salida <= entrada:
+            raise ValueError("La salida debe ser posterior a la entrada.")
+        e, s = entrada.toordinal(), salida.toordinal()
+        with self._candado:
+            codigo = 0
+            if self._compartido is not None:
+                # El calendario compartido decide: otro proceso pudo tomar esas noches
+                calendario, indice = self._compartido
+                codigo = calendario.nuevo_codigo()
+                if not calendario.reservar(indice, calendario.dia(e), calendario.dia(s), codigo):
+                    return False
+                i = bisect_right(self._entradas, e)
+            else:
+                i = self._posicion_libre(e, s)
+                if i is None:
+                    return False
+            self._entradas.insert(i, e)
+            self._salidas.insert(i, s)
+            self._codigos.insert(i, codigo)
+        return True
+
+    def cancelar(self, entrada):
+        """Cancela la reserva que comienza en `entrada`. False si no existe."""
+        e = entrada.toordinal()
+        with self._candado:
+            i = bisect_left(self._entradas, e)
+            if i == len(self._entradas) or self._entradas[i] != e:
+                return False
+            self._quitar(i)
+        return True
 
     def liberar(self):
-        self.disponible = True
+        """Termina la reserva que ocupa esta noche (salida anticipada)."""
+        hoy = date.today().toordinal()
+        with self._candado:
+            i = bisect_right(self._entradas, hoy) - 1
+            if i >= 0 and self._salidas[i] > hoy:
+                self._quitar(i)
+
+    def _quitar(self, i):
+        # Con el candado tomado: borra la reserva i y, si hay calendario, sus noches
+        if self._compartido is not None:
+            calendario, indice = self._compartido
+            calendario.cancelar(indice, calendario.dia(self._entradas[i]),
+                                calendario.dia(self._salidas[i]), self._codigos[i])
+        del self._entradas[i]
+        del self._salidas[i]
+        del self._codigos[i]
+
+    def reservas(self):
+        """Pares (entrada, salida) en orden."""
+        with self._candado:
+            return [(date.fromordinal(e), date.fromordinal(s)) for e, s in zip(self._entradas, self._salidas)]
 
     def mostrar_info(self):
         estado = "Disponible" if self.disponible else "Ocupada"
@@ -39,15 +139,114 @@ class Habitacion:
 
 # Clase Reserva que relaciona huéspedes con habitaciones (Interacción entre objetos)
 class Reserva:
-    def __init__(self, huesped, habitacion):
+    def __init__(self, huesped, habitacion, entrada=None, salida=None):
         self.huesped = huesped
         self.habitacion = habitacion
+        self.entrada = entrada or date.today()
+        self.salida = salida or self.entrada + timedelta(days=1)
+        self.confirmada = False
 
     def confirmar(self):
-        if self.habitacion.reservar():
+        self.confirmada = self.habitacion.reservar(self.entrada, self.salida)
+        if self.confirmada:
             print(f"Reserva confirmada para {self.huesped.nombre} en habitación {self.habitacion.numero}.")
         else:
             print("La habitación ya está ocupada.")
+        return self.confirmada
+
+    def cancelar(self):
+        if self.confirmada and self.habitacion.cancelar(self.entrada):
+            self.confirmada = False
+            print(f"Reserva de {self.huesped.nombre} en habitación {self.habitacion.numero} cancelada.")
+
+# Clase Hotel: agrupa las habitaciones por tipo para buscar disponibilidad
+class Hotel:
+    def __init__(self, nombre, calendario=None):
+        self.nombre = nombre
+        self.habitaciones = {}
+        self._por_tipo = {}
+        # Con un CalendarioCompartido las reservas de varios procesos se ven entre sí;
+        # cada habitación usa la fila del calendario según su orden de alta
+        self.calendario = calendario
+
+    def agregar_habitacion(self, habitacion):
+        if self.calendario is not None:
+            habitacion.conectar(self.calendario, len(self.habitaciones))
+        self.habitaciones[habitacion.numero] = habitacion
+        self._por_tipo.setdefault(habitacion.tipo, []).append(habitacion)
+
+    def disponibles(self, tipo, entrada, salida):
+        """Habitaciones del tipo dado libres todas las noches de entrada a salida."""
+        e, s = entrada.toordinal(), salida.toordinal()
+        return [h for h in self._por_tipo.get(tipo, []) if h._libre(e, s)]
+
+    def reservar(self, huesped, tipo, entrada, salida):
+        """Confirma la primera habitación libre del tipo; None si no queda ninguna.
+        Si otro hilo la toma entre la consulta y la confirmación, se prueba la siguiente."""
+        for habitacion in self.disponibles(tipo, entrada, salida):
+            reserva = Reserva(huesped, habitacion, entrada, salida)
+            if reserva.confirmar():
+                return reserva
+        return None
+
+# Calendario compartido entre procesos (cada proceso tiene su propia memoria,
+# así que las Habitacion de uno no ven las reservas de otro)
+class CalendarioCompartido:
+    """Noches de `habitaciones` habitaciones durante `dias` días desde `inicio` en
+    memoria compartida. Cada celda vale 0 (libre) o el código de la reserva que la
+    ocupa. Las habitaciones se reparten entre `franjas` candados de proceso: revisar
+    y anotar las noches se hace con el candado de la habitación tomado (compare-and-set).
+
+    Se usa directamente (días y número de fila) o a través de un Hotel creado con
+    él, que lo conecta a sus habitaciones: entonces Reserva.confirmar pasa por aquí."""
+
+    def __init__(self, habitaciones, dias, franjas=64, inicio=None):
+        self.habitaciones = habitaciones
+        self.dias = dias
+        self.inicio = (inicio or date.today()).toordinal()
+        self._noches = multiprocessing.Array("i", habitaciones * dias, lock=False)
+        self._candados = [multiprocessing.Lock() for _ in range(franjas)]
+        self._ultimo_codigo = multiprocessing.Value("i", 0)
+
+    def dia(self, ordinal):
+        """Día del calendario para una fecha en días ordinales."""
+        return ordinal - self.inicio
+
+    def nuevo_codigo(self):
+        """Código de reserva único entre todos los procesos."""
+        with self._ultimo_codigo.get_lock():
+            self._ultimo_codigo.value += 1
+            return self._ultimo_codigo.value
+
+    def libre(self, habitacion, entrada, salida):
+        if not 0 <= entrada < salida <= self.dias:
+            return False  # fuera del calendario no se puede reservar
+        desde, hasta = habitacion * self.dias + entrada, habitacion * self.dias + salida
+        with self._candados[habitacion % len(self._candados)]:
+            return not any(self._noches[desde:hasta])
+
+    def reservar(self, habitacion, entrada, salida, codigo):
+        """Días desde el inicio del calendario, salida excluida. False si alguna noche está tomada."""
+        if not 0 <= entrada < salida <= self.dias:
+            raise ValueError("Fechas fuera del calendario.")
+        desde, hasta = habitacion * self.dias + entrada, habitacion * self.dias + salida
+        with self._candados[habitacion % len(self._candados)]:
+            if any(self._noches[desde:hasta]):
+                return False
+            self._noches[desde:hasta] = [codigo] * (salida - entrada)
+        return True
+
+    def cancelar(self, habitacion, entrada, salida, codigo):
+        """Libera las noches solo si siguen siendo de la reserva `codigo`."""
+        desde, hasta = habitacion * self.dias + entrada, habitacion * self.dias + salida
+        with self._candados[habitacion % len(self._candados)]:
+            if self._noches[desde:hasta] != [codigo] * (salida - entrada):
+                return False
+            self._noches[desde:hasta] = [0] * (salida - entrada)
+        return True
+
+    def ocupante(self, habitacion, dia):
+        return self._noches[habitacion * self.dias + dia]
 
 # Uso del sistema (Simulación)
 def main():
@@ -75,5 +274,169 @@ def main():
     reserva2 = Reserva(huesped1, hab1)
     reserva2.confirmar()
 
-if __name__ == "__main__":
+    # Reservas por fechas: la misma habitación en noches distintas
+    hotel = Hotel("Hotel POO")
+    for hab in (hab1, hab2, Habitacion(103, "Doble", 55.0)):
+        hotel.agregar_habitacion(hab)
+    dia3 = date.today().replace(day=1) + timedelta(days=2)
+    Reserva(huesped1, hab2, dia3, dia3 + timedelta(days=2)).confirmar()
+    Reserva(huesped1, hab2, dia3 + timedelta(days=5), dia3 + timedelta(days=7)).confirmar()
+    libres = hotel.disponibles("Doble", dia3, dia3 + timedelta(days=4))
+    print(f"Dobles libres del {dia3} al {dia3 + timedelta(days=4)}: {[h.numero for h in libres]}")
+
+
+# ------------------ Benchmark ------------------
+def benchmark_reservas(habitaciones=10_000, reservas=5_000_000, consultas=1_000):
+    """Intenta `reservas` reservas al azar en un hotel de `habitaciones` y mide
+    reservas/s, consultas de disponibilidad por tipo y cancelaciones."""
+    import random
+    import time
+
+    random.seed(4)
+    tipos = ("Individual", "Doble", "Suite")
+    hotel = Hotel("Benchmark")
+    for numero in range(habitaciones):
+        hotel.agregar_habitacion(Habitacion(numero, tipos[numero % len(tipos)], 50.0))
+    lista = list(hotel.habitaciones.values())
+    hoy = date.today()
+    # Fechas precalculadas para medir el calendario y no la creación de objetos date
+    dias = [hoy + timedelta(days=d) for d in range(3650 + 8)]
+
+    confirmadas = []
+    inicio = time.perf_counter()
+    for _ in range(reservas):
+        habitacion = lista[random.randrange(habitaciones)]
+        d = random.randrange(3650)
+        entrada, salida = dias[d], dias[d + random.randint(1, 7)]
+        if habitacion.reservar(entrada, salida):
+            confirmadas.append((habitacion, entrada))
+    t = time.perf_counter() - inicio
+    print(f"{reservas:,} intentos de reserva en {habitaciones:,} habitaciones: {t:.1f} s "
+          f"({reservas / t:,.0f}/s), {len(confirmadas):,} confirmadas sin solaparse")
+
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        d = random.randrange(3650)
+        hotel.disponibles(random.choice(tipos), dias[d], dias[d + 4])
+    t = (time.perf_counter() - inicio) / consultas
+    print(f"Disponibilidad por tipo y rango ({habitaciones // len(tipos):,} habitaciones por tipo): {t * 1000:.2f} ms")
+
+    muestra = random.sample(confirmadas, min(100_000, len(confirmadas)))
+    inicio = time.perf_counter()
+    for habitacion, entrada in muestra:
+        habitacion.cancelar(entrada)
+    t = time.perf_counter() - inicio
+    print(f"{len(muestra):,} cancelaciones: {len(muestra) / t:,.0f}/s")
+
+
+# ------------------ Prueba de estrés ------------------
+_calendario = None
+
+
+def _iniciar_proceso(calendario):
+    global _calendario
+    _calendario = calendario
+
+
+def _intentos_proceso(numero, intentos, habitaciones, dias):
+    """Intentos de un proceso con su propio Hotel conectado al calendario compartido;
+    retorna las reservas que confirmó."""
+    import contextlib
+    import io
+    import random
+
+    azar = random.Random(numero)
+    hotel = Hotel(f"Proceso {numero}", _calendario)
+    for h in range(habitaciones):
+        hotel.agregar_habitacion(Habitacion(h, "Doble", 50.0))
+    huesped = Huesped("Prueba", "0000000000", "0000000000")
+    inicio = date.fromordinal(_calendario.inicio)
+    confirmadas = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(intentos):
+            h, e = azar.randrange(habitaciones), azar.randrange(dias - 7)
+            s = e + azar.randint(1, 7)
+            reserva = Reserva(huesped, hotel.habitaciones[h], inicio + timedelta(days=e), inicio + timedelta(days=s))
+            if reserva.confirmar():
+                confirmadas.append((h, e, s))
+    return confirmadas
+
+
+def _noches_vendidas(confirmadas):
+    """Cuenta cuántas reservas confirmadas incluyen cada (habitación, noche)."""
+    from collections import Counter
+
+    return Counter((h, noche) for h, e, s, *_ in confirmadas for noche in range(e, s))
+
+
+def prueba_estres_reservas(intentos=100_000, hilos=8, procesos=4, habitaciones=50, dias=120):
+    """Muchos hilos y luego muchos procesos confirman reservas al azar sobre pocas
+    habitaciones a la vez; ninguna noche puede quedar vendida dos veces."""
+    import contextlib
+    import io
+    import os
+    import random
+
+    # Hilos: Reserva.confirmar sobre las mismas Habitacion
+    hotel = Hotel("Estrés")
+    for numero in range(habitaciones):
+        hotel.agregar_habitacion(Habitacion(numero, "Doble", 50.0))
+    d0 = date(2030, 1, 1)
+    huesped = Huesped("Prueba", "0000000000", "0000000000")
+    resultados = [[] for _ in range(hilos)]
+
+    def trabajar(numero):
+        azar = random.Random(numero)
+        for _ in range(intentos // hilos):
+            h, e = azar.randrange(habitaciones), azar.randrange(dias - 7)
+            s = e + azar.randint(1, 7)
+            reserva = Reserva(huesped, hotel.habitaciones[h], d0 + timedelta(days=e), d0 + timedelta(days=s))
+            if reserva.confirmar():
+                resultados[numero].append((h, e, s))
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # cambiar de hilo muy seguido para provocar carreras
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            trabajadores = [threading.Thread(target=trabajar, args=(n,)) for n in range(hilos)]
+            for t in trabajadores:
+                t.start()
+            for t in trabajadores:
+                t.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+    confirmadas = [r for lista in resultados for r in lista]
+    vendidas = _noches_vendidas(confirmadas)
+    assert max(vendidas.values()) == 1, "Una noche se vendió más de una vez"
+    en_calendario = {(h.numero, e.toordinal() - d0.toordinal(), s.toordinal() - d0.toordinal())
+                     for h in hotel.habitaciones.values() for e, s in h.reservas()}
+    assert en_calendario == set(confirmadas)
+    print(f"✔ Hilos: {intentos:,} intentos con {hilos} hilos, {len(confirmadas):,} confirmadas, "
+          f"{len(vendidas):,} noches vendidas una sola vez.")
+
+    # Procesos: cada uno con su Hotel, conectado al mismo CalendarioCompartido
+    calendario = CalendarioCompartido(habitaciones, dias, inicio=d0)
+    with multiprocessing.Pool(procesos, _iniciar_proceso, (calendario,)) as pool:
+        listas = pool.starmap(_intentos_proceso, [(n, intentos // procesos, habitaciones, dias)
+                                                  for n in range(procesos)])
+    confirmadas = [r for lista in listas for r in lista]
+    vendidas = _noches_vendidas(confirmadas)
+    assert max(vendidas.values()) == 1, "Una noche se vendió más de una vez"
+    # Cada reserva confirmada ocupa sus noches con un solo código, distinto del de las demás
+    codigos = [{calendario.ocupante(h, noche) for noche in range(e, s)} for h, e, s in confirmadas]
+    assert all(len(c) == 1 and 0 not in c for c in codigos)
+    assert len(set.union(set(), *codigos)) == len(confirmadas)
+    ocupadas = sum(1 for i in range(habitaciones * dias) if calendario._noches[i])
+    assert ocupadas == len(vendidas)
+    print(f"✔ Procesos: {intentos:,} intentos con {procesos} procesos (CPU: {os.cpu_count()}), "
+          f"{len(confirmadas):,} confirmadas, {len(vendidas):,} noches vendidas una sola vez.")
+
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--estres":
+    # python EjemplosMundoReal_POO.py --estres [intentos]
+    prueba_estres_reservas(int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+elif __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+    # python EjemplosMundoReal_POO.py --benchmark [reservas]
+    benchmark_reservas(reservas=int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000)
+elif __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,22 +4,25 @@
 # utilizando la fórmula A = π * r^2 y muestra el resultado. Se usan diferentes tipos de datos
 # y buenas prácticas de codificación en Python.
 
-import math  # Importa la biblioteca matemática para usar pi
+# La función que calcula el área (A = π * r^2) está en geometria.py, que también
+# tiene areas_circulos para calcular muchas áreas a la vez
+from geometria import calcular_area_circulo
 
-# Función que calcula el área de un círculo dado su radio
-def calcular_area_circulo(radio: float) -> float:
-    """Calcula el área del círculo usando la fórmula A = π * r^2"""
-    return math.pi * (radio ** 2)
+# Programa principal: solo se ejecuta al correr este archivo, no al importarlo
+def main():
+    # Solicita al usuario que ingrese el radio del círculo
+    radio_usuario = input("Ingrese el radio del círculo: ")
+    radio_convertido = float(radio_usuario)  # Convierte la entrada a tipo float
 
-# Solicita al usuario que ingrese el radio del círculo
-radio_usuario = input("Ingrese el radio del círculo: ")
-radio_convertido = float(radio_usuario)  # Convierte la entrada a tipo float
+    # Validación booleana: el radio debe ser mayor que cero
+    es_valido = radio_convertido > 0
 
-# Validación booleana: el radio debe ser mayor que cero
-es_valido = radio_convertido > 0
+    if es_valido:
+        area = calcular_area_circulo(radio_convertido)  # Llama a la función para obtener el área
+        print("El área del círculo es:", area)  # Muestra el resultado al usuario
+    else:
+        print("El valor ingresado no es válido. El radio debe ser mayor que cero.")
 
-if es_valido:
-    area = calcular_area_circulo(radio_convertido)  # Llama a la función para obtener el área
-    print("El área del círculo es:", area)  # Muestra el resultado al usuario
-else:
-    print("El valor ingresado no es válido. El radio debe ser mayor que cero.")
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
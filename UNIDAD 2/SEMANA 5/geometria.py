@@ -0,0 +1,139 @@
+# geometria.py
+"""
+Áreas de figuras para uno o muchos valores a la vez.
+
+Cada función acepta un número, una secuencia, un array('d') (o cualquier
+buffer de números) o un array de NumPy, y retorna el mismo tipo de
+resultado: float para un número, array de NumPy para NumPy y array('d')
+para lo demás.
+
+Con muchos valores no hay una llamada de función por elemento: la
+validación (todos finitos y mayores que cero) son dos pasadas en C, min y
+sum (la suma es NaN o infinita si algún valor lo es), y el cálculo es una
+sola comprensión con operadores aritméticos, o NumPy si la entrada es un
+array de NumPy. Solo si la validación falla se busca la posición del primer
+valor inválido, y se lanza ValueError con ella.
+"""
+import math
+import operator
+import sys
+from array import array
+from numbers import Real
+
+# NumPy es opcional: solo se usa si el usuario ya trabaja con arrays de NumPy
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except Exception:
+    NUMPY_DISPONIBLE = False
+
+
+def calcular_area_circulo(radio: float) -> float:
+    """Calcula el área del círculo usando la fórmula A = π * r^2 (un solo radio)."""
+    return math.pi * (radio ** 2)
+
+
+def areas_circulos(radios, validar=True):
+    """Áreas π * r^2 de uno o muchos radios."""
+    radios = _como_columna(radios, "radio", validar)
+    if isinstance(radios, float):
+        return math.pi * radios * radios
+    if _es_numpy(radios):
+        return math.pi * radios * radios
+    pi = math.pi
+    return array("d", [pi * r * r for r in radios])
+
+
+def areas_rectangulos(bases, alturas, validar=True):
+    """Áreas base * altura, elemento a elemento."""
+    bases = _como_columna(bases, "base", validar)
+    alturas = _como_columna(alturas, "altura", validar)
+    if isinstance(bases, float) and isinstance(alturas, float):
+        return bases * alturas
+    if _es_numpy(bases) or _es_numpy(alturas):
+        return np.multiply(bases, alturas)
+    # Un número con muchos valores se aplica a todos
+    if isinstance(bases, float):
+        return array("d", [bases * a for a in alturas])
+    if isinstance(alturas, float):
+        return array("d", [b * alturas for b in bases])
+    if len(bases) != len(alturas):
+        raise ValueError(f"Hay {len(bases)} bases y {len(alturas)} alturas.")
+    return array("d", [b * a for b, a in zip(bases, alturas)])
+
+
+def areas_triangulos(bases, alturas, validar=True):
+    """Áreas base * altura / 2, elemento a elemento."""
+    rectangulos = areas_rectangulos(bases, alturas, validar)
+    if isinstance(rectangulos, array):
+        return array("d", [r * 0.5 for r in rectangulos])
+    return rectangulos * 0.5
+
+
+# ------------------ Validación ------------------
+def _es_numpy(valores):
+    return NUMPY_DISPONIBLE and isinstance(valores, np.ndarray)
+
+
+def _como_columna(valores, nombre, validar):
+    """Convierte a float, np.ndarray de float64 o array('d') y, si se pide, valida."""
+    if isinstance(valores, Real) and not _es_numpy(valores):
+        valor = float(valores)
+        if validar and not (math.isfinite(valor) and valor > 0):
+            raise ValueError(f"El {nombre} debe ser un número mayor que cero: {valores!r}.")
+        return valor
+    if _es_numpy(valores):
+        columna = valores.astype(np.float64, copy=False)
+        if validar and columna.size:
+            invalidos = ~(np.isfinite(columna) & (columna > 0))
+            if invalidos.any():
+                _rechazar(nombre, columna.ravel(), int(np.flatnonzero(invalidos.ravel())[0]))
+        return columna
+    if isinstance(valores, array) and valores.typecode == "d":
+        columna = valores
+    else:
+        columna = array("d", valores)
+    if validar and columna and not (min(columna) > 0 and math.isfinite(sum(columna))):
+        posicion = next((i for i, v in enumerate(columna) if not (math.isfinite(v) and v > 0)), None)
+        # Sin posición: todos eran válidos y solo la suma se desbordó
+        if posicion is not None:
+            _rechazar(nombre, columna, posicion)
+    return columna
+
+
+def _rechazar(nombre, columna, posicion):
+    raise ValueError(f"El {nombre} en la posición {posicion} debe ser un número mayor que cero: "
+                     f"{columna[posicion]!r}.")
+
+
+# ------------------ Benchmark ------------------
+def benchmark(n=10_000_000):
+    """Áreas de n radios: una llamada por radio contra una sola llamada en bloque."""
+    import random
+    import time
+
+    random.seed(5)
+    radios = array("d", (random.uniform(0.1, 100) for _ in range(n)))
+
+    inicio = time.perf_counter()
+    por_radio = [calcular_area_circulo(r) for r in radios if math.isfinite(r) and r > 0]
+    t_bucle = time.perf_counter() - inicio
+    print(f"{n:,} radios, una llamada por radio (con validación): {t_bucle:.2f} s")
+
+    inicio = time.perf_counter()
+    en_bloque = areas_circulos(radios)
+    t_bloque = time.perf_counter() - inicio
+    print(f"areas_circulos en bloque (con validación): {t_bloque:.2f} s ({t_bucle / t_bloque:.1f}x)")
+    assert len(en_bloque) == len(por_radio) and max(map(abs, map(operator.sub, en_bloque, por_radio))) < 1e-6
+
+    if NUMPY_DISPONIBLE:
+        arreglo = np.frombuffer(radios)
+        inicio = time.perf_counter()
+        areas_circulos(arreglo)
+        t_numpy = time.perf_counter() - inicio
+        print(f"areas_circulos con NumPy: {t_numpy:.3f} s ({t_bucle / t_numpy:.0f}x)")
+
+
+if __name__ == "__main__":
+    # python geometria.py [n]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -1,40 +1,86 @@
 # Programa: sistema_empresa.py
+import math
+import sys
+from array import array
+from itertools import compress
+
+# NumPy es opcional: solo acelera los cálculos de nómina
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except Exception:
+    NUMPY_DISPONIBLE = False
+
 
 # Clase base: Empleado
+# Los datos de cada empleado viven en una fila de una TablaEmpleados; el objeto
+# es una vista de esa fila. Un empleado creado sin tabla tiene una propia, que
+# se libera con él; los que comparten una tabla la reciben en `tabla`.
 class Empleado:
-    def __init__(self, nombre, edad, salario):
-        # Atributos encapsulados
-        self.__nombre = nombre
-        self.__edad = edad
-        self.__salario = salario
+    TIPO = 0  # código del tipo en la columna `tipos` de la tabla
+
+    def __init__(self, nombre, edad, salario, tabla=None):
+        # Atributos encapsulados: la tabla y la fila donde están los datos
+        self.__tabla = tabla if tabla is not None else TablaEmpleados()
+        self.__fila = self.__tabla.agregar(self.TIPO, nombre, edad, salario)
+
+    @classmethod
+    def _vista(cls, tabla, fila):
+        """Objeto para una fila existente, sin agregar otra."""
+        empleado = cls.__new__(cls)
+        empleado.__tabla = tabla
+        empleado.__fila = fila
+        return empleado
+
+    @property
+    def tabla(self):
+        return self.__tabla
+
+    @property
+    def fila(self):
+        return self.__fila
 
     # Métodos de acceso (getters y setters)
     def get_nombre(self):
-        return self.__nombre
+        return self.__tabla.nombres[self.__fila]
 
     def set_nombre(self, nuevo_nombre):
-        self.__nombre = nuevo_nombre
+        self.__tabla.nombres[self.__fila] = nuevo_nombre
 
     def get_salario(self):
-        return self.__salario
+        return self.__tabla.salarios[self.__fila]
 
     def set_salario(self, nuevo_salario):
-        self.__salario = nuevo_salario
+        self.__tabla.salarios[self.__fila] = nuevo_salario
 
     def mostrar_info(self):
-        return f"Empleado: {self.__nombre}, Edad: {self.__edad}, Salario: ${self.__salario}"
+        salario = self.get_salario()
+        salario = int(salario) if salario.is_integer() else salario  # 2500.0 se muestra $2500
+        edad = self.__tabla.edades[self.__fila]
+        edad = int(edad) if edad.is_integer() else edad
+        return f"Empleado: {self.get_nombre()}, Edad: {edad}, Salario: ${salario}"
 
     # Método que será sobrescrito por las clases hijas (polimorfismo)
     def trabajar(self):
-        return f"{self.__nombre} está trabajando en tareas generales."
+        return f"{self.get_nombre()} está trabajando en tareas generales."
 
 
 # Clase derivada: Gerente
 class Gerente(Empleado):
-    def __init__(self, nombre, edad, salario, departamento):
-        super().__init__(nombre, edad, salario)
+    TIPO = 1
+
+    def __init__(self, nombre, edad, salario, departamento, tabla=None):
+        super().__init__(nombre, edad, salario, tabla)
         self.departamento = departamento
 
+    @property
+    def departamento(self):
+        return self.tabla.departamentos.valor(self.fila)
+
+    @departamento.setter
+    def departamento(self, departamento):
+        self.tabla.departamentos.fijar(self.fila, departamento)
+
     # Polimorfismo: sobrescribir el método trabajar
     def trabajar(self):
         return f"{self.get_nombre()} está gestionando el departamento de {self.departamento}."
@@ -45,10 +91,20 @@ class Gerente(Empleado):
 
 # Clase derivada: Desarrollador
 class Desarrollador(Empleado):
-    def __init__(self, nombre, edad, salario, lenguaje):
-        super().__init__(nombre, edad, salario)
+    TIPO = 2
+
+    def __init__(self, nombre, edad, salario, lenguaje, tabla=None):
+        super().__init__(nombre, edad, salario, tabla)
         self.lenguaje = lenguaje
 
+    @property
+    def lenguaje(self):
+        return self.tabla.lenguajes.valor(self.fila)
+
+    @lenguaje.setter
+    def lenguaje(self, lenguaje):
+        self.tabla.lenguajes.fijar(self.fila, lenguaje)
+
     def trabajar(self):
         return f"{self.get_nombre()} está programando en {self.lenguaje}."
 
@@ -56,11 +112,172 @@ class Desarrollador(Empleado):
         return super().mostrar_info() + f", Lenguaje: {self.lenguaje}"
 
 
+# Clases por código de tipo (columna `tipos`)
+TIPOS = (Empleado, Gerente, Desarrollador)
+
+
+class ColumnaCodificada:
+    """Columna de texto muy repetido (departamento, lenguaje): guarda un código
+    por fila y cada texto distinto una sola vez. -1 = no aplica.
+
+    filas[c] es el conjunto de filas con el código c: agrupar o filtrar por un
+    texto recorre solo esas filas y no la columna entera."""
+
+    def __init__(self):
+        self.codigos = array("l")
+        self.textos = []
+        self.filas = []
+        self._codigo_de = {}
+
+    def agregar_fila(self):
+        self.codigos.append(-1)
+
+    def codigo(self, texto):
+        codigo = self._codigo_de.get(texto)
+        if codigo is None:
+            codigo = self._codigo_de[texto] = len(self.textos)
+            self.textos.append(texto)
+            self.filas.append(set())
+        return codigo
+
+    def buscar(self, texto):
+        """Código de un texto ya usado, o None."""
+        return self._codigo_de.get(texto)
+
+    def valor(self, fila):
+        codigo = self.codigos[fila]
+        return self.textos[codigo] if codigo >= 0 else None
+
+    def fijar(self, fila, texto):
+        anterior = self.codigos[fila]
+        if anterior >= 0:
+            self.filas[anterior].discard(fila)
+        codigo = self.codigo(texto) if texto is not None else -1
+        if codigo >= 0:
+            self.filas[codigo].add(fila)
+        self.codigos[fila] = codigo
+
+
+class TablaEmpleados:
+    """Empleados en columnas paralelas: los cálculos de nómina recorren arrays
+    en vez de llamar a get_salario en cada objeto.
+
+    Columnas: nombres (list), edades (array 'd'), salarios (array 'd'),
+    tipos (array 'b', índice en TIPOS), departamentos y lenguajes (ColumnaCodificada).
+
+    Sin NumPy los agrupados y los aumentos filtrados recorren solo las filas de
+    cada texto (ColumnaCodificada.filas) y el cálculo completo queda unas 2-3
+    veces más rápido que recorrer los objetos; con NumPy, bastante más.
+    """
+
+    def __init__(self):
+        self.nombres = []
+        self.edades = array("d")
+        self.salarios = array("d")
+        self.tipos = array("b")
+        self.departamentos = ColumnaCodificada()
+        self.lenguajes = ColumnaCodificada()
+
+    def agregar(self, tipo, nombre, edad, salario):
+        """Agrega una fila y retorna su número. Si un valor no cabe en su columna
+        (edad o salario "2500") lanza TypeError sin agregar nada."""
+        # Se convierten todos los valores antes de tocar la tabla: si uno falla
+        # después de agregar el nombre, las columnas quedarían de distinto largo
+        edad = array("d", (edad,))
+        salario = array("d", (salario,))
+        tipo = array("b", (tipo,))
+        self.nombres.append(nombre)
+        self.edades.extend(edad)
+        self.salarios.extend(salario)
+        self.tipos.extend(tipo)
+        self.departamentos.agregar_fila()
+        self.lenguajes.agregar_fila()
+        return len(self.nombres) - 1
+
+    def empleado(self, fila):
+        """Objeto Empleado/Gerente/Desarrollador que representa la fila."""
+        return TIPOS[self.tipos[fila]]._vista(self, fila)
+
+    def empleados(self):
+        return (self.empleado(fila) for fila in range(len(self)))
+
+    def __len__(self):
+        return len(self.nombres)
+
+    # ------------------ Nómina ------------------
+    def total_salarios(self):
+        return math.fsum(self.salarios)
+
+    def salarios_por_departamento(self):
+        """{departamento: (empleados, total)} de los gerentes."""
+        return self._agrupar(self.departamentos)
+
+    def salarios_por_lenguaje(self):
+        """{lenguaje: (empleados, total)} de los desarrolladores."""
+        return self._agrupar(self.lenguajes)
+
+    def _agrupar(self, columna):
+        grupos = len(columna.textos)
+        if NUMPY_DISPONIBLE:
+            # Código + 1 para que "no aplica" (-1) caiga en la casilla 0
+            codigos = np.frombuffer(columna.codigos, dtype=np.dtype(columna.codigos.typecode)) + 1
+            cantidades = np.bincount(codigos, minlength=grupos + 1)[1:].tolist()
+            totales = np.bincount(codigos, weights=np.frombuffer(self.salarios), minlength=grupos + 1)[1:].tolist()
+        else:
+            # Solo las filas de cada grupo; map y fsum las recorren en C
+            cantidades = [len(filas) for filas in columna.filas]
+            totales = [math.fsum(map(self.salarios.__getitem__, filas)) for filas in columna.filas]
+        return {texto: (cantidades[c], totales[c]) for c, texto in enumerate(columna.textos) if cantidades[c]}
+
+    def aplicar_aumento(self, porcentaje, tipo=None, departamento=None, lenguaje=None):
+        """Sube `porcentaje` % el salario de las filas que cumplen todos los filtros
+        dados (tipo es una clase de TIPOS). Retorna cuántos salarios cambiaron."""
+        condiciones = []
+        if tipo is not None:
+            condiciones.append((self.tipos, TIPOS.index(tipo)))
+        for columna, texto in ((self.departamentos, departamento), (self.lenguajes, lenguaje)):
+            if texto is not None:
+                codigo = columna.buscar(texto)
+                # Un texto que nadie usa no coincide con ninguna fila
+                condiciones.append((columna.codigos, codigo if codigo is not None else -2))
+        factor = 1 + porcentaje / 100
+        if NUMPY_DISPONIBLE:
+            salarios = np.frombuffer(self.salarios)  # vista: modifica el array en su lugar
+            mascara = np.ones(len(self), dtype=bool)
+            for columna, codigo in condiciones:
+                mascara &= np.frombuffer(columna, dtype=np.dtype(columna.typecode)) == codigo
+            salarios[mascara] *= factor
+            return int(mascara.sum())
+        if not condiciones:
+            self.salarios[:] = array("d", map(factor.__mul__, self.salarios))
+            return len(self)
+        # Departamento y lenguaje dan sus filas directamente (ColumnaCodificada.filas);
+        # el tipo se filtra en C sobre las filas que quedan
+        filas = None
+        for columna, texto in ((self.departamentos, departamento), (self.lenguajes, lenguaje)):
+            if texto is not None:
+                codigo = columna.buscar(texto)
+                conjunto = columna.filas[codigo] if codigo is not None else set()
+                filas = conjunto if filas is None else filas & conjunto
+        if tipo is not None:
+            codigo = TIPOS.index(tipo)
+            if filas is None:
+                filas = compress(range(len(self)), map(codigo.__eq__, self.tipos))
+            else:
+                filas = compress(filas, map(codigo.__eq__, map(self.tipos.__getitem__, filas)))
+            filas = list(filas)
+        salarios = self.salarios
+        for f in filas:
+            salarios[f] *= factor
+        return len(filas)
+
+
 # Función principal que ejecuta el programa
 def main():
-    # Crear instancias de las clases
-    gerente1 = Gerente("Laura Gómez", 40, 2500, "Finanzas")
-    dev1 = Desarrollador("Carlos Ruiz", 28, 1800, "Python")
+    # Crear instancias de las clases, en una misma tabla para calcular la nómina
+    nomina = TablaEmpleados()
+    gerente1 = Gerente("Laura Gómez", 40, 2500, "Finanzas", nomina)
+    dev1 = Desarrollador("Carlos Ruiz", 28, 1800, "Python", nomina)
 
     # Mostrar información y comportamiento
     print(gerente1.mostrar_info())
@@ -80,5 +297,99 @@ def main():
     print(dev1.mostrar_info())
 
 
-if __name__ == "__main__":
+    # Nómina calculada sobre la tabla, sin recorrer los objetos
+    print(f"\nTotal de la nómina: ${nomina.total_salarios():,.2f}")
+    print(f"Por departamento: {nomina.salarios_por_departamento()}")
+    print(f"Por lenguaje: {nomina.salarios_por_lenguaje()}")
+
+
+# ------------------ Benchmark ------------------
+# Las clases tal como eran antes de la tabla (cada objeto guarda sus datos):
+# contra ellas se compara el cálculo por columnas
+class _EmpleadoSimple:
+    def __init__(self, nombre, edad, salario):
+        self.__nombre = nombre
+        self.__edad = edad
+        self.__salario = salario
+
+    def get_salario(self):
+        return self.__salario
+
+    def set_salario(self, nuevo_salario):
+        self.__salario = nuevo_salario
+
+
+class _GerenteSimple(_EmpleadoSimple):
+    def __init__(self, nombre, edad, salario, departamento):
+        super().__init__(nombre, edad, salario)
+        self.departamento = departamento
+
+
+class _DesarrolladorSimple(_EmpleadoSimple):
+    def __init__(self, nombre, edad, salario, lenguaje):
+        super().__init__(nombre, edad, salario)
+        self.lenguaje = lenguaje
+
+
+def benchmark_nomina(n=5_000_000):
+    """Nómina de n empleados: los objetos con atributos propios (las clases
+    originales) recorridos con get_salario, contra las columnas de la tabla."""
+    import gc
+    import random
+    import time
+
+    random.seed(6)
+    departamentos = ("Finanzas", "Ventas", "Operaciones", "Sistemas", "Talento Humano")
+    lenguajes = ("Python", "Java", "JavaScript", "Go", "C#")
+    tabla = TablaEmpleados()
+    objetos = []
+    gc.disable()  # millones de objetos vivos: el recolector solo agrega ruido
+    try:
+        inicio = time.perf_counter()
+        for i in range(n):
+            r = random.random()
+            salario = round(random.uniform(800, 4000), 2)
+            if r < 0.1:
+                Gerente(f"G{i}", 40, salario, departamentos[i % 5], tabla)
+                objetos.append(_GerenteSimple(f"G{i}", 40, salario, departamentos[i % 5]))
+            elif r < 0.5:
+                Desarrollador(f"D{i}", 30, salario, lenguajes[i % 5], tabla)
+                objetos.append(_DesarrolladorSimple(f"D{i}", 30, salario, lenguajes[i % 5]))
+            else:
+                Empleado(f"E{i}", 35, salario, tabla)
+                objetos.append(_EmpleadoSimple(f"E{i}", 35, salario))
+        print(f"Crear {n:,} empleados (tabla y objetos): {time.perf_counter() - inicio:.1f} s "
+              f"(NumPy: {NUMPY_DISPONIBLE})")
+
+        inicio = time.perf_counter()
+        total = sum(e.get_salario() for e in objetos)
+        por_departamento, por_lenguaje = {}, {}
+        for e in objetos:
+            if isinstance(e, _GerenteSimple):
+                por_departamento[e.departamento] = por_departamento.get(e.departamento, 0) + e.get_salario()
+            elif isinstance(e, _DesarrolladorSimple):
+                por_lenguaje[e.lenguaje] = por_lenguaje.get(e.lenguaje, 0) + e.get_salario()
+        for e in objetos:
+            if isinstance(e, _DesarrolladorSimple) and e.lenguaje == "Python":
+                e.set_salario(e.get_salario() * 1.05)
+        t_objetos = time.perf_counter() - inicio
+        print(f"Objetos con atributos propios (total, agrupados, aumento): {t_objetos:.2f} s")
+
+        inicio = time.perf_counter()
+        total_columnas = tabla.total_salarios()
+        tabla.salarios_por_departamento()
+        tabla.salarios_por_lenguaje()
+        tabla.aplicar_aumento(5, tipo=Desarrollador, lenguaje="Python")
+        t_columnas = time.perf_counter() - inicio
+        print(f"Por columnas (lo mismo): {t_columnas:.2f} s ({t_objetos / t_columnas:.1f}x)")
+    finally:
+        gc.enable()
+    assert abs(total - total_columnas) < 1e-6 * total
+    assert tabla.salarios == array("d", (e.get_salario() for e in objetos))
+
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+    # python "Aplicación de Conceptos de POO en Python.py" --benchmark [n]
+    benchmark_nomina(int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000)
+elif __name__ == "__main__":
     main()
@@ -1,41 +1,149 @@
+import logging
+import sys
+
+# Registro de eventos del sistema: cada mensaje lleva sus datos en campos aparte
+# (evento, nombre, correo, cantidad) para que un handler pueda guardarlos como
+# JSON o filtrarlos. Se apaga con registro.setLevel(logging.WARNING) o
+# registro.disabled = True; sin configurar logging no se muestra nada.
+registro = logging.getLogger("sistema_usuarios")
+
+
+def normalizar_correo(correo):
+    """Clave del índice: los correos no distinguen mayúsculas ni espacios alrededor."""
+    return correo.strip().lower()
+
+
 # Clase que representa a un Usuario del sistema
 class Usuario:
+    __slots__ = ("nombre", "correo")
+
     # Método constructor: se ejecuta automáticamente al crear un objeto
     def __init__(self, nombre, correo):
         self.nombre = nombre
         self.correo = correo
-        print(f"[INFO] Usuario '{self.nombre}' creado correctamente.")
+        if registro.isEnabledFor(logging.DEBUG):
+            registro.debug("Usuario '%s' creado correctamente.", nombre,
+                           extra={"evento": "usuario_creado", "nombre": nombre, "correo": correo})
 
     # Método para mostrar la información del usuario
     def mostrar_info(self):
         print(f"Nombre: {self.nombre}, Correo: {self.correo}")
 
-    # Método destructor: se ejecuta automáticamente cuando el objeto es eliminado
+    # Método destructor: se ejecuta automáticamente cuando el objeto es eliminado.
+    # Solo registra en nivel DEBUG: destruir un millón de usuarios no debe escribir
+    # un millón de líneas
     def __del__(self):
-        print(f"[INFO] El objeto Usuario '{self.nombre}' ha sido eliminado.")
+        if registro.isEnabledFor(logging.DEBUG):
+            registro.debug("El objeto Usuario '%s' ha sido eliminado.", self.nombre,
+                           extra={"evento": "usuario_eliminado", "nombre": self.nombre})
 
 
 # Clase que representa un sistema con múltiples usuarios
 class Sistema:
     def __init__(self):
-        self.lista_usuarios = []
-        print("[INFO] Sistema iniciado.")
+        # Índice por correo normalizado: búsqueda y detección de duplicados en O(1)
+        self.usuarios = {}
+        registro.info("Sistema iniciado.", extra={"evento": "sistema_iniciado"})
+
+    @property
+    def lista_usuarios(self):
+        return list(self.usuarios.values())
 
     def agregar_usuario(self, nombre, correo):
-        usuario = Usuario(nombre, correo)
-        self.lista_usuarios.append(usuario)
-        print(f"[INFO] Usuario '{nombre}' agregado al sistema.")
+        """Registra un usuario y lo retorna. ValueError si el correo ya está registrado."""
+        clave = normalizar_correo(correo)
+        if clave in self.usuarios:
+            raise ValueError(f"El correo '{correo}' ya está registrado.")
+        usuario = self.usuarios[clave] = Usuario(nombre, correo)
+        registro.info("Usuario '%s' agregado al sistema.", nombre,
+                      extra={"evento": "usuario_agregado", "nombre": nombre, "correo": correo})
+        return usuario
+
+    def registrar_muchos(self, datos):
+        """Registra pares (nombre, correo) de una vez, con un solo mensaje al final.
+        Los correos repetidos (ya registrados o dentro de `datos`) se omiten y se
+        retornan junto con la cantidad de usuarios agregados."""
+        usuarios = self.usuarios
+        antes = len(usuarios)
+        duplicados = []
+        for nombre, correo in datos:
+            clave = normalizar_correo(correo)
+            if clave in usuarios:
+                duplicados.append(correo)
+            else:
+                usuarios[clave] = Usuario(nombre, correo)
+        agregados = len(usuarios) - antes
+        registro.info("%d usuarios agregados al sistema (%d duplicados omitidos).", agregados, len(duplicados),
+                      extra={"evento": "registro_masivo", "cantidad": agregados, "duplicados": len(duplicados)})
+        return agregados, duplicados
+
+    def buscar_usuario(self, correo):
+        return self.usuarios.get(normalizar_correo(correo))
+
+    def eliminar_usuario(self, correo):
+        """Elimina un usuario por correo. Retorna True si existía."""
+        usuario = self.usuarios.pop(normalizar_correo(correo), None)
+        if usuario is None:
+            return False
+        registro.info("Usuario '%s' eliminado del sistema.", usuario.nombre,
+                      extra={"evento": "usuario_quitado", "nombre": usuario.nombre, "correo": usuario.correo})
+        return True
 
     def mostrar_usuarios(self):
-        print("[INFO] Lista de usuarios registrados:")
-        for usuario in self.lista_usuarios:
+        print("Lista de usuarios registrados:")
+        for usuario in self.usuarios.values():
             usuario.mostrar_info()
 
+    def __len__(self):
+        return len(self.usuarios)
+
     def __del__(self):
-        print("[INFO] Cerrando el sistema y eliminando usuarios...")
+        registro.info("Cerrando el sistema y eliminando usuarios...", extra={"evento": "sistema_cerrado"})
+
+
+# ------------------ Benchmark ------------------
+def benchmark(n=1_000_000):
+    """Alta y destrucción de n usuarios. registrar_muchos escribe un solo mensaje;
+    agregar_usuario uno por usuario, así que se mide con el registro desactivado."""
+    import gc
+    import time
+
+    datos = [(f"Usuario {i}", f"usuario{i}@correo.com") for i in range(n)]
+
+    nivel = registro.level
+    registro.setLevel(logging.WARNING)
+    sistema = Sistema()
+    inicio = time.perf_counter()
+    for nombre, correo in datos:
+        sistema.agregar_usuario(nombre, correo)
+    print(f"agregar_usuario uno por uno ({n:,}, registro desactivado): {time.perf_counter() - inicio:.2f} s")
+    del sistema
+    gc.collect()
+    registro.setLevel(nivel)
+
+    sistema = Sistema()
+    inicio = time.perf_counter()
+    agregados, duplicados = sistema.registrar_muchos(datos + datos[:1000])
+    print(f"registrar_muchos ({agregados:,} agregados, {len(duplicados):,} duplicados): "
+          f"{time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    encontrados = sum(1 for _, correo in datos if sistema.buscar_usuario(correo.upper()) is not None)
+    print(f"{n:,} búsquedas por correo: {time.perf_counter() - inicio:.2f} s ({encontrados:,} encontrados)")
+
+    inicio = time.perf_counter()
+    del sistema
+    print(f"Destruir el sistema y sus {n:,} usuarios: {time.perf_counter() - inicio:.2f} s")
+
 
 # Bloque principal de ejecución
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+elif __name__ == "__main__":
+    # Mostrar también los mensajes de constructores y destructores (nivel DEBUG)
+    logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
+
     # Crear instancia del sistema
     sistema = Sistema()
 
@@ -46,4 +154,6 @@ if __name__ == "__main__":
     # Mostrar todos los usuarios registrados
     sistema.mostrar_usuarios()
 
-    # El destructor del sistema y de cada objeto Usuario se ejecutará al finalizar el programa automáticamente
\ No newline at end of file
+    # Al eliminar el sistema se ejecuta su destructor y, al quedar sin referencias,
+    # el de cada objeto Usuario
+    del sistema
@@ -8,7 +8,19 @@
 # maneja excepciones en operaciones de lectura/escritura.
 # -------------------------------------------------------
 
+import csv
+import gc
+import io
+import json
 import os
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Tamaño del buffer de lectura/escritura: el archivo se recorre en bloques grandes
+TAMANO_BUFFER = 1 << 20
 
 # -----------------------
 # Clase Producto
@@ -50,32 +62,31 @@ class Producto:
         """
         return f"ID: {self.id_producto} | Nombre: {self.nombre} | Cantidad: {self.cantidad} | Precio: ${self.precio:.2f}"
 
-    def to_line(self):
-        """Convierte un producto a formato de línea para archivo."""
-        return f"{self.id_producto},{self.nombre},{self.cantidad},{self.precio}\n"
-
-    @staticmethod
-    def from_line(linea: str):
-        """Reconstruye un producto desde una línea de archivo."""
-        try:
-            partes = linea.strip().split(",")
-            return Producto(int(partes[0]), partes[1], int(partes[2]), float(partes[3]))
-        except (IndexError, ValueError):
-            print("⚠️ Advertencia: línea de archivo corrupta, se omitirá:", linea.strip())
-            return None
+    def to_fila(self):
+        """Campos del producto en el orden del archivo CSV."""
+        return (self.id_producto, self.nombre, self.cantidad, self.precio)
 
 
 # -----------------------
 # Clase Inventario
 # -----------------------
 class Inventario:
-    def __init__(self, archivo="inventario.txt"):
+    def __init__(self, archivo="inventario.txt", dialecto="excel", procesos=None):
         """
         Constructor: inicializa lista de productos y carga desde archivo.
+        El archivo es CSV; `dialecto` es un dialecto del módulo csv (nombre o clase).
+        Las líneas corruptas se copian a `<archivo>.cuarentena` con su número de línea
+        (una vez por versión del archivo, ver _abrir_cuarentena).
+        Con `procesos` la carga inicial se reparte entre varios procesos (cargar_en_paralelo).
         """
         self.productos = []
         self.archivo = archivo
-        self.cargar_desde_archivo()
+        self.dialecto = dialecto
+        self.cuarentena = archivo + ".cuarentena"
+        if procesos and os.path.exists(archivo):
+            self.cargar_en_paralelo(procesos)
+        else:
+            self.cargar_desde_archivo()
 
     def cargar_desde_archivo(self):
         """Carga productos desde archivo al iniciar el programa."""
@@ -88,22 +99,139 @@ class Inventario:
             return
 
         try:
-            with open(self.archivo, "r", encoding="utf-8") as f:
-                for linea in f:
-                    producto = Producto.from_line(linea)
-                    if producto:
-                        self.productos.append(producto)
+            with open(self.archivo, "r", encoding="utf-8", newline="", buffering=TAMANO_BUFFER) as f:
+                corruptas = self._leer_filas(f, self.archivo)
+            if corruptas:
+                print(f"⚠️ Advertencia: {corruptas} línea(s) corrupta(s) omitida(s); ver '{self.cuarentena}'.")
         except FileNotFoundError:
             print("⚠️ Archivo de inventario no encontrado. Se creará uno nuevo.")
         except PermissionError:
             print("❌ No tienes permisos para leer el archivo de inventario.")
 
+    def _leer_filas(self, lineas, ruta):
+        """Agrega los productos de las líneas de un CSV (el contenido de `ruta`); las
+        líneas corruptas van a la cuarentena. Retorna cuántas líneas corruptas hubo."""
+        archivo_cuarentena = escritor = version = None
+        corruptas = 0
+        fecha = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        def apartar(numero, error, campos):
+            nonlocal archivo_cuarentena, escritor, version, corruptas
+            if not corruptas:
+                archivo_cuarentena, escritor, version = self._abrir_cuarentena(ruta)
+            if escritor is not None:
+                escritor.writerow((fecha, version, numero, error, *campos))
+            corruptas += 1
+
+        # Los productos no forman ciclos: sin pausar el recolector, este recorrería
+        # una y otra vez los millones de objetos recién creados
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            _analizar_csv(lineas, self.dialecto, Producto, self.productos.append, apartar)
+        finally:
+            if recolector_activo:
+                gc.enable()
+            if archivo_cuarentena is not None:
+                archivo_cuarentena.close()
+        return corruptas
+
+    def _abrir_cuarentena(self, ruta):
+        """(archivo, escritor, versión) para apartar las líneas corruptas de `ruta`.
+
+        Se agrega al final: guardar_en_archivo reescribe el inventario sin las líneas
+        corruptas, así que la cuarentena es su única copia. Hasta ese guardado cada
+        carga encuentra las mismas líneas; la versión del archivo (tamaño y fecha de
+        modificación) va en cada fila, y si la última fila de la cuarentena ya es de
+        esta versión retorna (None, None, versión): no se copian de nuevo.
+        """
+        estado = os.stat(ruta)
+        version = f"{estado.st_size}-{estado.st_mtime_ns}"
+        nuevo = not os.path.exists(self.cuarentena) or not os.path.getsize(self.cuarentena)
+        if not nuevo and self._ultima_version_apartada() == version:
+            return None, None, version
+        archivo = open(self.cuarentena, "a", encoding="utf-8", newline="")
+        escritor = csv.writer(archivo, self.dialecto, lineterminator="\n")
+        if nuevo:
+            escritor.writerow(("fecha", "version", "linea", "error", "contenido"))
+        return archivo, escritor, version
+
+    def _ultima_version_apartada(self):
+        # Cada fila de la cuarentena ocupa una línea: basta leer el final del archivo
+        with open(self.cuarentena, "rb") as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - 64 * 1024))
+            ultima = f.read().decode("utf-8", "replace").rstrip("\r\n").rsplit("\n", 1)[-1]
+        try:
+            fila = next(csv.reader([ultima], self.dialecto), [])
+        except csv.Error:
+            return None
+        return fila[1] if len(fila) > 1 else None
+
+    def cargar_en_paralelo(self, procesos=None, formato="csv", ruta=None):
+        """Carga el archivo repartiendo el análisis entre varios procesos.
+
+        El archivo (CSV de este programa o JSON Lines, ver exportar_jsonl) se divide
+        en rangos de bytes que empiezan al comienzo de una línea y nunca dentro de un
+        campo entre comillas; cada proceso analiza sus rangos con las mismas reglas
+        que cargar_desde_archivo (_analizar_csv) y devuelve columnas, que viajan
+        entre procesos casi sin costo. Aquí se crean los Producto en el orden del
+        archivo: el resultado es el mismo que el de la carga secuencial, IDs
+        repetidos incluidos. Retorna cuántas líneas corruptas hubo.
+        """
+        ruta = ruta or self.archivo
+        procesos = procesos or os.cpu_count() or 1
+        comilla = csv.get_dialect(self.dialecto).quotechar if isinstance(self.dialecto, str) \
+            else self.dialecto.quotechar
+        # Varios rangos por proceso para repartir mejor la carga
+        limites = _limites_de_bloques(ruta, procesos * 4, comilla.encode() if formato == "csv" else None)
+        with ProcessPoolExecutor(procesos) as ejecutor:
+            bloques = list(ejecutor.map(_analizar_bloque, repeat(ruta), limites[:-1], limites[1:],
+                                        repeat(formato), repeat(self.dialecto)))
+        # Un rango que termina en medio de una fila (solo pasa con comillas sin
+        # cerrar) invalida los siguientes: desde él se analiza el resto de una vez
+        for i, bloque in enumerate(bloques):
+            if bloque[-1] is None:
+                bloques[i:] = [_analizar_bloque(ruta, limites[i], limites[-1], formato, self.dialecto)]
+                break
+
+        productos = []
+        archivo_cuarentena = escritor = version = None
+        fecha = time.strftime("%Y-%m-%d %H:%M:%S")
+        lineas_previas = total_corruptas = 0
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            for ids, nombres, cantidades, precios, corruptas, lineas in bloques:
+                productos.extend(map(Producto, ids, nombres, cantidades, precios))
+                if corruptas and version is None:
+                    archivo_cuarentena, escritor, version = self._abrir_cuarentena(ruta)
+                if escritor is not None:
+                    for numero, error, contenido in corruptas:
+                        escritor.writerow((fecha, version, lineas_previas + numero, error, *contenido))
+                total_corruptas += len(corruptas)
+                lineas_previas += lineas
+        finally:
+            if recolector_activo:
+                gc.enable()
+            if archivo_cuarentena is not None:
+                archivo_cuarentena.close()
+        self.productos = productos
+        if total_corruptas:
+            print(f"⚠️ Advertencia: {total_corruptas} línea(s) corrupta(s) omitida(s); ver '{self.cuarentena}'.")
+        return total_corruptas
+
+    def exportar_jsonl(self, ruta):
+        """Exporta el inventario en JSON Lines (un producto por línea)."""
+        with open(ruta, "w", encoding="utf-8", buffering=TAMANO_BUFFER) as f:
+            f.writelines(json.dumps({"id": p.id_producto, "nombre": p.nombre, "cantidad": p.cantidad,
+                                     "precio": p.precio}, ensure_ascii=False) + "\n" for p in self.productos)
+
     def guardar_en_archivo(self):
         """Guarda todos los productos en el archivo."""
         try:
-            with open(self.archivo, "w", encoding="utf-8") as f:
-                for p in self.productos:
-                    f.write(p.to_line())
+            with open(self.archivo, "w", encoding="utf-8", newline="", buffering=TAMANO_BUFFER) as f:
+                # writerows escribe todas las filas de una vez en el buffer
+                csv.writer(f, self.dialecto, lineterminator="\n").writerows(p.to_fila() for p in self.productos)
         except PermissionError:
             print("❌ Error: no tienes permiso para escribir en el archivo.")
         except Exception as e:
@@ -157,6 +285,180 @@ class Inventario:
                 print(p)
 
 
+# -----------------------
+# Análisis del CSV
+# -----------------------
+# Línea que se agrega al final de un rango para saber si el rango termina entre
+# dos filas o en medio de una (U+FFFF no es un carácter válido en un texto)
+CENTINELA = "\uffff\n"
+
+
+def _analizar_csv(lineas, dialecto, crear, agregar, apartar, centinela=False):
+    """Analiza las líneas físicas de un CSV del inventario.
+
+    Cada fila válida se pasa a agregar(crear(id, nombre, cantidad, precio)) y
+    cada línea inválida a apartar(número de línea, error, campos). Una fila
+    puede ocupar varias líneas (un nombre entre comillas con saltos de línea);
+    si una de esas filas resulta inválida, la culpable es su primera línea (una
+    comilla sin cerrar): se analiza sola y desde la línea siguiente se sigue
+    leyendo normalmente, así no se pierde una fila válida de varias líneas que
+    venga después. Retorna cuántas líneas se leyeron. Con `centinela` retorna
+    None si las líneas terminan en medio de una fila (un campo entre comillas
+    sin cerrar): la carga secuencial seguiría esa fila en las líneas siguientes.
+    """
+    pendientes = []  # líneas físicas de la fila actual
+    releer = deque()  # líneas ya leídas que se vuelven a analizar
+    resto = iter(lineas)
+
+    def fuente():
+        while releer:
+            linea = releer.popleft()
+            pendientes.append(linea)
+            yield linea
+        for linea in resto:
+            pendientes.append(linea)
+            yield linea
+        if centinela:
+            pendientes.append(CENTINELA)
+            yield CENTINELA
+
+    lector = csv.reader(fuente(), dialecto)
+    leidas = 0
+    while True:
+        try:
+            fila = next(lector)
+            error = None
+        except StopIteration:
+            break
+        except csv.Error as e:  # dialectos estrictos o bytes NUL
+            fila, error = [], str(e)
+        if centinela and pendientes[-1] is CENTINELA:
+            # La centinela sola es una fila aparte: el rango terminó entre dos filas
+            return leidas if pendientes == [CENTINELA] else None
+        if error is None:
+            try:
+                if len(fila) == 4:
+                    agregar(crear(int(fila[0]), fila[1], int(fila[2]), float(fila[3])))
+                elif fila:
+                    error = f"se esperaban 4 campos y hay {len(fila)}"
+            except ValueError as e:
+                error = str(e)
+        if error is not None and len(pendientes) > 1:
+            _analizar_linea(pendientes[0], leidas + 1, dialecto, crear, agregar, apartar)
+            releer.extend(pendientes[1:])
+            leidas += 1
+            pendientes.clear()
+            # csv.reader no lee más allá de la fila que retorna: un lector nuevo
+            # empieza justo en la línea siguiente a la culpable
+            lector = csv.reader(fuente(), dialecto)
+            continue
+        if error is not None:
+            apartar(leidas + 1, error, fila)
+        leidas += len(pendientes)
+        pendientes.clear()
+    return leidas
+
+
+def _analizar_linea(linea, numero, dialecto, crear, agregar, apartar):
+    # Una línea sola, sin unirla con las siguientes aunque abra comillas
+    try:
+        fila = next(csv.reader([linea], dialecto), [])
+        if len(fila) == 4:
+            agregar(crear(int(fila[0]), fila[1], int(fila[2]), float(fila[3])))
+        elif fila:
+            raise ValueError(f"se esperaban 4 campos y hay {len(fila)}")
+    except (ValueError, csv.Error) as e:
+        apartar(numero, str(e), [linea.rstrip("\r\n")])
+
+
+# -----------------------
+# Carga en paralelo (funciones de los procesos)
+# -----------------------
+def _limites_de_bloques(ruta, partes, comilla=None):
+    """Posiciones de inicio de cada rango más el final; cada una cae justo después de un salto de línea.
+
+    Con `comilla` (CSV) se cuentan las comillas desde el comienzo del archivo: si
+    hasta un límite hay un número impar, el límite está dentro de un campo entre
+    comillas y avanza de línea en línea hasta cerrarlo. Una comilla sin cerrar deja
+    el resto del archivo en un solo rango, que se analiza igual que en la carga
+    secuencial (recuperándose en la línea siguiente, ver _analizar_csv). Si aun
+    así un límite cae dentro de una fila, el rango anterior lo detecta con la
+    centinela y cargar_en_paralelo analiza de una vez desde ese rango.
+    """
+    tamano = os.path.getsize(ruta)
+    limites = [0]
+    comillas = 0  # comillas antes de limites[-1]
+    with open(ruta, "rb") as f:
+        for i in range(1, partes):
+            objetivo = max(tamano * i // partes, limites[-1])
+            if comilla:
+                f.seek(limites[-1])
+                for desde in range(limites[-1], objetivo, TAMANO_BUFFER):
+                    comillas += f.read(min(TAMANO_BUFFER, objetivo - desde)).count(comilla)
+            f.seek(objetivo)
+            linea = f.readline()  # avanzar hasta el comienzo de la línea siguiente
+            if comilla:
+                comillas += linea.count(comilla)
+                while comillas % 2 and linea:
+                    linea = f.readline()
+                    comillas += linea.count(comilla)
+            limites.append(min(f.tell(), tamano))
+    limites.append(tamano)
+    return limites
+
+
+def _como_tupla(*campos):
+    return campos
+
+
+def _columnas(filas):
+    """(ids, nombres, cantidades, precios): los números en arrays, que se copian
+    entre procesos como bytes en vez de un objeto por valor."""
+    if not filas:
+        return array("q"), [], array("q"), array("d")
+    ids, nombres, cantidades, precios = zip(*filas)
+    try:
+        ids, cantidades = array("q", ids), array("q", cantidades)
+    except OverflowError:  # enteros de más de 64 bits: se quedan como tuplas
+        pass
+    return ids, list(nombres), cantidades, array("d", precios)
+
+
+def _analizar_bloque(ruta, inicio, fin, formato, dialecto):
+    """Analiza las líneas del rango [inicio, fin) del archivo.
+
+    Retorna (ids, nombres, cantidades, precios, corruptas, lineas): las columnas de
+    las filas válidas (ver _columnas), las líneas inválidas como (número de línea
+    dentro del rango, error, campos) y cuántas líneas tiene el rango, o None si un
+    CSV termina en medio de una fila (ver _analizar_csv).
+    """
+    with open(ruta, "rb") as f:
+        ultimo = fin >= os.fstat(f.fileno()).st_size
+        f.seek(inicio)
+        texto = f.read(fin - inicio).decode("utf-8")
+    filas = []
+    corruptas = []
+    apartar = lambda numero, error, campos: corruptas.append((numero, error, campos))
+    if formato == "jsonl":
+        # split("\n") y no splitlines(): este también corta en \x85, \u2028, etc.
+        lineas = texto.split("\n")
+        if lineas[-1] == "":
+            lineas.pop()
+        for numero, linea in enumerate(lineas, 1):
+            if not linea.strip():
+                continue
+            try:
+                d = json.loads(linea)
+                filas.append((int(d["id"]), d["nombre"], int(d["cantidad"]), float(d["precio"])))
+            except (ValueError, KeyError, TypeError) as e:
+                apartar(numero, f"{type(e).__name__}: {e}", [linea])
+        leidas = len(lineas)
+    else:
+        leidas = _analizar_csv(io.StringIO(texto, newline=""), dialecto, _como_tupla, filas.append, apartar,
+                               centinela=not ultimo)
+    return (*_columnas(filas), corruptas, leidas)
+
+
 # -----------------------
 # Interfaz de Usuario
 # -----------------------
@@ -220,8 +522,93 @@ def menu():
             print("❌ Opción no válida. Intente nuevamente.")
 
 
+# -----------------------
+# Benchmark de carga
+# -----------------------
+def benchmark_carga(n=1_000_000, ruta="inventario_benchmark.txt"):
+    """Guarda y carga n productos y compara con solo leer las líneas del archivo (límite de E/S)."""
+    inventario = Inventario(ruta)
+    inventario.productos = [Producto(i, f"Producto {i}, talla {i % 5}", i % 100, i % 1000 / 10) for i in range(n)]
+    try:
+        inicio = time.perf_counter()
+        inventario.guardar_en_archivo()
+        print(f"Guardar {n:,} productos: {time.perf_counter() - inicio:.2f} s")
+        with open(ruta, "a", encoding="utf-8") as f:
+            f.write("x,sin número,1,1.0\n1,incompleta\n")
+        inventario.productos = []
+
+        inicio = time.perf_counter()
+        with open(ruta, "r", encoding="utf-8", buffering=TAMANO_BUFFER) as f:
+            for _ in f:
+                pass
+        t_lectura = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        cargado = Inventario(ruta)
+        t_carga = time.perf_counter() - inicio
+        print(f"Solo leer las líneas: {t_lectura:.2f} s | cargar con csv: {t_carga:.2f} s "
+              f"({len(cargado.productos) / t_carga:,.0f} líneas/s)")
+        assert len(cargado.productos) == n
+    finally:
+        for archivo in (ruta, ruta + ".cuarentena"):
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+
+def benchmark_paralelo(n=2_000_000, ruta="inventario_benchmark.txt", procesos=(1, 2, 4, 8)):
+    """Compara la carga secuencial con la carga en paralelo (CSV y JSON Lines)."""
+    ruta_jsonl = ruta + ".jsonl"
+    inventario = Inventario(ruta)
+    # Algunos nombres con comillas y saltos de línea, y algunos IDs repetidos: la
+    # carga en paralelo debe dar exactamente lo mismo que la secuencial
+    inventario.productos = [Producto(i % (n - 10), f"Producto {i}, talla {i % 5}" if i % 1000
+                                     else f'Producto "{i}"\nsegunda línea', i % 100, i % 1000 / 10)
+                            for i in range(n)]
+    inventario.guardar_en_archivo()
+    inventario.exportar_jsonl(ruta_jsonl)
+    inventario.productos = []
+    print(f"{n:,} productos, {os.cpu_count()} núcleo(s) disponibles")
+    try:
+        inicio = time.perf_counter()
+        secuencial = [p.to_fila() for p in Inventario(ruta).productos]
+        base = time.perf_counter() - inicio
+        print(f"Secuencial (CSV): {base:.2f} s")
+        for formato, archivo in (("csv", ruta), ("jsonl", ruta_jsonl)):
+            for cantidad in procesos:
+                inicio = time.perf_counter()
+                inventario.cargar_en_paralelo(cantidad, formato, archivo)
+                t = time.perf_counter() - inicio
+                assert [p.to_fila() for p in inventario.productos] == secuencial
+                print(f"Paralelo {formato:5} con {cantidad} proceso(s): {t:.2f} s (x{base / t:.2f})")
+
+        # Con un solo núcleo los procesos se turnan: qué parte del trabajo se reparte
+        # y qué parte queda en el proceso principal da la aceleración esperable
+        gc.disable()  # como en las cargas
+        inicio = time.perf_counter()
+        columnas = _analizar_bloque(ruta, 0, os.path.getsize(ruta), "csv", inventario.dialecto)
+        t_analisis = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        list(map(Producto, *columnas[:4]))
+        t_creacion = time.perf_counter() - inicio
+        gc.enable()
+        print(f"CSV: analizar (se reparte) {t_analisis:.2f} s, crear los Producto (proceso principal) "
+              f"{t_creacion:.2f} s")
+        print("Aceleración esperable con núcleos libres: " + ", ".join(
+            f"{c}: x{base / (t_analisis / c + t_creacion):.2f}" for c in procesos))
+    finally:
+        for archivo in (ruta, ruta_jsonl):
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+
 # -----------------------
 # Ejecución principal
 # -----------------------
 if __name__ == "__main__":
-    menu()
+    import sys
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        # python "Sistema de Gestión de Inventarios Mejorado.py" --benchmark [n]
+        benchmark_carga(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--paralelo":
+        benchmark_paralelo(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000)
+    else:
+        menu()
@@ -20,14 +20,32 @@ Sugerencia para PyCharm:
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, List, Set
+from typing import Dict, Optional, List, Set, Sequence, Tuple
+import gc
 import json
 import os
+import sys
+
+# La analítica (totales y reportes), el libro de movimientos y el acceso
+# entre procesos al archivo se comparten con la SEMANA 16
+# (al final de sys.path, para no tapar ningún módulo que ya se importe por nombre)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "UNIDAD 4", "SEMANA 16"))
+from analytics import AnaliticaInventario, IndiceStockBajo
+from ledger import LibroMovimientos
+from sorted_index import CAMPOS_ORDEN, IndicesOrden
+from interning import TablaCadenas
+from file_sync import (BloqueoArchivo, leer_generacion, leer_verificado, leer_versionado,
+                       escribir_versionado, fusionar, sin_contenido)
 
 
 # ---------------------------
 # Dominio: Clase Producto
 # ---------------------------
+# Reglas de Producto.__post_init__ con que se validó un archivo guardado por
+# este programa; si cambian, se incrementa y los archivos viejos se revalidan.
+VALIDADOR = "semana11.Producto/1"
+
+
 @dataclass
 class Producto:
     """Representa un ítem del inventario.
@@ -37,11 +55,13 @@ class Producto:
         nombre (str): Nombre comercial del producto.
         cantidad (int): Stock disponible (>= 0).
         precio (float): Precio unitario (>= 0.0).
+        umbral (int): Umbral de reposición; con cantidad < umbral el producto se avisa como stock bajo.
     """
     id: str
     nombre: str
     cantidad: int
     precio: float
+    umbral: int = 0
 
     def __post_init__(self) -> None:
         # Normalizar datos básicos y validar.
@@ -55,6 +75,8 @@ class Producto:
             raise ValueError("La cantidad debe ser un entero >= 0.")
         if not isinstance(self.precio, (int, float)) or self.precio < 0:
             raise ValueError("El precio debe ser un número >= 0.")
+        if not isinstance(self.umbral, int) or self.umbral < 0:
+            raise ValueError("El umbral debe ser un entero >= 0.")
 
     # Getters/Setters explícitos (además de dataclass) para transparencia en POO
     def set_cantidad(self, nueva_cantidad: int) -> None:
@@ -67,6 +89,11 @@ class Producto:
             raise ValueError("El precio no puede ser negativo.")
         self.precio = float(nuevo_precio)
 
+    def set_umbral(self, nuevo_umbral: int) -> None:
+        if nuevo_umbral < 0:
+            raise ValueError("El umbral no puede ser negativo.")
+        self.umbral = int(nuevo_umbral)
+
     def to_dict(self) -> Dict:
         return asdict(self)
 
@@ -77,8 +104,23 @@ class Producto:
             nombre=str(data["nombre"]),
             cantidad=int(data["cantidad"]),
             precio=float(data["precio"]),
+            umbral=int(data.get("umbral", 0)),
         )
 
+    @staticmethod
+    def from_dict_confiable(data: Dict) -> "Producto":
+        """Construye sin normalizar, convertir ni validar los campos.
+
+        Solo para registros de un archivo que leer_verificado dio por confiable
+        con VALIDADOR: se escribieron desde productos que ya pasaron por este
+        mismo __post_init__.
+        """
+        p = object.__new__(Producto)
+        p.__dict__ = data.copy()
+        if "umbral" not in data:
+            p.umbral = 0  # los archivos anteriores al umbral no lo traen
+        return p
+
 
 # ---------------------------
 # Infraestructura: Inventario (colecciones + persistencia)
@@ -89,11 +131,26 @@ class Inventario:
     Estructuras internas:
         - _items: Dict[str, Producto] -> acceso O(1) por ID.
         - _index_nombre: Dict[str, Set[str]] -> índice invertido nombre->IDs para búsquedas rápidas por nombre.
+        - nombres: TablaCadenas -> cada nombre distinto se guarda una vez, con sus minúsculas precalculadas.
+        - analitica: AnaliticaInventario -> totales O(1) y reportes por columnas.
+        - stock_bajo: IndiceStockBajo -> productos bajo su umbral; avisa al cruzarlo.
+        - orden: IndicesOrden -> índices ordenados por nombre, precio y cantidad para listar por páginas.
+        - libro: LibroMovimientos -> historial de entradas/salidas; la cantidad es su saldo.
+        - generacion, _base -> generación del archivo y registros leídos; si otro proceso
+          guardó después, guardar_en_archivo fusiona sus cambios en vez de pisarlos.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, libro: Optional[LibroMovimientos] = None) -> None:
         self._items: Dict[str, Producto] = {}
         self._index_nombre: Dict[str, Set[str]] = {}
+        self.nombres = TablaCadenas()
+        self.analitica = AnaliticaInventario()
+        self.stock_bajo = IndiceStockBajo()
+        self.orden = IndicesOrden()
+        self.libro = libro if libro is not None else LibroMovimientos(None)
+        self.generacion = 0
+        self._base: Dict[str, Dict] = {}
+        self.conflictos: List[str] = []
 
     # ------------------ Operaciones CRUD ------------------
     def agregar(self, p: Producto) -> None:
@@ -101,6 +158,10 @@ class Inventario:
             raise KeyError(f"Ya existe un producto con ID {p.id}.")
         self._items[p.id] = p
         self._indexar_nombre(p)
+        self.analitica.agregar(p.id, p.cantidad, p.precio)
+        self.stock_bajo.actualizar(p.id, p.cantidad, p.umbral)
+        self.orden.agregar(p.id, p.nombre, p.precio, p.cantidad)
+        self.libro.registrar([(p.id, p.cantidad)], "alta")
 
     def eliminar(self, id_producto: str) -> Producto:
         id_producto = id_producto.strip()
@@ -108,15 +169,45 @@ class Inventario:
             raise KeyError(f"No existe producto con ID {id_producto}.")
         prod = self._items.pop(id_producto)
         self._desindexar_nombre(prod)
+        self.analitica.eliminar(prod.id)
+        self.stock_bajo.eliminar(prod.id)
+        self.orden.eliminar(prod.id)
+        self.libro.registrar([(prod.id, -prod.cantidad)], "baja")
         return prod
 
-    def actualizar_cantidad(self, id_producto: str, nueva_cantidad: int) -> None:
+    def actualizar_cantidad(self, id_producto: str, nueva_cantidad: int, nuevo_umbral: Optional[int] = None) -> None:
+        """Fija la cantidad y, si se indica, el umbral de reposición. Con los dos, el
+        índice de stock bajo se actualiza una sola vez con los valores finales: a lo
+        sumo un aviso y nunca por un estado intermedio."""
         prod = self._obtener_por_id(id_producto)
-        prod.set_cantidad(nueva_cantidad)
+        anterior, umbral_anterior = prod.cantidad, prod.umbral
+        if nuevo_umbral is not None:
+            prod.set_umbral(nuevo_umbral)
+        try:
+            self._fijar_cantidad(prod.id, nueva_cantidad)
+        except ValueError:
+            prod.umbral = umbral_anterior
+            raise
+        self.libro.registrar([(prod.id, prod.cantidad - anterior)], "ajuste")
+
+    def aplicar_transaccion(self, movimientos: Sequence[Tuple[str, int]], motivo: str = "movimiento") -> None:
+        """Aplica varios movimientos (id, delta) como una sola operación: todos o ninguno.
+
+        Lanza KeyError si un ID no existe y ValueError si algún stock quedaría negativo.
+        """
+        self.libro.transaccion([(i.strip(), d) for i, d in movimientos], motivo,
+                               lambda i: self._obtener_por_id(i).cantidad, self._fijar_cantidad)
 
     def actualizar_precio(self, id_producto: str, nuevo_precio: float) -> None:
         prod = self._obtener_por_id(id_producto)
         prod.set_precio(nuevo_precio)
+        self.analitica.actualizar(prod.id, prod.cantidad, prod.precio)
+        self.orden.actualizar(prod.id, prod.nombre, prod.precio, prod.cantidad)
+
+    def actualizar_umbral(self, id_producto: str, nuevo_umbral: int) -> None:
+        prod = self._obtener_por_id(id_producto)
+        prod.set_umbral(nuevo_umbral)
+        self.stock_bajo.actualizar(prod.id, prod.cantidad, prod.umbral)
 
     def buscar_por_nombre(self, termino: str) -> List[Producto]:
         """Búsqueda insensible a mayúsculas; coincide por nombre completo."""
@@ -127,41 +218,131 @@ class Inventario:
     def listar_todos(self) -> List[Producto]:
         return list(self._items.values())
 
+    def listar(self, orden: str = "nombre", pagina: int = 0, tamano: int = 50,
+               descendente: bool = False) -> List[Producto]:
+        """Página `pagina` (desde 0) ordenada por 'nombre', 'precio' o 'cantidad'.
+
+        Usa los índices ordenados: O(log n + tamano), sin copiar ni ordenar todo.
+        """
+        return [self._items[i] for i in self.orden.pagina(orden, pagina, tamano, descendente)]
+
+    def numero_productos(self) -> int:
+        return len(self._items)
+
     def existe_id(self, id_producto: str) -> bool:
         return id_producto.strip() in self._items
 
     # ------------------ Persistencia en archivo ------------------
-    def guardar_en_archivo(self, ruta: str) -> None:
-        datos = [p.to_dict() for p in self.listar_todos()]
+    def guardar_en_archivo(self, ruta: str) -> List[str]:
+        """Guarda con bloqueo entre procesos, fusionando antes lo que otros hayan guardado.
+
+        Retorna los IDs que cambiaron en memoria por la fusión; los que chocaron
+        con cambios locales quedan en `conflictos` (gana la versión local).
+        """
         try:
-            with open(ruta, "w", encoding="utf-8") as f:
-                json.dump(datos, f, ensure_ascii=False, indent=2)
+            with BloqueoArchivo(ruta):
+                try:
+                    generacion, datos = leer_versionado(ruta)
+                except (ValueError, KeyError):
+                    # Archivo corrupto: se reemplaza con el estado actual
+                    generacion, datos = self.generacion, []
+                externos = self._fusionar_archivo(generacion, datos)
+                datos = [p.to_dict() for p in self.listar_todos()]
+                escribir_versionado(ruta, generacion + 1, datos, indent=2, validador=VALIDADOR)
+                self.generacion = generacion + 1
+                self._base = {d["id"]: d for d in datos}
+            # El historial de movimientos queda en disco junto con el inventario
+            self.libro.confirmar()
         except OSError as e:
             raise OSError(f"Error al guardar en '{ruta}': {e}")
-
-    def cargar_de_archivo(self, ruta: str) -> None:
-        if not os.path.exists(ruta):
-            # Si no existe, iniciar limpio sin error.
-            self._items.clear()
-            self._index_nombre.clear()
-            return
+        return externos
+
+    def recargar_cambios(self, ruta: str) -> List[str]:
+        """Trae lo guardado por otros procesos sin escribir; solo toca los productos que cambiaron.
+        Un archivo borrado o vacío no cuenta como cambio."""
+        if sin_contenido(ruta) or leer_generacion(ruta) == self.generacion:
+            return []
+        with BloqueoArchivo(ruta):
+            generacion, datos = leer_versionado(ruta)
+        externos = self._fusionar_archivo(generacion, datos)
+        self.generacion = generacion
+        self._base = {d["id"]: d for d in datos}
+        return externos
+
+    def cargar_de_archivo(self, ruta: str, confiar: bool = True) -> None:
+        """Carga el inventario. Si el archivo lo guardó este programa (validador,
+        esquema y suma CRC32 correctos) y `confiar` es True, los productos se
+        construyen sin revalidarlos."""
+        # Si no existe, se inicia limpio sin error (generación 0).
         try:
-            with open(ruta, "r", encoding="utf-8") as f:
-                datos = json.load(f)
-        except json.JSONDecodeError:
+            with BloqueoArchivo(ruta):
+                generacion, datos, confiable = leer_verificado(ruta, VALIDADOR)
+        except (json.JSONDecodeError, KeyError):
             raise ValueError("El archivo de datos está corrupto o no es JSON válido.")
         except OSError as e:
             raise OSError(f"Error al leer '{ruta}': {e}")
 
-        # Reconstruir estructuras
-        self._items.clear()
-        self._index_nombre.clear()
-        for entry in datos:
-            p = Producto.from_dict(entry)
-            self._items[p.id] = p
-            self._indexar_nombre(p)
+        # Los productos no forman ciclos: pausar el recolector evita que recorra
+        # una y otra vez los millones de objetos recién creados durante la carga
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            # Reconstruir estructuras
+            self._items.clear()
+            self._index_nombre.clear()
+            crear = Producto.from_dict_confiable if confiar and confiable else Producto.from_dict
+            for entry in datos:
+                p = crear(entry)
+                self._items[p.id] = p
+                self._indexar_nombre(p)
+            self.generacion = generacion
+            self._base = {d["id"]: d for d in datos}
+            self.analitica.reconstruir((p.id, p.cantidad, p.precio) for p in self._items.values())
+            self.stock_bajo.reconstruir((p.id, p.cantidad, p.umbral) for p in self._items.values())
+            self.orden.reconstruir((p.id, p.nombre, p.precio, p.cantidad) for p in self._items.values())
+        finally:
+            if recolector_activo:
+                gc.enable()
+        # Un libro recién creado parte del stock cargado como saldo de apertura
+        self.libro.abrir_saldos((p.id, p.cantidad) for p in self._items.values())
 
     # ------------------ Utilidades internas ------------------
+    def _fusionar_archivo(self, generacion: int, datos: List[Dict]) -> List[str]:
+        if generacion == self.generacion:
+            return []
+        mios = {i: p.to_dict() for i, p in self._items.items()}
+        fusion, self.conflictos = fusionar(self._base, mios, {d["id"]: d for d in datos})
+        externos = [i for i in list(fusion) + [i for i in mios if i not in fusion]
+                    if fusion.get(i) != mios.get(i)]
+        for id_producto in externos:
+            self._aplicar_registro(id_producto, fusion.get(id_producto))
+        return externos
+
+    def _aplicar_registro(self, id_producto: str, datos: Optional[Dict]) -> None:
+        """Aplica un registro guardado por otro proceso (None = eliminado) sin anotarlo
+        en el libro: ese proceso ya registró el movimiento."""
+        anterior = self._items.pop(id_producto, None)
+        if anterior is not None:
+            self._desindexar_nombre(anterior)
+            self.analitica.eliminar(id_producto)
+            self.orden.eliminar(id_producto)
+        if datos is None:
+            self.stock_bajo.eliminar(id_producto)
+            return
+        p = Producto.from_dict(datos)
+        self._items[p.id] = p
+        self._indexar_nombre(p)
+        self.analitica.agregar(p.id, p.cantidad, p.precio)
+        self.orden.agregar(p.id, p.nombre, p.precio, p.cantidad)
+        self.stock_bajo.actualizar(p.id, p.cantidad, p.umbral)
+
+    def _fijar_cantidad(self, id_producto: str, cantidad: int) -> None:
+        prod = self._items[id_producto]
+        prod.set_cantidad(cantidad)
+        self.analitica.actualizar(prod.id, prod.cantidad, prod.precio)
+        self.stock_bajo.actualizar(prod.id, prod.cantidad, prod.umbral)
+        self.orden.actualizar(prod.id, prod.nombre, prod.precio, prod.cantidad)
+
     def _obtener_por_id(self, id_producto: str) -> Producto:
         id_producto = id_producto.strip()
         if id_producto not in self._items:
@@ -169,7 +350,10 @@ class Inventario:
         return self._items[id_producto]
 
     def _indexar_nombre(self, p: Producto) -> None:
-        clave = p.nombre.lower()
+        # El producto pasa a compartir la cadena de la tabla (los nombres se repiten mucho)
+        codigo = self.nombres.codificar(p.nombre)
+        p.nombre = self.nombres.cadena(codigo)
+        clave = self.nombres.minusculas(codigo)
         if clave not in self._index_nombre:
             self._index_nombre[clave] = set()
         self._index_nombre[clave].add(p.id)
@@ -187,6 +371,8 @@ class Inventario:
 # Interfaz de usuario (CLI)
 # ---------------------------
 ARCHIVO_DATOS_POR_DEFECTO = "inventory_data.json"
+ARCHIVO_MOVIMIENTOS = "inventory_movements.jsonl"
+TAMANO_PAGINA = 50
 
 def _input_no_vacio(mensaje: str) -> str:
     while True:
@@ -222,12 +408,53 @@ def _input_flotante(mensaje: str, minimo: Optional[float] = None) -> float:
             print("⚠ Ingresa un número válido (usa punto decimal).")
 
 
+def _input_entero_opcional(mensaje: str, minimo: int = 0) -> Optional[int]:
+    """Como _input_entero, pero Enter vacío retorna None."""
+    while True:
+        raw = input(mensaje).strip()
+        if not raw:
+            return None
+        try:
+            val = int(raw)
+            if val < minimo:
+                print(f"⚠ Debe ser un entero >= {minimo}.")
+                continue
+            return val
+        except ValueError:
+            print("⚠ Ingresa un número entero válido.")
+
+
 def mostrar_producto(p: Producto) -> None:
-    print(f"ID: {p.id} | Nombre: {p.nombre} | Cantidad: {p.cantidad} | Precio: {p.precio:.2f}")
+    print(f"ID: {p.id} | Nombre: {p.nombre} | Cantidad: {p.cantidad} | Precio: {p.precio:.2f} | Umbral: {p.umbral}")
+
+
+def avisar_stock_bajo(idp: str, margen: int, bajo: bool) -> None:
+    """Suscriptor del índice de stock bajo: avisa en consola al cruzar el umbral."""
+    if bajo:
+        print(f"🔔 Stock bajo: ID {idp} quedó {-margen} unidad(es) por debajo de su umbral.")
+
+
+def mostrar_reportes(inv: Inventario, umbral: int = 5, top: int = 5) -> None:
+    a = inv.analitica
+    print(f"Productos: {a.numero_productos()} | Unidades: {a.total_unidades} | Valor total: {a.valor_total:.2f}")
+    print("Productos por banda de precio:")
+    for banda, cantidad in a.conteo_por_banda().items():
+        print(f"  {banda:>10}: {cantidad}")
+    print(f"Top {top} por valor en stock:")
+    for idp, valor in a.top_por_valor(top):
+        print(f"  ID {idp}: {valor:.2f}")
+    reponer = a.reorden(umbral)
+    print(f"Para reponer (cantidad < {umbral}): {len(reponer)}")
+    for idp, cantidad in reponer:
+        print(f"  ID {idp}: {cantidad} unidades")
+    print(f"Bajo su propio umbral de reposición: {len(inv.stock_bajo)}")
+    for idp, margen in inv.stock_bajo.mas_criticos(top):
+        print(f"  ID {idp}: faltan {-margen} unidad(es)")
 
 
 def menu() -> None:
-    inv = Inventario()
+    inv = Inventario(LibroMovimientos(ARCHIVO_MOVIMIENTOS))
+    inv.stock_bajo.suscribir(avisar_stock_bajo)
 
     # Cargar datos iniciales
     try:
@@ -240,14 +467,15 @@ def menu() -> None:
         print("\n==== Menú Inventario ====")
         print("1) Añadir producto")
         print("2) Eliminar producto por ID")
-        print("3) Actualizar cantidad")
+        print("3) Actualizar cantidad (y umbral de reposición)")
         print("4) Actualizar precio")
         print("5) Buscar por nombre")
         print("6) Mostrar todos")
         print("7) Guardar en archivo")
-        print("8) Salir")
+        print("8) Reportes (valor, bandas de precio, reposición)")
+        print("9) Salir")
 
-        opcion = _input_no_vacio("Elige una opción (1-8): ")
+        opcion = _input_no_vacio("Elige una opción (1-9): ")
 
         try:
             if opcion == "1":
@@ -258,7 +486,8 @@ def menu() -> None:
                 nombre = _input_no_vacio("Nombre: ")
                 cantidad = _input_entero("Cantidad (>=0): ", minimo=0)
                 precio = _input_flotante("Precio (>=0): ", minimo=0.0)
-                inv.agregar(Producto(id=idp, nombre=nombre, cantidad=cantidad, precio=precio))
+                umbral = _input_entero_opcional("Umbral de reposición (Enter = 0): ") or 0
+                inv.agregar(Producto(id=idp, nombre=nombre, cantidad=cantidad, precio=precio, umbral=umbral))
                 inv.guardar_en_archivo(ARCHIVO_DATOS_POR_DEFECTO)  # autosave
                 print("✔ Producto añadido y guardado.")
 
@@ -272,7 +501,8 @@ def menu() -> None:
             elif opcion == "3":
                 idp = _input_no_vacio("ID a actualizar cantidad: ")
                 nueva = _input_entero("Nueva cantidad (>=0): ", minimo=0)
-                inv.actualizar_cantidad(idp, nueva)
+                umbral = _input_entero_opcional("Nuevo umbral de reposición (Enter = sin cambio): ")
+                inv.actualizar_cantidad(idp, nueva, umbral)
                 inv.guardar_en_archivo(ARCHIVO_DATOS_POR_DEFECTO)
                 print("✔ Cantidad actualizada.")
 
@@ -293,13 +523,21 @@ def menu() -> None:
                         mostrar_producto(p)
 
             elif opcion == "6":
-                productos = inv.listar_todos()
-                if not productos:
+                if not inv.numero_productos():
                     print("(inventario vacío)")
-                else:
-                    # Orden estable por nombre y luego ID para lectura más cómoda
-                    for p in sorted(productos, key=lambda x: (x.nombre.lower(), x.id)):
+                    continue
+                orden = input(f"Ordenar por ({'/'.join(CAMPOS_ORDEN)}, Enter = nombre): ").strip().lower() or "nombre"
+                if orden not in CAMPOS_ORDEN:
+                    print("⚠ Orden inválido.")
+                    continue
+                # Se muestra página por página; cada página sale de los índices ordenados
+                paginas = (inv.numero_productos() + TAMANO_PAGINA - 1) // TAMANO_PAGINA
+                for pagina in range(paginas):
+                    print(f"-- Página {pagina + 1} de {paginas} --")
+                    for p in inv.listar(orden, pagina, TAMANO_PAGINA):
                         mostrar_producto(p)
+                    if pagina + 1 < paginas and input("Enter = siguiente página, q = volver: ").strip().lower() == "q":
+                        break
 
             elif opcion == "7":
                 ruta = input(f"Ruta (Enter = {ARCHIVO_DATOS_POR_DEFECTO}): ").strip() or ARCHIVO_DATOS_POR_DEFECTO
@@ -307,6 +545,10 @@ def menu() -> None:
                 print(f"✔ Guardado en '{ruta}'.")
 
             elif opcion == "8":
+                umbral = _input_entero("Umbral de reposición (>=0): ", minimo=0)
+                mostrar_reportes(inv, umbral)
+
+            elif opcion == "9":
                 # Guardado final
                 try:
                     inv.guardar_en_archivo(ARCHIVO_DATOS_POR_DEFECTO)
@@ -317,7 +559,7 @@ def menu() -> None:
                 break
 
             else:
-                print("⚠ Opción inválida. Elige entre 1 y 8.")
+                print("⚠ Opción inválida. Elige entre 1 y 9.")
 
         except (ValueError, KeyError) as e:
             # Errores de validación o claves inexistentes
@@ -330,6 +572,36 @@ def menu() -> None:
             print(f"⚠ Ocurrió un error inesperado: {e}")
 
 
+# ---------------------------
+# Perfil de la carga
+# ---------------------------
+def perfilar_carga(n: int = 1_000_000, lineas: int = 8) -> None:
+    """Carga un archivo con n productos validando cada uno y con la construcción
+    confiable; muestra el tiempo total y, con cProfile, en qué se va."""
+    import cProfile
+    import pstats
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "inventario.json")
+        # Los registros salen de productos validados, como al guardar desde el menú
+        escribir_versionado(ruta, 1, [Producto(f"SKU{i}", f"Producto {i % 1000}", i % 500, (i % 1000) / 10,
+                                               i % 7).to_dict() for i in range(n)],
+                            indent=2, validador=VALIDADOR)
+        for titulo, confiar in (("Validando cada producto", False), ("Construcción confiable", True)):
+            inicio = time.perf_counter()
+            Inventario().cargar_de_archivo(ruta, confiar=confiar)
+            print(f"\n=== {titulo}: {time.perf_counter() - inicio:.2f} s con {n:,} productos ===")
+            perfil = cProfile.Profile()
+            perfil.runcall(Inventario().cargar_de_archivo, ruta, confiar=confiar)
+            pstats.Stats(perfil).strip_dirs().sort_stats("tottime").print_stats(lineas)
+
+
 # Punto de entrada
 if __name__ == "__main__":
-    menu()
+    if len(sys.argv) > 1 and sys.argv[1] == "--perfil":
+        # python "Sistema Avanzado de Gestión de Inventario.py" --perfil [n]
+        perfilar_carga(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        menu()
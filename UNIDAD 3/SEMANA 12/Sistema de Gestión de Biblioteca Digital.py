@@ -1,6 +1,13 @@
 # ===========================================
 # Sistema de Gestión de Biblioteca Digital
 # ===========================================
+import os
+import sys
+
+# La tabla de cadenas (autores y categorías codificados) se comparte con la SEMANA 16
+# (al final de sys.path, para no tapar ningún módulo que ya se importe por nombre)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "UNIDAD 4", "SEMANA 16"))
+from interning import TablaCadenas
 
 # Clase Libro: representa un libro dentro de la biblioteca
 class Libro:
@@ -9,6 +16,9 @@ class Libro:
         self.datos = (titulo, autor)
         self.categoria = categoria
         self.isbn = isbn
+        # Códigos de autor y categoría en las tablas de la biblioteca (se asignan al agregarlo)
+        self.cod_autor = None
+        self.cod_categoria = None
 
     def __str__(self):
         return f"{self.datos[0]} de {self.datos[1]} | Categoría: {self.categoria} | ISBN: {self.isbn}"
@@ -31,17 +41,38 @@ class Biblioteca:
         self.libros = {}        # Diccionario {isbn: objeto Libro}
         self.usuarios = {}      # Diccionario {id_usuario: objeto Usuario}
         self.ids_usuarios = set()  # Conjunto para asegurar IDs únicos
+        # Cada autor y categoría distintos se guardan una sola vez, con un código entero
+        self.autores = TablaCadenas()
+        self.categorias = TablaCadenas()
 
     # =====================
     # Métodos para Libros
     # =====================
     def agregar_libro(self, libro):
         if libro.isbn not in self.libros:
+            self._codificar(libro)
             self.libros[libro.isbn] = libro
             print(f"Libro agregado: {libro}")
         else:
             print("Ese libro ya existe en el catálogo.")
 
+    def agregar_libros(self, libros):
+        """Carga masiva sin mensajes; retorna cuántos libros se agregaron."""
+        agregados = 0
+        for libro in libros:
+            if libro.isbn not in self.libros:
+                self._codificar(libro)
+                self.libros[libro.isbn] = libro
+                agregados += 1
+        return agregados
+
+    def _codificar(self, libro):
+        # El libro pasa a usar las cadenas compartidas de las tablas
+        libro.cod_autor = self.autores.codificar(libro.datos[1])
+        libro.cod_categoria = self.categorias.codificar(libro.categoria)
+        libro.datos = (libro.datos[0], self.autores.cadena(libro.cod_autor))
+        libro.categoria = self.categorias.cadena(libro.cod_categoria)
+
     def quitar_libro(self, isbn):
         if isbn in self.libros:
             eliminado = self.libros.pop(isbn)
@@ -50,15 +81,21 @@ class Biblioteca:
             print("No se encontró un libro con ese ISBN.")
 
     def buscar_libro(self, criterio, valor):
-        resultados = []
-        for libro in self.libros.values():
-            if criterio == "titulo" and valor.lower() in libro.datos[0].lower():
-                resultados.append(libro)
-            elif criterio == "autor" and valor.lower() in libro.datos[1].lower():
-                resultados.append(libro)
-            elif criterio == "categoria" and valor.lower() in libro.categoria.lower():
-                resultados.append(libro)
-        return resultados
+        valor = valor.lower()
+        if criterio == "titulo":
+            return [libro for libro in self.libros.values() if valor in libro.datos[0].lower()]
+        # Autor y categoría: se filtran las cadenas distintas una vez y luego se comparan códigos
+        if criterio == "autor":
+            return self._filtrar_por_codigo("cod_autor", self.autores.codigos_que_contienen(valor))
+        if criterio == "categoria":
+            return self._filtrar_por_codigo("cod_categoria", self.categorias.codigos_que_contienen(valor))
+        return []
+
+    def _filtrar_por_codigo(self, atributo, codigos):
+        if not codigos:
+            return []
+        # Comparar un entero contra un conjunto pequeño, en vez de bajar a minúsculas cada cadena
+        return [libro for libro in self.libros.values() if getattr(libro, atributo) in codigos]
 
     # =====================
     # Métodos para Usuarios
@@ -123,10 +160,54 @@ class Biblioteca:
             print(f"{usuario.nombre} no tiene libros prestados.")
 
 
+# =====================
+# BENCHMARK
+# =====================
+def benchmark_catalogo(n=5_000_000):
+    """Catálogo sintético con autores y categorías muy repetidos: memoria de esas
+    cadenas y tiempo de búsqueda antes y después de codificarlas en las tablas."""
+    import time
+
+    autores = [f"Autor {i} Apellido{i % 97}" for i in range(20_000)]
+    categorias = ["Novela", "Fábula", "Tecnología", "Historia", "Poesía", "Ciencia", "Ensayo", "Infantil"]
+    libros = []
+    for i in range(n):
+        # Se separa cada línea como al leer un archivo: cada libro recibe sus propias cadenas
+        linea = f"Título {i};{autores[i % len(autores)]};{categorias[i % len(categorias)]};{i}"
+        libros.append(Libro(*linea.split(";")))
+
+    antes = sum(sys.getsizeof(l.datos[1]) + sys.getsizeof(l.categoria) for l in libros)
+    inicio = time.perf_counter()
+    por_autor = [l for l in libros if "apellido7" in l.datos[1].lower()]
+    por_categoria = [l for l in libros if "novela" in l.categoria.lower()]
+    t_antes = time.perf_counter() - inicio
+
+    biblio = Biblioteca()
+    inicio = time.perf_counter()
+    biblio.agregar_libros(libros)
+    t_carga = time.perf_counter() - inicio
+    # Tras codificar, los libros comparten las cadenas de las tablas
+    despues = sum(sys.getsizeof(biblio.autores.cadena(c)) for c in range(len(biblio.autores)))
+    despues += sum(sys.getsizeof(biblio.categorias.cadena(c)) for c in range(len(biblio.categorias)))
+    inicio = time.perf_counter()
+    assert len(biblio.buscar_libro("autor", "apellido7")) == len(por_autor)
+    assert len(biblio.buscar_libro("categoria", "novela")) == len(por_categoria)
+    t_despues = time.perf_counter() - inicio
+
+    print(f"{n:,} libros, {len(biblio.autores):,} autores y {len(biblio.categorias)} categorías distintas")
+    print(f"Cadenas de autor y categoría: {antes / 2**20:,.1f} MiB -> {despues / 2**20:,.2f} MiB")
+    print(f"Carga con codificación: {t_carga:.2f} s")
+    print(f"Búsqueda por autor + categoría: {t_antes:.2f} s comparando cadenas -> "
+          f"{t_despues:.2f} s comparando códigos")
+
+
 # =====================
 # PRUEBAS DEL SISTEMA
 # =====================
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+    # python "Sistema de Gestión de Biblioteca Digital.py" --benchmark [n]
+    benchmark_catalogo(int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000)
+elif __name__ == "__main__":
     # Crear biblioteca
     biblio = Biblioteca()
 
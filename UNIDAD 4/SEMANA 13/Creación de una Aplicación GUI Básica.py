@@ -1,6 +1,12 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import messagebox
 
+# historial.py está en la carpeta UNIDAD 4 y lo comparten las aplicaciones de la unidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from historial import Historial, Cambio
+
 # ------------------------
 # Aplicación GUI con Tkinter
 # ------------------------
@@ -9,7 +15,9 @@ def agregar_dato():
     """Toma el texto del campo de entrada y lo agrega a la lista si no está vacío."""
     texto = entrada.get().strip()
     if texto:
+        posicion = lista_datos.size()
         lista_datos.insert(tk.END, texto)
+        historial.registrar("Agregar", [Cambio(posicion, None, texto)])
         entrada.delete(0, tk.END)  # limpia el campo de texto
     else:
         messagebox.showwarning("Entrada vacía", "Por favor, ingrese un dato antes de agregar.")
@@ -18,16 +26,39 @@ def limpiar_datos():
     """Elimina el ítem seleccionado o toda la lista si no hay selección."""
     seleccion = lista_datos.curselection()
     if seleccion:
-        lista_datos.delete(seleccion)
+        posiciones = [seleccion[0]]
     else:
-        lista_datos.delete(0, tk.END)
+        posiciones = range(lista_datos.size())
+    # Se borra desde el final para que las posiciones guardadas sigan siendo válidas
+    cambios = [Cambio(i, lista_datos.get(i), None) for i in reversed(posiciones)]
+    for c in cambios:
+        lista_datos.delete(c.clave)
+    historial.registrar("Limpiar", cambios)
+
+def aplicar_cambio(posicion, actual, nuevo):
+    """Lleva la fila `posicion` del valor `actual` al valor `nuevo` (None = sin fila)."""
+    if actual is not None:
+        lista_datos.delete(posicion)
+    if nuevo is not None:
+        lista_datos.insert(posicion, nuevo)
+
+def deshacer(event=None):
+    """Revierte la última operación (también recupera lo borrado con Limpiar)."""
+    historial.deshacer()
+
+def rehacer(event=None):
+    """Vuelve a aplicar la última operación deshecha."""
+    historial.rehacer()
+
+# Historial de operaciones para deshacer/rehacer
+historial = Historial(aplicar_cambio)
 
 # ------------------------
 # Configuración de la ventana principal
 # ------------------------
 ventana = tk.Tk()
 ventana.title("Gestor de Datos Básico")
-ventana.geometry("400x300")
+ventana.geometry("400x340")
 ventana.resizable(False, False)
 
 # ------------------------
@@ -53,6 +84,14 @@ lista_datos.grid(row=2, column=0, columnspan=2, padx=10, pady=10)
 btn_limpiar = tk.Button(ventana, text="Limpiar", command=limpiar_datos)
 btn_limpiar.grid(row=3, column=0, columnspan=2, pady=10)
 
+# Botones Deshacer / Rehacer (también Ctrl+Z / Ctrl+Y)
+btn_deshacer = tk.Button(ventana, text="Deshacer", command=deshacer)
+btn_deshacer.grid(row=4, column=0, pady=5)
+btn_rehacer = tk.Button(ventana, text="Rehacer", command=rehacer)
+btn_rehacer.grid(row=4, column=1, pady=5)
+ventana.bind("<Control-z>", deshacer)
+ventana.bind("<Control-y>", rehacer)
+
 # ------------------------
 # Bucle principal
 # ------------------------
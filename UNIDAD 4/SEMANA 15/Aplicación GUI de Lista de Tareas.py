@@ -1,16 +1,47 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import messagebox
+from tareas import Tarea, ListaTareas, RepositorioTareas, PRIORIDADES, PENDIENTE, COMPLETADA
+
+# historial.py está en la carpeta UNIDAD 4 y lo comparten las aplicaciones de la unidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from historial import Historial, Cambio
+
+# Junto al script: así la lista es la misma sin importar desde dónde se abra (p. ej. Dashboard.py)
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.jsonl")
+
+# Colores por estado/prioridad de cada fila del Listbox
+COLOR_COMPLETADA = "gray"
+COLORES_PRIORIDAD = {"baja": "dark green", "media": "black", "alta": "red"}
+
+# Máximo de filas en el Listbox y espera tras la última tecla antes de filtrar
+LIMITE_FILAS = 1000
+RETARDO_FILTRO_MS = 150
+# Pausa entre pasos de una búsqueda larga: deja pasar los eventos pendientes
+PAUSA_PASO_MS = 1
 
 
 class ListaTareasApp:
-    def __init__(self, root):
+    def __init__(self, root, modelo=None):
         self.root = root
         self.root.title("Lista de Tareas")
-        self.root.geometry("400x400")
+        self.root.geometry("400x560")
         self.root.resizable(False, False)
 
-        # Lista donde se almacenarán las tareas
-        self.tareas = []
+        # Modelo con las tareas (estado, prioridad y fechas) persistido en disco
+        self.modelo = modelo if modelo is not None else ListaTareas(RepositorioTareas(ARCHIVO_TAREAS))
+        # Lista donde se almacenarán las tareas (misma lista que usa el modelo)
+        self.tareas = self.modelo.tareas
+        # Tareas visibles: la fila i del Listbox muestra self.filas[i]
+        self.filas = []
+        self.total_coincidencias = 0
+        self._filtro_programado = None
+        # Búsqueda en curso (generador de modelo.buscar_por_pasos) y su próximo paso
+        self._busqueda = None
+        self._paso_programado = None
+        # Historial de deshacer/rehacer: cada cambio guarda solo la tarea afectada
+        self.historial = Historial(self.aplicar_cambio)
 
         # Campo de entrada para escribir nuevas tareas
         self.entrada_tarea = tk.Entry(root, width=35, font=("Arial", 12))
@@ -19,6 +50,10 @@ class ListaTareasApp:
         # Permitir añadir con tecla ENTER
         self.entrada_tarea.bind("<Return>", self.agregar_tarea_evento)
 
+        # Selector de prioridad para las nuevas tareas
+        self.prioridad = tk.StringVar(value="media")
+        tk.OptionMenu(root, self.prioridad, *PRIORIDADES).pack()
+
         # Botones principales
         self.boton_agregar = tk.Button(root, text="Añadir Tarea", command=self.agregar_tarea)
         self.boton_agregar.pack(pady=5)
@@ -29,13 +64,42 @@ class ListaTareasApp:
         self.boton_eliminar = tk.Button(root, text="Eliminar Tarea", command=self.eliminar_tarea)
         self.boton_eliminar.pack(pady=5)
 
+        frame_historial = tk.Frame(root)
+        frame_historial.pack()
+        tk.Button(frame_historial, text="Deshacer", command=self.deshacer).pack(side=tk.LEFT, padx=5)
+        tk.Button(frame_historial, text="Rehacer", command=self.rehacer).pack(side=tk.LEFT, padx=5)
+        self.root.bind("<Control-z>", self.deshacer)
+        self.root.bind("<Control-y>", self.rehacer)
+
+        # Búsqueda: se filtra mientras se escribe
+        frame_filtro = tk.Frame(root)
+        frame_filtro.pack(pady=5)
+        tk.Label(frame_filtro, text="Buscar:").pack(side=tk.LEFT)
+        self.entrada_busqueda = tk.Entry(frame_filtro, width=30)
+        self.entrada_busqueda.pack(side=tk.LEFT)
+        self.entrada_busqueda.bind("<KeyRelease>", self.programar_filtro)
+
+        # Filtro por estado
+        frame_estado = tk.Frame(root)
+        frame_estado.pack()
+        self.estado = tk.StringVar(value="")
+        for texto, valor in (("Todas", ""), ("Pendientes", PENDIENTE), ("Completadas", COMPLETADA)):
+            tk.Radiobutton(frame_estado, text=texto, variable=self.estado, value=valor,
+                           command=self.renderizar).pack(side=tk.LEFT)
+
         # Lista donde se muestran las tareas
         self.lista_tareas = tk.Listbox(root, width=50, height=15, selectmode=tk.SINGLE)
-        self.lista_tareas.pack(pady=10)
+        self.lista_tareas.pack(pady=(10, 0))
+        self.etiqueta_total = tk.Label(root, anchor="w")
+        self.etiqueta_total.pack(fill=tk.X, padx=12)
 
         # Evento opcional: doble clic para marcar tarea como completada
         self.lista_tareas.bind("<Double-1>", self.marcar_completada_evento)
 
+        # Mostrar las tareas guardadas y guardar el diario al cerrar la ventana
+        self.renderizar()
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
+
     # ------------------ Funciones de la lógica ------------------
 
     def agregar_tarea_evento(self, event):
@@ -44,10 +108,17 @@ class ListaTareasApp:
 
     def agregar_tarea(self):
         """Agrega la tarea escrita en el campo de entrada a la lista."""
-        tarea = self.entrada_tarea.get().strip()
-        if tarea:  # Solo se añade si no está vacío
-            self.tareas.append(tarea)
-            self.lista_tareas.insert(tk.END, tarea)
+        texto = self.entrada_tarea.get().strip()
+        if texto:  # Solo se añade si no está vacío
+            tarea = self.modelo.agregar(texto, self.prioridad.get())
+            self.historial.registrar("Añadir", [Cambio(tarea.id, None, tarea.to_dict())])
+            if self.modelo.coincide(tarea, self.entrada_busqueda.get(), self.estado.get() or None):
+                self.total_coincidencias += 1
+                if len(self.filas) < LIMITE_FILAS:
+                    self.filas.append(tarea)
+                    self.lista_tareas.insert(tk.END, tarea.texto)
+                    self.pintar_fila(len(self.filas) - 1)
+                self.actualizar_total()
             self.entrada_tarea.delete(0, tk.END)  # Limpiar el campo de entrada
         else:
             messagebox.showwarning("Atención", "No se puede añadir una tarea vacía.")
@@ -57,17 +128,19 @@ class ListaTareasApp:
         self.marcar_completada()
 
     def marcar_completada(self):
-        """Cambia el estado de la tarea seleccionada a 'completada' visualmente."""
+        """Cambia el estado de la tarea seleccionada a 'completada'."""
         seleccion = self.lista_tareas.curselection()
         if seleccion:
             indice = seleccion[0]
-            tarea = self.lista_tareas.get(indice)
-
-            # Revisar si ya está marcada como completada
-            if not tarea.startswith("[✔] "):
-                tarea_completada = "[✔] " + tarea
-                self.lista_tareas.delete(indice)
-                self.lista_tareas.insert(indice, tarea_completada)
+            tarea = self.filas[indice]
+            antes = tarea.to_dict()
+            # Solo se repinta la fila si el estado realmente cambió
+            if self.modelo.marcar_completada(tarea.id):
+                self.historial.registrar("Completar", [Cambio(tarea.id, antes, tarea.to_dict())])
+                if self.estado.get() == PENDIENTE:
+                    self.quitar_fila(indice)
+                else:
+                    self.pintar_fila(indice)
         else:
             messagebox.showinfo("Información", "Selecciona una tarea para marcarla como completada.")
 
@@ -76,14 +149,171 @@ class ListaTareasApp:
         seleccion = self.lista_tareas.curselection()
         if seleccion:
             indice = seleccion[0]
-            self.lista_tareas.delete(indice)
-            del self.tareas[indice]
+            tarea = self.modelo.eliminar(self.filas[indice].id)
+            self.historial.registrar("Eliminar", [Cambio(tarea.id, tarea.to_dict(), None)])
+            self.quitar_fila(indice)
         else:
             messagebox.showinfo("Información", "Selecciona una tarea para eliminarla.")
 
+    def deshacer(self, event=None):
+        """Revierte la última operación sobre las tareas."""
+        if self.historial.deshacer():
+            self.renderizar()
+
+    def rehacer(self, event=None):
+        """Vuelve a aplicar la última operación deshecha."""
+        if self.historial.rehacer():
+            self.renderizar()
+
+    def aplicar_cambio(self, id_, actual, nuevo):
+        """Lleva la tarea `id_` del estado `actual` al `nuevo` (None = no existe)."""
+        if nuevo is None:
+            self.modelo.eliminar(id_)
+        elif actual is None:
+            self.modelo.restaurar(Tarea.from_dict(nuevo))
+        else:
+            self.modelo.reemplazar(Tarea.from_dict(nuevo))
+
+    # ------------------ Vista ------------------
+
+    def programar_filtro(self, event=None):
+        """Reinicia la espera en cada tecla: solo se filtra cuando el usuario hace una pausa."""
+        if self._filtro_programado is not None:
+            self.root.after_cancel(self._filtro_programado)
+        self._filtro_programado = self.root.after(RETARDO_FILTRO_MS, self.renderizar)
+
+    def renderizar(self):
+        """Empieza a buscar las tareas que pasan el filtro actual. La búsqueda avanza
+        por pasos cortos entre eventos; al terminar se llena el Listbox."""
+        self._filtro_programado = None
+        self._cancelar_busqueda()
+        self._busqueda = self.modelo.buscar_por_pasos(
+            self.entrada_busqueda.get(), self.estado.get() or None, LIMITE_FILAS)
+        self._avanzar_busqueda()
+
+    def _avanzar_busqueda(self):
+        """Un paso de la búsqueda en curso; si no terminó, programa el siguiente."""
+        self._paso_programado = None
+        resultado = next(self._busqueda)
+        if resultado is None:
+            self._paso_programado = self.root.after(PAUSA_PASO_MS, self._avanzar_busqueda)
+        else:
+            self._busqueda = None
+            self.mostrar_filas(*resultado)
+
+    def _cancelar_busqueda(self):
+        if self._paso_programado is not None:
+            self.root.after_cancel(self._paso_programado)
+            self._paso_programado = None
+        self._busqueda = None
+
+    def terminar_busqueda(self):
+        """Completa ya la búsqueda en curso, si hay una (sin esperar a los eventos)."""
+        if self._busqueda is not None:
+            busqueda = self._busqueda
+            self._cancelar_busqueda()
+            self.mostrar_filas(*next(r for r in busqueda if r is not None))
+
+    def mostrar_filas(self, filas, total):
+        """Vuelve a llenar el Listbox con `filas` (de `total` coincidencias)."""
+        self.filas, self.total_coincidencias = filas, total
+        self.lista_tareas.delete(0, tk.END)
+        if self.filas:
+            self.lista_tareas.insert(tk.END, *[t.texto for t in self.filas])
+        for indice in range(len(self.filas)):
+            self.pintar_fila(indice)
+        self.actualizar_total()
+
+    def quitar_fila(self, indice):
+        """Quita una fila de la vista; si había coincidencias ocultas, rellena la lista."""
+        del self.filas[indice]
+        self.lista_tareas.delete(indice)
+        self.total_coincidencias -= 1
+        if len(self.filas) < min(self.total_coincidencias, LIMITE_FILAS):
+            self.renderizar()
+        else:
+            self.actualizar_total()
+
+    def actualizar_total(self):
+        self.etiqueta_total.config(
+            text=f"Mostrando {len(self.filas)} de {self.total_coincidencias} tareas")
+
+    def pintar_fila(self, indice):
+        """Actualiza el color de una sola fila según el estado de su tarea."""
+        tarea = self.filas[indice]
+        color = COLOR_COMPLETADA if tarea.completada else COLORES_PRIORIDAD[tarea.prioridad]
+        self.lista_tareas.itemconfig(indice, fg=color, selectforeground=color)
+
+    def verificar_sincronia(self):
+        """Retorna True si el Listbox muestra exactamente las tareas que el modelo filtra
+        (antes completa la búsqueda en curso)."""
+        self.terminar_busqueda()
+        esperadas, total = self.modelo.buscar(
+            self.entrada_busqueda.get(), self.estado.get() or None, LIMITE_FILAS)
+        if esperadas != self.filas or total != self.total_coincidencias:
+            return False
+        filas = self.lista_tareas.get(0, tk.END)
+        if len(filas) != len(self.filas):
+            return False
+        for indice, (fila, tarea) in enumerate(zip(filas, self.filas)):
+            color = COLOR_COMPLETADA if tarea.completada else COLORES_PRIORIDAD[tarea.prioridad]
+            if fila != tarea.texto or self.lista_tareas.itemcget(indice, "fg") != color:
+                return False
+        return True
+
+    def cerrar(self):
+        """Sincroniza el diario de tareas en disco y cierra la ventana."""
+        self._cancelar_busqueda()
+        self.modelo.cerrar()
+        self.root.destroy()
+
+
+# ------------------ Prueba de estrés ------------------
+def estres_sincronia(operaciones=2000, semilla=15):
+    """Aplica operaciones al azar sobre la ventana (sin mostrarla) y, después de
+    cada una, comprueba con verificar_sincronia que el Listbox y el modelo coinciden."""
+    import random
+
+    random.seed(semilla)
+    root = tk.Tk()
+    root.withdraw()
+    app = ListaTareasApp(root, ListaTareas())  # sin diario: no toca tareas.jsonl
+    palabras = ("comprar", "pan", "llamar", "médico", "pagar", "luz", "estudiar", "poo")
+    try:
+        for paso in range(operaciones):
+            accion = random.choice(("agregar", "agregar", "completar", "eliminar",
+                                    "buscar", "estado", "deshacer", "rehacer"))
+            if accion == "agregar":
+                app.entrada_tarea.insert(0, " ".join(random.sample(palabras, 2)) + f" {paso}")
+                app.prioridad.set(random.choice(PRIORIDADES))
+                app.agregar_tarea()
+            elif accion in ("completar", "eliminar"):
+                if not app.filas:
+                    continue
+                app.lista_tareas.selection_clear(0, tk.END)
+                app.lista_tareas.selection_set(random.randrange(len(app.filas)))
+                app.marcar_completada() if accion == "completar" else app.eliminar_tarea()
+            elif accion == "buscar":
+                app.entrada_busqueda.delete(0, tk.END)
+                app.entrada_busqueda.insert(0, random.choice(("", "p", "pa", "luz", "c m")))
+                app.renderizar()  # lo que haría el filtro programado tras la pausa
+            elif accion == "estado":
+                app.estado.set(random.choice(("", PENDIENTE, COMPLETADA)))
+                app.renderizar()
+            else:
+                app.deshacer() if accion == "deshacer" else app.rehacer()
+            assert app.verificar_sincronia(), f"El Listbox y el modelo difieren tras '{accion}' (paso {paso})"
+        print(f"{operaciones} operaciones: el Listbox siguió al modelo "
+              f"({len(app.tareas)} tareas, {len(app.filas)} filas visibles)")
+    finally:
+        root.destroy()
+
 
 # ------------------ Programa principal ------------------
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--estres":
+    # python "Aplicación GUI de Lista de Tareas.py" --estres [operaciones]
+    estres_sincronia(int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
+elif __name__ == "__main__":
     root = tk.Tk()
     app = ListaTareasApp(root)
     root.mainloop()
@@ -0,0 +1,492 @@
+# tareas.py
+"""
+Modelo y persistencia de la Lista de Tareas.
+
+- Tarea: dataclass con estado, prioridad y marcas de tiempo explícitas.
+- RepositorioTareas: diario (journal) en formato JSON Lines; cada cambio
+  se escribe como una línea nueva en lugar de reescribir todo el archivo.
+- IndiceTexto: índice invertido palabra -> IDs con búsqueda por prefijo,
+  usado por la caja de búsqueda de la interfaz.
+- ListaTareas.buscar_por_pasos: la misma búsqueda partida en pasos cortos
+  (PASO_BUSQUEDA), para que la interfaz la avance entre eventos sin que
+  ninguna pulsación bloquee la ventana más de un cuadro.
+- ListaTareas: modelo que usa la interfaz gráfica; mantiene las tareas en
+  orden de creación (que coincide con el orden de sus IDs).
+"""
+import json
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, asdict, field
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# diario.py está en la carpeta UNIDAD 4 y lo comparten las aplicaciones de la unidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from diario import abrir_para_agregar
+
+PENDIENTE = "pendiente"
+COMPLETADA = "completada"
+PRIORIDADES = ("baja", "media", "alta")
+_VACIO: frozenset = frozenset()
+
+# Trabajo de un paso de buscar_por_pasos, en IDs copiados entre conjuntos
+# (unos 3-5 ms): cada paso cabe en un cuadro de 16 ms aun con 500k tareas
+PASO_BUSQUEDA = 50_000
+
+
+@dataclass
+class Tarea:
+    id: int
+    texto: str
+    estado: str = PENDIENTE
+    prioridad: str = "media"
+    creada: float = field(default_factory=time.time)
+    actualizada: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.estado not in (PENDIENTE, COMPLETADA):
+            raise ValueError(f"Estado no válido: {self.estado}")
+        if self.prioridad not in PRIORIDADES:
+            raise ValueError(f"Prioridad no válida: {self.prioridad}")
+        if self.actualizada is None:
+            self.actualizada = self.creada
+
+    @property
+    def completada(self) -> bool:
+        return self.estado == COMPLETADA
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(d: Dict) -> "Tarea":
+        return Tarea(**d)
+
+
+class RepositorioTareas:
+    """Guarda las tareas en un diario de operaciones (una línea JSON por cambio).
+
+    Al cargar se reproduce el diario; cuando tiene muchas más líneas que
+    tareas vivas se compacta reescribiéndolo de forma atómica.
+    """
+
+    def __init__(self, ruta: str, fsync: bool = True):
+        self.ruta = ruta
+        self.fsync = fsync
+        self._lineas = 0
+        self._archivo = None
+
+    def cargar(self) -> List[Tarea]:
+        tareas: Dict[int, Tarea] = {}
+        self._lineas = 0
+        if not os.path.exists(self.ruta):
+            return []
+        with open(self.ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Línea truncada por un cierre abrupto: se ignora (la siguiente
+                    # escritura empieza en una línea nueva, ver diario.abrir_para_agregar)
+                    continue
+                self._lineas += 1
+                if registro["op"] == "eliminar":
+                    tareas.pop(registro["id"], None)
+                else:
+                    # Reasignar una clave existente conserva su posición original
+                    t = Tarea.from_dict(registro["tarea"])
+                    tareas[t.id] = t
+        # Una tarea restaurada con "deshacer" aparece al final del diario con su ID original
+        return sorted(tareas.values(), key=lambda t: t.id)
+
+    def agregar(self, tarea: Tarea) -> None:
+        self._escribir({"op": "agregar", "tarea": tarea.to_dict()})
+
+    def actualizar(self, tarea: Tarea) -> None:
+        self._escribir({"op": "actualizar", "tarea": tarea.to_dict()})
+
+    def eliminar(self, id_: int) -> None:
+        self._escribir({"op": "eliminar", "id": id_})
+
+    def necesita_compactar(self, vivas: int) -> bool:
+        return self._lineas > 1000 and self._lineas > 2 * vivas
+
+    def compactar(self, tareas: List[Tarea]) -> None:
+        """Reescribe el diario con una línea por tarea viva (reemplazo atómico)."""
+        self.cerrar()
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            for t in tareas:
+                f.write(json.dumps({"op": "agregar", "tarea": t.to_dict()}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta)
+        self._lineas = len(tareas)
+
+    def sincronizar(self) -> None:
+        """Fuerza a disco lo escrito hasta ahora."""
+        if self._archivo:
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+
+    def cerrar(self) -> None:
+        if self._archivo:
+            self.sincronizar()
+            self._archivo.close()
+            self._archivo = None
+
+    def _escribir(self, registro: Dict) -> None:
+        if self._archivo is None:
+            self._archivo = abrir_para_agregar(self.ruta)
+        self._archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._archivo.flush()
+        if self.fsync:
+            os.fsync(self._archivo.fileno())
+        self._lineas += 1
+
+
+class IndiceTexto:
+    """Índice invertido de palabras para buscar tareas mientras se escribe.
+
+    Estructuras internas:
+        - _ids_por_palabra: Dict[str, Set[int]] -> palabra -> IDs de tareas.
+        - _palabras: List[str] ordenada -> permite recorrer solo las palabras
+          que empiezan con un prefijo usando búsqueda binaria.
+
+    Las palabras nuevas se ordenan recién en la siguiente búsqueda y las
+    eliminadas se quitan de la lista al reconstruirla, así la carga masiva
+    no paga una inserción ordenada por palabra.
+    """
+
+    def __init__(self) -> None:
+        self._ids_por_palabra: Dict[str, Set[int]] = {}
+        self._palabras: List[str] = []
+        self._nuevas: List[str] = []
+        self._obsoletas = 0
+
+    @staticmethod
+    def palabras(texto: str) -> Set[str]:
+        return set(re.findall(r"\w+", texto.casefold()))
+
+    def agregar(self, id_: int, texto: str) -> None:
+        for palabra in self.palabras(texto):
+            ids = self._ids_por_palabra.get(palabra)
+            if ids is None:
+                ids = self._ids_por_palabra[palabra] = set()
+                self._nuevas.append(palabra)
+            ids.add(id_)
+
+    def eliminar(self, id_: int, texto: str) -> None:
+        for palabra in self.palabras(texto):
+            ids = self._ids_por_palabra.get(palabra)
+            if ids:
+                ids.discard(id_)
+                if not ids:
+                    del self._ids_por_palabra[palabra]
+                    self._obsoletas += 1
+
+    def _ordenar(self) -> None:
+        if len(self._nuevas) + self._obsoletas > len(self._palabras) // 16:
+            self._palabras = sorted(self._ids_por_palabra)
+            self._obsoletas = 0
+        else:
+            for palabra in self._nuevas:
+                i = bisect_left(self._palabras, palabra)
+                # Una palabra eliminada y vuelta a agregar ya está en la lista
+                if i == len(self._palabras) or self._palabras[i] != palabra:
+                    self._palabras.insert(i, palabra)
+        self._nuevas.clear()
+
+    def preparar(self) -> None:
+        """Ordena ya las palabras pendientes (por ejemplo tras una carga masiva),
+        así la primera búsqueda no paga ese ordenamiento."""
+        if self._nuevas or self._obsoletas > len(self._palabras) // 2:
+            self._ordenar()
+
+    def conjuntos_prefijo(self, prefijo: str) -> Iterator[Set[int]]:
+        """Conjunto de IDs de cada palabra que empieza por `prefijo` (sin copiarlos)."""
+        self.preparar()
+        i = bisect_left(self._palabras, prefijo)
+        while i < len(self._palabras) and self._palabras[i].startswith(prefijo):
+            # Las palabras eliminadas siguen en la lista hasta la reconstrucción
+            yield self._ids_por_palabra.get(self._palabras[i], _VACIO)
+            i += 1
+
+    def buscar_prefijo(self, prefijo: str) -> Set[int]:
+        """IDs de las tareas con alguna palabra que empieza por `prefijo`."""
+        ids: Set[int] = set()
+        for conjunto in self.conjuntos_prefijo(prefijo):
+            ids |= conjunto
+        return ids
+
+    def buscar(self, consulta: str) -> Set[int]:
+        """Cada palabra de la consulta debe ser prefijo de alguna palabra de la tarea."""
+        resultado: Optional[Set[int]] = None
+        # Primero los prefijos más largos: suelen dar conjuntos más pequeños
+        for prefijo in sorted(self.palabras(consulta), key=len, reverse=True):
+            ids = self.buscar_prefijo(prefijo)
+            resultado = ids if resultado is None else resultado & ids
+            if not resultado:
+                return set()
+        return resultado if resultado is not None else set()
+
+
+class ListaTareas:
+    """Modelo de la aplicación: tareas en orden de creación con índice de búsqueda."""
+
+    def __init__(self, repositorio: Optional[RepositorioTareas] = None):
+        self.repositorio = repositorio
+        self.tareas: List[Tarea] = repositorio.cargar() if repositorio else []
+        self._siguiente_id = max((t.id for t in self.tareas), default=0) + 1
+        self._por_id: Dict[int, Tarea] = {t.id: t for t in self.tareas}
+        self._completadas: Set[int] = {t.id for t in self.tareas if t.completada}
+        # Cambia con cada modificación: una búsqueda por pasos que ve otro valor empieza de nuevo
+        self._version = 0
+        self.indice = IndiceTexto()
+        for t in self.tareas:
+            self.indice.agregar(t.id, t.texto)
+        self.indice.preparar()
+
+    def obtener(self, id_: int) -> Tarea:
+        return self._por_id[id_]
+
+    def agregar(self, texto: str, prioridad: str = "media") -> Tarea:
+        texto = texto.strip()
+        if not texto:
+            raise ValueError("No se puede añadir una tarea vacía.")
+        tarea = Tarea(self._siguiente_id, texto, prioridad=prioridad)
+        self._siguiente_id += 1
+        self.tareas.append(tarea)
+        self._por_id[tarea.id] = tarea
+        self.indice.agregar(tarea.id, tarea.texto)
+        self._version += 1
+        if self.repositorio:
+            self.repositorio.agregar(tarea)
+        return tarea
+
+    def marcar_completada(self, id_: int) -> bool:
+        """Marca la tarea como completada. Retorna True si cambió su estado."""
+        tarea = self._por_id[id_]
+        if tarea.completada:
+            return False
+        tarea.estado = COMPLETADA
+        tarea.actualizada = time.time()
+        self._completadas.add(id_)
+        self._version += 1
+        if self.repositorio:
+            self.repositorio.actualizar(tarea)
+        return True
+
+    def eliminar(self, id_: int) -> Tarea:
+        tarea = self._por_id.pop(id_)
+        # Las tareas están ordenadas por ID, así que su posición se halla por bisección
+        del self.tareas[bisect_left(self.tareas, id_, key=lambda t: t.id)]
+        self._completadas.discard(id_)
+        self.indice.eliminar(id_, tarea.texto)
+        self._version += 1
+        if self.repositorio:
+            self.repositorio.eliminar(tarea.id)
+            if self.repositorio.necesita_compactar(len(self.tareas)):
+                self.repositorio.compactar(self.tareas)
+        return tarea
+
+    def restaurar(self, tarea: Tarea) -> None:
+        """Vuelve a insertar una tarea eliminada en su posición original (por ID)."""
+        self.tareas.insert(bisect_left(self.tareas, tarea.id, key=lambda t: t.id), tarea)
+        self._por_id[tarea.id] = tarea
+        if tarea.completada:
+            self._completadas.add(tarea.id)
+        self.indice.agregar(tarea.id, tarea.texto)
+        self._siguiente_id = max(self._siguiente_id, tarea.id + 1)
+        self._version += 1
+        if self.repositorio:
+            self.repositorio.agregar(tarea)
+
+    def reemplazar(self, tarea: Tarea) -> None:
+        """Sustituye los datos de la tarea con el mismo ID."""
+        anterior = self._por_id[tarea.id]
+        self.tareas[bisect_left(self.tareas, tarea.id, key=lambda t: t.id)] = tarea
+        self._por_id[tarea.id] = tarea
+        if tarea.completada:
+            self._completadas.add(tarea.id)
+        else:
+            self._completadas.discard(tarea.id)
+        if tarea.texto != anterior.texto:
+            self.indice.eliminar(tarea.id, anterior.texto)
+            self.indice.agregar(tarea.id, tarea.texto)
+        self._version += 1
+        if self.repositorio:
+            self.repositorio.actualizar(tarea)
+
+    def coincide(self, tarea: Tarea, consulta: str = "", estado: Optional[str] = None) -> bool:
+        """Indica si una tarea pasa el filtro (misma regla que `buscar`)."""
+        if estado is not None and tarea.estado != estado:
+            return False
+        palabras = IndiceTexto.palabras(tarea.texto)
+        return all(any(p.startswith(q) for p in palabras) for q in IndiceTexto.palabras(consulta))
+
+    def buscar(self, consulta: str = "", estado: Optional[str] = None,
+               limite: Optional[int] = None) -> Tuple[List[Tarea], int]:
+        """Retorna (primeras `limite` tareas que coinciden, total de coincidencias).
+
+        Sin consulta no se toca el índice: se recorre la lista solo hasta llenar
+        `limite`. Con consulta se intersectan los conjuntos del índice y solo se
+        ordenan los `limite` IDs más bajos. Es buscar_por_pasos hecho de una vez.
+        """
+        return next(r for r in self.buscar_por_pasos(consulta, estado, limite) if r is not None)
+
+    def buscar_por_pasos(self, consulta: str = "", estado: Optional[str] = None,
+                         limite: Optional[int] = None,
+                         paso: int = PASO_BUSQUEDA) -> Iterator[Optional[Tuple[List[Tarea], int]]]:
+        """La búsqueda de `buscar` en pasos: cada next() hace a lo sumo unos `paso`
+        IDs de trabajo y retorna None; el último retorna (filas, total).
+
+        La interfaz avanza el generador entre eventos (con `after`), así una
+        consulta con cientos de miles de coincidencias no congela la ventana. Si
+        la lista cambia entre dos pasos la búsqueda vuelve a empezar: el resultado
+        siempre corresponde al estado actual.
+        """
+        while True:
+            version = self._version
+            for resultado in self._pasos_busqueda(consulta, estado, limite, paso):
+                if resultado is not None:
+                    yield resultado
+                    return
+                yield None
+                if self._version != version:
+                    break  # cambió la lista mientras se esperaba: se empieza de nuevo
+
+    def _pasos_busqueda(self, consulta: str, estado: Optional[str], limite: Optional[int],
+                        paso: int) -> Iterator[Optional[Tuple[List[Tarea], int]]]:
+        if not IndiceTexto.palabras(consulta):
+            yield self._sin_consulta(estado, limite)
+            return
+
+        ids: Optional[Set[int]] = None
+        # Primero los prefijos más largos: suelen dar conjuntos más pequeños
+        for prefijo in sorted(IndiceTexto.palabras(consulta), key=len, reverse=True):
+            union: Set[int] = set()
+            trabajo = 0
+            for conjunto in self.indice.conjuntos_prefijo(prefijo):
+                union |= conjunto
+                trabajo += len(conjunto) + 8  # recorrer la palabra también cuesta
+                if trabajo >= paso:
+                    yield None
+                    trabajo = 0
+            if ids is None:
+                ids = union
+            else:
+                yield None
+                ids &= union
+            if not ids:
+                break
+        yield None
+        # En el lugar: difference_update recorre solo las completadas
+        if estado == COMPLETADA:
+            ids &= self._completadas
+        elif estado == PENDIENTE:
+            ids -= self._completadas
+        yield self._primeras(ids, limite), len(ids)
+
+    def _sin_consulta(self, estado: Optional[str], limite: Optional[int]) -> Tuple[List[Tarea], int]:
+        if estado is None:
+            total = len(self.tareas)
+            return (self.tareas[:limite] if limite is not None else list(self.tareas)), total
+        total = len(self._completadas) if estado == COMPLETADA else len(self.tareas) - len(self._completadas)
+        filas = []
+        for t in self.tareas:
+            if limite is not None and len(filas) >= limite:
+                break
+            if t.estado == estado:
+                filas.append(t)
+        return filas, total
+
+    def _primeras(self, ids: Set[int], limite: Optional[int]) -> List[Tarea]:
+        """Las `limite` tareas de menor ID de `ids`, en orden."""
+        if limite is None:
+            return [self._por_id[i] for i in sorted(ids)]
+        # Con muchas coincidencias es más barato recorrer la lista (ya ordenada por
+        # ID) hasta juntar `limite` que ordenar todos los IDs (sorted sobre enteros
+        # es más rápido que heapq.nsmallest con un `limite` de cientos)
+        if len(ids) * len(ids) > limite * len(self.tareas):
+            return list(islice((t for t in self.tareas if t.id in ids), limite))
+        return [self._por_id[i] for i in sorted(ids)[:limite]]
+
+    def cerrar(self) -> None:
+        if self.repositorio:
+            self.repositorio.cerrar()
+
+
+# ------------------ Benchmark ------------------
+def benchmark_marcar(n: int = 100_000) -> None:
+    """Mide cuánto cuesta crear y marcar como completadas n tareas (con diario en disco)."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "tareas.jsonl")
+        # fsync por operación haría medir el disco y no el código; se sincroniza al cerrar
+        modelo = ListaTareas(RepositorioTareas(ruta, fsync=False))
+        inicio = time.perf_counter()
+        for i in range(n):
+            modelo.agregar(f"Tarea {i}")
+        t_agregar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for t in modelo.tareas:
+            modelo.marcar_completada(t.id)
+        modelo.cerrar()
+        t_marcar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        recargado = ListaTareas(RepositorioTareas(ruta))
+        t_cargar = time.perf_counter() - inicio
+        assert all(t.completada for t in recargado.tareas) and len(recargado.tareas) == n
+
+    print(f"Agregar {n} tareas:  {t_agregar:.3f} s")
+    print(f"Marcar {n} tareas:   {t_marcar:.3f} s ({n / t_marcar:,.0f} op/s)")
+    print(f"Recargar el diario:  {t_cargar:.3f} s")
+
+
+def benchmark_busqueda(n: int = 500_000, limite: int = 1000) -> None:
+    """Mide lo que bloquea la ventana al escribir una búsqueda sobre n tareas: el
+    paso más largo de buscar_por_pasos (debe caber en un cuadro, 16.7 ms) y el
+    tiempo hasta tener el resultado completo."""
+    import random
+
+    random.seed(42)
+    vocabulario = ["comprar", "pan", "leche", "llamar", "médico", "pagar", "luz", "agua",
+                   "estudiar", "poo", "examen", "enviar", "correo", "revisar", "código",
+                   "limpiar", "casa", "reunión", "proyecto", "informe"]
+    modelo = ListaTareas()
+    inicio = time.perf_counter()
+    for i in range(n):
+        modelo.agregar(" ".join(random.sample(vocabulario, 3)) + f" #{i}")
+        if i % 3 == 0:
+            modelo.marcar_completada(i + 1)
+    modelo.indice.preparar()  # lo que hace ListaTareas al cargar el diario
+    print(f"Indexar {n} tareas: {time.perf_counter() - inicio:.3f} s")
+
+    peor = 0.0
+    for estado in (None, PENDIENTE):
+        for consulta in ("p", "pr", "pro", "proy", "proy i", "proy inf", "1", "p 1", "c m"):
+            pasos, mas_largo = 0, 0.0
+            inicio = time.perf_counter()
+            for resultado in modelo.buscar_por_pasos(consulta, estado, limite):
+                ahora = time.perf_counter()
+                mas_largo = max(mas_largo, ahora - inicio)
+                pasos += 1
+                if resultado is not None:
+                    filas, total = resultado
+                inicio = ahora
+            peor = max(peor, mas_largo)
+            print(f"  buscar({consulta!r:11}, {str(estado):9}) -> {total:7} coincidencias, {len(filas)} filas; "
+                  f"{pasos:2} pasos, el más largo {mas_largo * 1000:5.1f} ms")
+    print(f"Paso más largo: {peor * 1000:.1f} ms (un cuadro a 60 Hz: 16.7 ms)")
+
+
+if __name__ == "__main__":
+    benchmark_marcar()
+    benchmark_busqueda()
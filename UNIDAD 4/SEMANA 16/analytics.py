@@ -0,0 +1,272 @@
+# analytics.py
+"""
+Analítica del inventario: agregados incrementales y reportes por columnas.
+
+AnaliticaInventario guarda una copia columnar de los datos que necesita
+(id, cantidad, precio) en arrays compactos y mantiene los totales al día en
+cada agregar/eliminar/actualizar, así las consultas de agregados son O(1)
+y los reportes recorren las columnas sin construir objetos Producto.
+
+Si NumPy está instalado los reportes se calculan de forma vectorizada;
+si no, se usan funciones de la biblioteca estándar que iteran en C.
+
+IndiceStockBajo sigue el margen (cantidad - umbral) de cada producto y
+avisa a sus suscriptores cuando un producto cruza su umbral de reposición.
+"""
+import heapq
+import itertools
+import operator
+import time
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
+
+# NumPy es opcional: solo acelera los reportes masivos
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except Exception:
+    NUMPY_DISPONIBLE = False
+
+# Límites por defecto de las bandas de precio: <1, 1-5, 5-10, 10-50, 50-100, >=100
+BANDAS_PRECIO = (1.0, 5.0, 10.0, 50.0, 100.0)
+
+
+class AnaliticaInventario:
+    """Agregados y columnas del inventario.
+
+    Estructuras internas:
+        - _fila: Dict[str, int] -> posición de cada ID en las columnas.
+        - _ids, _cantidad (array 'q'), _precio (array 'd') -> columnas paralelas;
+          al eliminar se mueve la última fila al hueco (O(1)).
+    """
+
+    def __init__(self, bandas: Sequence[float] = BANDAS_PRECIO):
+        self.bandas = tuple(sorted(bandas))
+        self._fila: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._cantidad = array("q")
+        self._precio = array("d")
+        self.total_unidades = 0
+        self.valor_total = 0.0
+        self._conteo_bandas = [0] * (len(self.bandas) + 1)
+
+    # ------------------ Mantenimiento incremental ------------------
+    def agregar(self, id_: str, cantidad: int, precio: float) -> None:
+        if id_ in self._fila:
+            raise KeyError(f"La analítica ya tiene el ID {id_}.")
+        self._fila[id_] = len(self._ids)
+        self._ids.append(id_)
+        self._cantidad.append(cantidad)
+        self._precio.append(precio)
+        self._sumar(cantidad, precio, +1)
+
+    def eliminar(self, id_: str) -> None:
+        fila = self._fila.pop(id_)
+        self._sumar(self._cantidad[fila], self._precio[fila], -1)
+        ultima = len(self._ids) - 1
+        if fila != ultima:
+            # Mover la última fila al hueco para no desplazar las columnas
+            movido = self._ids[ultima]
+            self._ids[fila] = movido
+            self._cantidad[fila] = self._cantidad[ultima]
+            self._precio[fila] = self._precio[ultima]
+            self._fila[movido] = fila
+        self._ids.pop()
+        self._cantidad.pop()
+        self._precio.pop()
+
+    def actualizar(self, id_: str, cantidad: int, precio: float) -> None:
+        fila = self._fila[id_]
+        self._sumar(self._cantidad[fila], self._precio[fila], -1)
+        self._cantidad[fila] = cantidad
+        self._precio[fila] = precio
+        self._sumar(cantidad, precio, +1)
+
+    def reconstruir(self, filas: Iterable[Tuple[str, int, float]]) -> None:
+        """Recarga todas las columnas de una vez (por ejemplo al cargar el archivo)."""
+        self._ids = []
+        self._cantidad = array("q")
+        self._precio = array("d")
+        for id_, cantidad, precio in filas:
+            self._ids.append(id_)
+            self._cantidad.append(cantidad)
+            self._precio.append(precio)
+        self._fila = {id_: i for i, id_ in enumerate(self._ids)}
+        self.recalcular()
+
+    def recalcular(self) -> None:
+        """Recalcula los agregados desde las columnas (corrige el redondeo acumulado)."""
+        self.total_unidades = sum(self._cantidad)
+        self.valor_total = sum(map(operator.mul, self._cantidad, self._precio))
+        self._conteo_bandas = [0] * (len(self.bandas) + 1)
+        for precio in self._precio:
+            self._conteo_bandas[bisect_right(self.bandas, precio)] += 1
+
+    def _sumar(self, cantidad: int, precio: float, signo: int) -> None:
+        self.total_unidades += signo * cantidad
+        self.valor_total += signo * cantidad * precio
+        self._conteo_bandas[bisect_right(self.bandas, precio)] += signo
+
+    # ------------------ Consultas O(1) ------------------
+    def numero_productos(self) -> int:
+        return len(self._ids)
+
+    def conteo_por_banda(self) -> Dict[str, int]:
+        etiquetas = [f"< {self.bandas[0]:g}"]
+        etiquetas += [f"{a:g} - {b:g}" for a, b in zip(self.bandas, self.bandas[1:])]
+        etiquetas.append(f">= {self.bandas[-1]:g}")
+        return dict(zip(etiquetas, self._conteo_bandas))
+
+    # ------------------ Reportes por columnas ------------------
+    def top_por_valor(self, n: int = 10) -> List[Tuple[str, float]]:
+        """Los n productos con mayor valor en stock (cantidad * precio), de mayor a menor."""
+        if n <= 0:
+            return []  # con NumPy, argpartition(...)[-0:] devolvería todas las filas
+        if NUMPY_DISPONIBLE and self._ids:
+            cantidad, precio = self._columnas_numpy()
+            valores = cantidad * precio
+            n = min(n, len(valores))
+            filas = np.argpartition(valores, -n)[-n:]
+            filas = filas[np.argsort(valores[filas])[::-1]]
+            return [(self._ids[i], float(valores[i])) for i in filas.tolist()]
+        valores = array("d", map(operator.mul, self._cantidad, self._precio))
+        filas = heapq.nlargest(n, range(len(valores)), key=valores.__getitem__)
+        return [(self._ids[i], valores[i]) for i in filas]
+
+    def reorden(self, umbral: int) -> List[Tuple[str, int]]:
+        """Productos con cantidad menor que `umbral` (lista para reponer stock)."""
+        if NUMPY_DISPONIBLE and self._ids:
+            cantidad = self._columnas_numpy()[0]
+            filas = np.flatnonzero(cantidad < umbral).tolist()
+        else:
+            filas = list(itertools.compress(range(len(self._cantidad)), map(umbral.__gt__, self._cantidad)))
+        return [(self._ids[i], self._cantidad[i]) for i in filas]
+
+    def _columnas_numpy(self):
+        # Vistas sin copia sobre los buffers de los arrays; no deben salir del
+        # reporte porque un array con vistas vivas no puede crecer ni achicarse
+        return (np.frombuffer(self._cantidad, dtype=np.int64),
+                np.frombuffer(self._precio, dtype=np.float64))
+
+
+class IndiceStockBajo:
+    """Productos cuya cantidad está por debajo de su umbral de reposición.
+
+    Estructuras internas:
+        - _margen: Dict[str, int] -> cantidad - umbral de cada producto.
+        - _bajo: Set[str] -> IDs con margen negativo; cambia solo cuando un
+          producto cruza su umbral, así listar los productos a reponer cuesta
+          O(k) en la cantidad de resultados y no en el tamaño del inventario.
+    """
+
+    def __init__(self) -> None:
+        self._margen: Dict[str, int] = {}
+        self._bajo: Set[str] = set()
+        self._suscriptores: List[Callable[[str, int, bool], None]] = []
+
+    def suscribir(self, funcion: Callable[[str, int, bool], None]) -> None:
+        """Registra funcion(id, margen, bajo) que se llama cada vez que un producto
+        cruza su umbral (bajo=True al caer por debajo, False al reponerse)."""
+        self._suscriptores.append(funcion)
+
+    def actualizar(self, id_: str, cantidad: int, umbral: int) -> None:
+        margen = cantidad - umbral
+        self._margen[id_] = margen
+        bajo = margen < 0
+        if bajo == (id_ in self._bajo):
+            return
+        if bajo:
+            self._bajo.add(id_)
+        else:
+            self._bajo.discard(id_)
+        for funcion in self._suscriptores:
+            funcion(id_, margen, bajo)
+
+    def eliminar(self, id_: str) -> None:
+        self._margen.pop(id_, None)
+        self._bajo.discard(id_)
+
+    def reconstruir(self, filas: Iterable[Tuple[str, int, int]]) -> None:
+        """Recarga el índice sin avisar a los suscriptores (por ejemplo al cargar el archivo)."""
+        self._margen = {id_: cantidad - umbral for id_, cantidad, umbral in filas}
+        self._bajo = {id_ for id_, margen in self._margen.items() if margen < 0}
+
+    def por_debajo(self) -> List[str]:
+        return list(self._bajo)
+
+    def mas_criticos(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Los n productos con el margen más negativo (los que más faltan)."""
+        ids = heapq.nsmallest(n, self._bajo, key=self._margen.__getitem__)
+        return [(id_, self._margen[id_]) for id_ in ids]
+
+    def __len__(self) -> int:
+        return len(self._bajo)
+
+
+# ------------------ Benchmark ------------------
+def benchmark(n: int = 1_000_000) -> None:
+    """Mide la carga y los reportes con n SKUs sintéticos."""
+    import random
+
+    random.seed(7)
+    analitica = AnaliticaInventario()
+    inicio = time.perf_counter()
+    analitica.reconstruir((f"SKU{i}", random.randrange(500), random.random() * 200) for i in range(n))
+    print(f"Cargar {n:,} SKUs: {time.perf_counter() - inicio:.2f} s (NumPy: {NUMPY_DISPONIBLE})")
+
+    inicio = time.perf_counter()
+    for i in range(100_000):
+        analitica.actualizar(f"SKU{i}", i % 500, 9.99)
+    print(f"100.000 actualizaciones incrementales: {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    total = analitica.valor_total, analitica.total_unidades, analitica.conteo_por_banda()
+    print(f"Agregados O(1): {(time.perf_counter() - inicio) * 1e6:.1f} µs -> valor {total[0]:,.2f}")
+
+    for nombre, reporte in (("Top 10 por valor", lambda: analitica.top_por_valor(10)),
+                            ("Reorden (< 5 unidades)", lambda: analitica.reorden(5))):
+        inicio = time.perf_counter()
+        filas = reporte()
+        print(f"{nombre}: {len(filas):,} filas en {time.perf_counter() - inicio:.2f} s")
+
+
+def benchmark_stock_bajo(n: int = 1_000_000, actualizaciones: int = 10_000_000) -> None:
+    """Mide un flujo de actualizaciones de cantidad sobre n productos con umbral."""
+    import random
+
+    random.seed(11)
+    indice = IndiceStockBajo()
+    avisos = [0]
+    indice.suscribir(lambda id_, margen, bajo: avisos.__setitem__(0, avisos[0] + 1))
+    ids = [f"SKU{i}" for i in range(n)]
+    indice.reconstruir((id_, random.randrange(100), 10) for id_ in ids)
+
+    lote = 1_000_000
+    t_total = 0.0
+    for inicio_lote in range(0, actualizaciones, lote):
+        tam = min(lote, actualizaciones - inicio_lote)
+        # Los datos del flujo se generan fuera de la medición
+        productos = [ids[i] for i in random.choices(range(n), k=tam)]
+        cantidades = random.choices(range(100), k=tam)
+        actualizar = indice.actualizar
+        inicio = time.perf_counter()
+        for id_, cantidad in zip(productos, cantidades):
+            actualizar(id_, cantidad, 10)
+        t_total += time.perf_counter() - inicio
+    print(f"{actualizaciones:,} actualizaciones sobre {n:,} productos: {t_total:.2f} s "
+          f"({actualizaciones / t_total:,.0f} op/s), {avisos[0]:,} avisos de cruce")
+
+    inicio = time.perf_counter()
+    bajos = indice.por_debajo()
+    print(f"Listar {len(bajos):,} productos bajo umbral: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    inicio = time.perf_counter()
+    indice.mas_criticos(10)
+    print(f"10 más críticos: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    benchmark(n)
+    benchmark_stock_bajo(n, 10 * n)
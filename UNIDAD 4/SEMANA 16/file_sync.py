@@ -0,0 +1,249 @@
+# file_sync.py
+"""
+Acceso seguro al archivo del inventario desde varios procesos.
+
+- BloqueoArchivo: bloqueo cooperativo (flock en Linux/macOS, msvcrt en
+  Windows) sobre un archivo auxiliar `<ruta>.lock`.
+- El archivo guarda un contador de generación:
+  {"generacion": N, "esquema": E, "crc32": C, "productos": [...]}.
+  Un proceso recuerda la generación que leyó; si al guardar encuentra otra,
+  su vista está desactualizada y fusiona los cambios en vez de pisarlos.
+- fusionar: fusión de tres vías por registro y por campo. Los cambios que no
+  chocan se combinan, las cantidades cambiadas por ambos se suman como deltas
+  y en los demás choques gana la versión local (se reportan como conflictos).
+
+- La suma CRC32 de la lista de productos prueba que nadie editó la lista
+  después de escribirla, pero no que sus valores sean válidos: eso depende de
+  quién la escribió. Por eso el escritor declara en el encabezado con qué
+  reglas validó los productos ("validador", p. ej. "semana11.Producto/1").
+  Un cargador confía en el archivo (y construye los productos sin volver a
+  validar cada campo) solo si el validador es el suyo, el esquema es el
+  actual y la suma coincide.
+
+También se leen los archivos antiguos que solo contienen la lista de productos
+(nunca se consideran confiables).
+"""
+import json
+import os
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import medido, registrar_bytes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+Registros = Dict[str, Dict]
+
+# Versión de los campos de cada registro; se incrementa si cambian
+ESQUEMA = 1
+
+_GENERACION = re.compile(rb'"generacion":\s*(\d+)')
+_PRODUCTOS = b'"productos": '
+
+# Campos numéricos que se fusionan sumando los cambios de cada proceso
+CAMPOS_SUMABLES = ("cantidad",)
+
+
+class BloqueoArchivo:
+    """Context manager que toma un bloqueo exclusivo entre procesos."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta + ".lock"
+        self._archivo = None
+
+    def __enter__(self) -> "BloqueoArchivo":
+        self._archivo = open(self.ruta, "a+")
+        if fcntl:
+            fcntl.flock(self._archivo.fileno(), fcntl.LOCK_EX)
+        else:
+            self._archivo.seek(0)
+            msvcrt.locking(self._archivo.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if fcntl:
+            fcntl.flock(self._archivo.fileno(), fcntl.LOCK_UN)
+        else:
+            self._archivo.seek(0)
+            msvcrt.locking(self._archivo.fileno(), msvcrt.LK_UNLCK, 1)
+        self._archivo.close()
+        self._archivo = None
+
+
+def leer_versionado(ruta: str) -> Tuple[int, List[Dict]]:
+    """Retorna (generación, productos). Un archivo inexistente es la generación 0."""
+    generacion, productos, _ = leer_verificado(ruta)
+    return generacion, productos
+
+
+def leer_verificado(ruta: str, validador: Optional[str] = None) -> Tuple[int, List[Dict], bool]:
+    """Retorna (generación, productos, confiable). `confiable` indica que el archivo
+    tiene el esquema actual, que lo escribió alguien que validó con las reglas
+    `validador` y que la suma de la lista de productos coincide. Sin validador
+    nunca es confiable."""
+    if not os.path.exists(ruta):
+        return 0, [], True
+    with open(ruta, "rb") as f:
+        crudo = f.read()
+    data = json.loads(crudo)
+    if isinstance(data, list):
+        # Formato anterior: solo la lista de productos
+        return 0, data, False
+    confiable = False
+    inicio = crudo.find(_PRODUCTOS)
+    if (validador is not None and data.get("validador") == validador
+            and data.get("esquema") == ESQUEMA and inicio >= 0):
+        # La suma cubre desde la lista hasta antes de la llave final (ver escribir_versionado)
+        cuerpo = crudo[inicio + len(_PRODUCTOS):crudo.rindex(b"}")].rstrip()
+        confiable = zlib.crc32(cuerpo) == data.get("crc32")
+    return int(data["generacion"]), data["productos"], confiable
+
+
+def leer_generacion(ruta: str) -> Optional[int]:
+    """Lee solo la generación del encabezado, sin analizar toda la lista de productos.
+
+    escribir_versionado deja "generacion" como primera clave, así que basta con
+    el principio del archivo. Retorna None si no se puede determinar así.
+    """
+    try:
+        with open(ruta, "rb") as f:
+            inicio = f.read(256)
+    except FileNotFoundError:
+        return 0
+    if inicio.lstrip().startswith(b"["):
+        return 0
+    encontrado = _GENERACION.search(inicio)
+    return int(encontrado.group(1)) if encontrado else None
+
+
+def sin_contenido(ruta: str) -> bool:
+    """True si el archivo no existe o está vacío (otro programa lo borró o lo truncó).
+    Para recargar eso no es un inventario vacío sino la falta de uno: no hay nada que traer."""
+    try:
+        return os.stat(ruta).st_size == 0
+    except FileNotFoundError:
+        return True
+
+
+@medido
+def escribir_versionado(ruta: str, generacion: int, productos: List[Dict], indent: int = 4,
+                        validador: Optional[str] = None) -> None:
+    """Escribe en un temporal y lo reemplaza: nadie lee nunca un archivo a medio escribir.
+
+    `validador` declara que cada registro salió de un producto validado con esas
+    reglas; sin él ningún cargador construirá los productos sin revalidarlos."""
+    cuerpo = json.dumps(productos, ensure_ascii=False, indent=indent).encode("utf-8")
+    # Encabezado en la primera línea (leer_generacion) y la lista al final (leer_verificado)
+    cabecera = {"generacion": generacion, "esquema": ESQUEMA, "crc32": zlib.crc32(cuerpo)}
+    if validador is not None:
+        cabecera["validador"] = validador
+    encabezado = json.dumps(cabecera)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    datos = encabezado[:-1].encode("utf-8") + b",\n" + _PRODUCTOS + cuerpo + b"\n}\n"
+    with open(temporal, "wb") as f:
+        f.write(datos)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+    registrar_bytes("escribir_versionado", len(datos))
+
+
+def fusionar(base: Registros, mios: Registros, suyos: Registros) -> Tuple[Registros, List[str]]:
+    """Fusión de tres vías: `base` es lo que este proceso leyó, `mios` su estado
+    actual y `suyos` lo que hay ahora en el archivo. Retorna (fusión, IDs en conflicto)."""
+    fusion: Registros = {}
+    conflictos: List[str] = []
+    for id_ in list(suyos) + [i for i in mios if i not in suyos]:
+        b, m, t = base.get(id_), mios.get(id_), suyos.get(id_)
+        if m == b:
+            r = t
+        elif t == b:
+            r = m
+        elif m is None or t is None or b is None:
+            # Eliminado en un lado y modificado en el otro, o agregado distinto en ambos
+            r = m if m is not None else t
+            if m != t:
+                conflictos.append(id_)
+        else:
+            r, choca = _fusionar_campos(b, m, t)
+            if choca:
+                conflictos.append(id_)
+        if r is not None:
+            fusion[id_] = r
+    return fusion, conflictos
+
+
+def _fusionar_campos(b: Dict, m: Dict, t: Dict) -> Tuple[Dict, bool]:
+    r: Dict = {}
+    choca = False
+    for campo in {**t, **m}:
+        bv, mv, tv = b.get(campo), m.get(campo), t.get(campo)
+        if mv == bv:
+            r[campo] = tv
+        elif tv == bv:
+            r[campo] = mv
+        elif campo in CAMPOS_SUMABLES and None not in (bv, mv, tv):
+            # Dos +1 dan el mismo valor pero son dos entradas distintas: se suman
+            r[campo] = tv + (mv - bv)
+        elif mv == tv:
+            r[campo] = mv
+        else:
+            r[campo] = mv
+            choca = True
+    return r, choca
+
+
+# ------------------ Prueba de estrés ------------------
+def _escritor(ruta: str, numero: int, iteraciones: int, productos: int) -> int:
+    import random
+    from inventory import Inventario
+    from product import Producto
+
+    random.seed(numero)
+    inv = Inventario()
+    inv.cargar_desde_archivo(ruta)
+    sumadas = 0
+    for i in range(iteraciones):
+        # Cada escritor suma stock a productos compartidos y agrega productos propios
+        id_ = str(random.randrange(productos))
+        p = inv.productos[id_]
+        inv.modificar_producto(id_, p.nombre, p.cantidad + 1, p.precio)
+        sumadas += 1
+        if i % 10 == 0:
+            inv.agregar_producto(Producto(f"P{numero}-{i}", "nuevo", 1, 1.0))
+            sumadas += 1
+        inv.guardar_en_archivo(ruta)
+    return sumadas
+
+
+def prueba_estres(procesos: int = 8, iteraciones: int = 200, productos: int = 20) -> None:
+    """Lanza varios procesos que escriben el mismo archivo y verifica que no se pierda nada."""
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "inventario.json")
+        escribir_versionado(ruta, 1, [{"id": str(i), "nombre": f"Producto {i}", "cantidad": 0, "precio": 1.0}
+                                      for i in range(productos)])
+        inicio = time.perf_counter()
+        with ProcessPoolExecutor(procesos) as ejecutor:
+            tareas = [ejecutor.submit(_escritor, ruta, n, iteraciones, productos) for n in range(procesos)]
+            esperadas = sum(t.result() for t in tareas)
+        segundos = time.perf_counter() - inicio
+        generacion, data = leer_versionado(ruta)
+        total = sum(d["cantidad"] for d in data)
+        print(f"{procesos} procesos x {iteraciones} guardados en {segundos:.2f} s, generación final {generacion}")
+        print(f"Unidades esperadas: {esperadas} | en el archivo: {total} | productos: {len(data)}")
+        assert total == esperadas, "Se perdieron actualizaciones"
+        assert generacion == 1 + procesos * iteraciones
+        print("✔ Sin actualizaciones perdidas.")
+
+
+if __name__ == "__main__":
+    prueba_estres()
@@ -0,0 +1,88 @@
+# file_watcher.py
+"""
+Aviso de cambios en un archivo hechos por otros procesos.
+
+En Linux se usa inotify (mediante ctypes, sin dependencias externas) sobre la
+carpeta del archivo, porque el guardado atómico con os.replace cambia el
+inodo y un vigilante puesto sobre el archivo mismo dejaría de recibir
+eventos. En otros sistemas, o si inotify no está disponible, se compara
+os.stat (mtime, tamaño e inodo) en cada revisión.
+
+revisar() nunca bloquea: se llama periódicamente desde el bucle de eventos
+de Tkinter con `after`, ya que los widgets solo pueden tocarse desde el
+hilo principal.
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from typing import Optional, Set, Tuple
+
+# inotify es opcional: sin él se revisa el archivo por sondeo
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _libc.inotify_init1
+    INOTIFY_DISPONIBLE = sys.platform.startswith("linux")
+except Exception:
+    INOTIFY_DISPONIBLE = False
+
+_IN_CLOEXEC = 0o2000000
+# Escritura terminada, archivo renombrado hacia la carpeta, creado o eliminado
+_IN_MASCARA = 0x008 | 0x080 | 0x100 | 0x200
+_EVENTO = struct.Struct("iIII")  # wd, mask, cookie, len (luego el nombre)
+
+
+class VigilanteArchivo:
+    def __init__(self, ruta: str, sondeo: bool = False):
+        self.ruta = os.path.abspath(ruta)
+        self._nombre = os.fsencode(os.path.basename(self.ruta))
+        self._fd = -1
+        if INOTIFY_DISPONIBLE and not sondeo:
+            fd = _libc.inotify_init1(os.O_NONBLOCK | _IN_CLOEXEC)
+            carpeta = os.fsencode(os.path.dirname(self.ruta))
+            if fd >= 0 and _libc.inotify_add_watch(fd, carpeta, _IN_MASCARA) >= 0:
+                self._fd = fd
+            elif fd >= 0:
+                os.close(fd)
+        self._firma = self._leer_firma()
+
+    @property
+    def usa_inotify(self) -> bool:
+        return self._fd >= 0
+
+    def revisar(self) -> bool:
+        """True si el archivo cambió desde la revisión anterior."""
+        if self._fd >= 0:
+            return self._nombre in self._leer_eventos()
+        firma = self._leer_firma()
+        if firma == self._firma:
+            return False
+        self._firma = firma
+        return True
+
+    def cerrar(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _leer_eventos(self) -> Set[bytes]:
+        nombres: Set[bytes] = set()
+        while True:
+            try:
+                datos = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return nombres
+            pos = 0
+            while pos < len(datos):
+                _, _, _, largo = _EVENTO.unpack_from(datos, pos)
+                pos += _EVENTO.size
+                nombres.add(datos[pos:pos + largo].rstrip(b"\0"))
+                pos += largo
+
+    def _leer_firma(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.ruta)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
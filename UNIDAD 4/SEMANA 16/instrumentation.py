@@ -0,0 +1,172 @@
+# instrumentation.py
+"""
+Medición opcional de las operaciones del inventario y de la interfaz.
+
+- @medido: decorador para funciones y métodos; cuenta llamadas y guarda su
+  latencia en un histograma de barras fijas (no guarda cada muestra).
+- Cronometro: lo mismo para un bloque de código (`with Cronometro("x"):`).
+- registrar_bytes: acumula los bytes escritos a disco por una operación.
+- estadisticas() / resumen(): las métricas como dict o como una línea de log.
+- perfilar(nombre, ruta): ejecuta esa operación bajo cProfile y vuelca el
+  perfil acumulado a `ruta` (se abre con `python -m pstats ruta`).
+
+Se activa con la variable de entorno INVENTARIO_METRICAS=1 o con activar().
+Desactivada, cada llamada medida solo consulta una bandera antes de ejecutar
+la función original. INVENTARIO_PERFIL=<operación> activa además cProfile
+para esa operación (p. ej. Inventario.guardar_en_archivo).
+"""
+import cProfile
+import os
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Límite superior (segundos) de cada barra del histograma; la última barra es "más lento"
+LIMITES = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class _Metrica:
+    __slots__ = ("llamadas", "total", "maximo", "histograma", "bytes")
+
+    def __init__(self) -> None:
+        self.llamadas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.histograma = [0] * (len(LIMITES) + 1)
+        self.bytes = 0
+
+    def registrar(self, segundos: float) -> None:
+        self.llamadas += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+        self.histograma[bisect_left(LIMITES, segundos)] += 1
+
+    def percentil(self, p: float) -> float:
+        """Límite de la barra donde cae el percentil p (cota superior, en segundos)."""
+        objetivo, acumulado = p * self.llamadas, 0
+        for i, cantidad in enumerate(self.histograma):
+            acumulado += cantidad
+            if cantidad and acumulado >= objetivo:
+                return LIMITES[i] if i < len(LIMITES) else self.maximo
+        return 0.0
+
+
+_activa = os.environ.get("INVENTARIO_METRICAS") == "1"
+_metricas: Dict[str, _Metrica] = {}
+# Operación -> (perfilador acumulado, archivo donde se vuelca)
+_perfiles: Dict[str, Tuple[cProfile.Profile, str]] = {}
+
+
+def activar(estado: bool = True) -> None:
+    global _activa
+    _activa = estado
+
+
+def activa() -> bool:
+    return _activa
+
+
+def reiniciar() -> None:
+    _metricas.clear()
+
+
+def _metrica(nombre: str) -> _Metrica:
+    metrica = _metricas.get(nombre)
+    if metrica is None:
+        metrica = _metricas[nombre] = _Metrica()
+    return metrica
+
+
+def medido(nombre=None):
+    """Decorador. Se usa como @medido (nombre = Clase.metodo) o @medido("gui.agregar")."""
+    def decorador(funcion: Callable) -> Callable:
+        etiqueta = nombre or funcion.__qualname__
+
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _activa:
+                return funcion(*args, **kwargs)
+            perfil = _perfiles.get(etiqueta)
+            inicio = time.perf_counter()
+            try:
+                if perfil is None:
+                    return funcion(*args, **kwargs)
+                return perfil[0].runcall(funcion, *args, **kwargs)
+            finally:
+                _metrica(etiqueta).registrar(time.perf_counter() - inicio)
+                if perfil is not None:
+                    perfil[0].dump_stats(perfil[1])
+        return envoltura
+
+    if callable(nombre):
+        funcion, nombre = nombre, None
+        return decorador(funcion)
+    return decorador
+
+
+class Cronometro:
+    """Context manager que mide un bloque con el nombre dado."""
+    __slots__ = ("nombre", "_inicio")
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self._inicio = 0.0
+
+    def __enter__(self) -> "Cronometro":
+        if _activa:
+            self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if _activa and self._inicio:
+            _metrica(self.nombre).registrar(time.perf_counter() - self._inicio)
+
+
+def registrar_bytes(nombre: str, cantidad: int) -> None:
+    if _activa:
+        _metrica(nombre).bytes += cantidad
+
+
+def perfilar(nombre: str, ruta: Optional[str] = None) -> None:
+    """Ejecuta la operación `nombre` bajo cProfile; el perfil se acumula entre
+    llamadas y se vuelca a `ruta` (por defecto `<nombre>.prof`) después de cada una."""
+    _perfiles[nombre] = (cProfile.Profile(), ruta or f"{nombre}.prof")
+
+
+def dejar_de_perfilar(nombre: str) -> None:
+    _perfiles.pop(nombre, None)
+
+
+def estadisticas() -> Dict[str, Dict]:
+    """Métricas por operación; tiempos en milisegundos."""
+    resultado = {}
+    for nombre, m in sorted(_metricas.items()):
+        etiquetas = [f"<={limite * 1000:g}ms" for limite in LIMITES] + [f">{LIMITES[-1] * 1000:g}ms"]
+        resultado[nombre] = {
+            "llamadas": m.llamadas,
+            "total_ms": m.total * 1000,
+            "promedio_ms": m.total * 1000 / m.llamadas if m.llamadas else 0.0,
+            "p95_ms": m.percentil(0.95) * 1000,
+            "maximo_ms": m.maximo * 1000,
+            "bytes": m.bytes,
+            "histograma": {e: c for e, c in zip(etiquetas, m.histograma) if c},
+        }
+    return resultado
+
+
+def resumen() -> str:
+    """Una línea con las operaciones que más tiempo acumulan."""
+    partes: List[str] = []
+    for nombre, m in sorted(estadisticas().items(), key=lambda e: -e[1]["total_ms"]):
+        texto = f"{nombre} x{m['llamadas']} prom {m['promedio_ms']:.2f} ms p95<={m['p95_ms']:g} ms"
+        if m["bytes"]:
+            texto += f" {m['bytes'] / 1024:.1f} KB"
+        partes.append(texto)
+    return " | ".join(partes) or "sin métricas"
+
+
+if os.environ.get("INVENTARIO_PERFIL"):
+    _activa = True
+    perfilar(os.environ["INVENTARIO_PERFIL"])
@@ -0,0 +1,45 @@
+# interning.py
+"""
+Codificación por diccionario de cadenas repetidas (autores, categorías, nombres).
+
+TablaCadenas guarda cada cadena distinta una sola vez, le asigna un código
+entero y precalcula su forma en minúsculas. Los objetos guardan la cadena
+canónica de la tabla (en vez de una copia propia) y su código; así un
+filtro como "autor contiene 'garcía'" se resuelve una sola vez sobre las
+cadenas distintas y luego se compara por código en cada objeto.
+
+Los códigos no se reutilizan: una cadena que deja de usarse sigue en la tabla.
+"""
+from typing import Dict, List, Set
+
+
+class TablaCadenas:
+    def __init__(self) -> None:
+        self._codigos: Dict[str, int] = {}
+        self._cadenas: List[str] = []
+        self._minusculas: List[str] = []
+
+    def codificar(self, texto: str) -> int:
+        """Código de `texto`; lo agrega a la tabla si es nuevo."""
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = self._codigos[texto] = len(self._cadenas)
+            self._cadenas.append(texto)
+            self._minusculas.append(texto.lower())
+        return codigo
+
+    def cadena(self, codigo: int) -> str:
+        """La cadena canónica (compartida) del código."""
+        return self._cadenas[codigo]
+
+    def minusculas(self, codigo: int) -> str:
+        return self._minusculas[codigo]
+
+    def codigos_que_contienen(self, fragmento: str) -> Set[int]:
+        """Códigos cuyas cadenas contienen `fragmento` sin distinguir mayúsculas.
+        Recorre solo las cadenas distintas, no los objetos que las usan."""
+        fragmento = fragmento.lower()
+        return {codigo for codigo, texto in enumerate(self._minusculas) if fragmento in texto}
+
+    def __len__(self) -> int:
+        return len(self._cadenas)
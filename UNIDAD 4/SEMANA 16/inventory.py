@@ -1,54 +1,179 @@
 # inventory.py
-import json
-from product import Producto
-from typing import Dict, List
+from product import Producto, VALIDADOR
+from analytics import AnaliticaInventario
+from ledger import LibroMovimientos
+from sorted_index import IndicesOrden
+from file_sync import (BloqueoArchivo, leer_generacion, leer_verificado, leer_versionado,
+                       escribir_versionado, fusionar, sin_contenido)
+from instrumentation import medido
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
 
 class Inventario:
-    def __init__(self):
+    def __init__(self, libro: Optional[LibroMovimientos] = None):
         # Almacenar productos en un dict por id para acceso rápido
         self.productos: Dict[str, Producto] = {}
+        # Totales y columnas para reportes, actualizados en cada operación
+        self.analitica = AnaliticaInventario()
+        # Índices ordenados por nombre, precio y cantidad para listar por páginas
+        self.orden = IndicesOrden()
+        # Historial de entradas/salidas; la cantidad de cada producto es su saldo
+        self.libro = libro if libro is not None else LibroMovimientos(None)
+        # Generación del archivo y registros tal como se leyeron (para fusionar al guardar)
+        self.generacion = 0
+        self._base: Dict[str, dict] = {}
+        self.conflictos: List[str] = []
 
+    @medido
     def agregar_producto(self, producto: Producto) -> bool:
         """Agrega un producto si no existe el ID. Retorna True si se agregó."""
         if producto.id in self.productos:
             return False
         self.productos[producto.id] = producto
+        self.analitica.agregar(producto.id, producto.cantidad, producto.precio)
+        self.orden.agregar(producto.id, producto.nombre, producto.precio, producto.cantidad)
+        self.libro.registrar([(producto.id, producto.cantidad)], "alta")
         return True
 
+    @medido
     def eliminar_producto(self, id_: str) -> bool:
         """Elimina producto por ID. Retorna True si se eliminó."""
         if id_ in self.productos:
-            del self.productos[id_]
+            p = self.productos.pop(id_)
+            self.analitica.eliminar(id_)
+            self.orden.eliminar(id_)
+            self.libro.registrar([(id_, -p.cantidad)], "baja")
             return True
         return False
 
+    @medido
     def modificar_producto(self, id_: str, nombre: str, cantidad: int, precio: float) -> bool:
         """Modifica un producto existente. Retorna True si se modificó."""
         if id_ in self.productos:
             p = self.productos[id_]
+            anterior = p.cantidad
             p.nombre = nombre
             p.cantidad = int(cantidad)
             p.precio = float(precio)
+            self.analitica.actualizar(id_, p.cantidad, p.precio)
+            self.orden.actualizar(id_, p.nombre, p.precio, p.cantidad)
+            self.libro.registrar([(id_, p.cantidad - anterior)], "ajuste")
             return True
         return False
 
+    @medido
+    def aplicar_transaccion(self, movimientos: Sequence[Tuple[str, int]], motivo: str = "movimiento"):
+        """Aplica varios movimientos (id, delta) a la vez: todos o ninguno.
+        Lanza KeyError si un ID no existe y ValueError si algún stock quedaría negativo."""
+        self.libro.transaccion(movimientos, motivo, lambda id_: self.productos[id_].cantidad,
+                               self._fijar_cantidad)
+
+    def _fijar_cantidad(self, id_: str, cantidad: int):
+        p = self.productos[id_]
+        p.cantidad = cantidad
+        self.analitica.actualizar(id_, cantidad, p.precio)
+        self.orden.actualizar(id_, p.nombre, p.precio, cantidad)
+
+    def conciliar(self) -> Dict[str, Tuple[int, int]]:
+        """Productos cuyo stock no coincide con el historial: id -> (cantidad, saldo del libro)."""
+        saldos = self.libro.saldos()
+        actuales = {i: p.cantidad for i, p in self.productos.items() if p.cantidad}
+        return {i: (actuales.get(i, 0), saldos.get(i, 0))
+                for i in set(saldos) | set(actuales)
+                if actuales.get(i, 0) != saldos.get(i, 0)}
+
     def obtener_todos(self) -> List[Producto]:
         return list(self.productos.values())
 
-    def guardar_en_archivo(self, ruta: str):
-        data = [p.to_dict() for p in self.obtener_todos()]
-        with open(ruta, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+    @medido
+    def listar(self, orden: Optional[str] = None, pagina: int = 0, tamano: int = 50,
+               descendente: bool = False) -> List[Producto]:
+        """Una página (desde 0) de productos ordenados por 'nombre', 'precio' o
+        'cantidad'; sin orden se respeta el orden de alta. No copia ni ordena todo."""
+        if orden is None:
+            return list(islice(self.productos.values(), pagina * tamano, (pagina + 1) * tamano))
+        return [self.productos[id_] for id_ in self.orden.pagina(orden, pagina, tamano, descendente)]
+
+    @medido
+    def guardar_en_archivo(self, ruta: str) -> List[str]:
+        """Guarda con bloqueo entre procesos. Si otro proceso guardó después de nuestra
+        última lectura, primero se fusionan sus cambios. Retorna los IDs que cambiaron
+        en memoria por esa fusión."""
+        with BloqueoArchivo(ruta):
+            try:
+                generacion, data = leer_versionado(ruta)
+            except (ValueError, KeyError):
+                # Archivo dañado: se reemplaza con el estado actual, como antes
+                generacion, data = self.generacion, []
+            externos = self._fusionar_archivo(generacion, data)
+            registros = [p.to_dict() for p in self.obtener_todos()]
+            # Cada registro sale de un Producto ya normalizado por su constructor
+            escribir_versionado(ruta, generacion + 1, registros, validador=VALIDADOR)
+            self.generacion = generacion + 1
+            self._base = {d["id"]: d for d in registros}
+        # El historial queda en disco junto con el inventario que refleja
+        self.libro.confirmar()
+        return externos
+
+    @medido
+    def recargar_cambios(self, ruta: str) -> List[str]:
+        """Trae lo que otros procesos guardaron sin escribir nada; solo se tocan
+        los productos que cambiaron. Retorna sus IDs. Un archivo borrado o vacío
+        no cuenta como cambio: se conservan los productos en memoria."""
+        if sin_contenido(ruta) or leer_generacion(ruta) == self.generacion:
+            # Es nuestro propio guardado (o nada cambió): no hace falta leer la lista
+            return []
+        with BloqueoArchivo(ruta):
+            generacion, data = leer_versionado(ruta)
+        externos = self._fusionar_archivo(generacion, data)
+        self.generacion = generacion
+        self._base = {d["id"]: d for d in data}
+        return externos
 
+    @medido
     def cargar_desde_archivo(self, ruta: str):
         try:
-            with open(ruta, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.productos = {d["id"]: Producto.from_dict(d) for d in data}
-        except FileNotFoundError:
-            # Si no existe el archivo, iniciamos con inventario vacío
-            self.productos = {}
+            with BloqueoArchivo(ruta):
+                self.generacion, data, confiable = leer_verificado(ruta, VALIDADOR)
+            # Un archivo guardado por esta misma clase no necesita volver a convertirse
+            crear = Producto.from_dict_confiable if confiable else Producto.from_dict
+            self.productos = {d["id"]: crear(d) for d in data}
+            self._base = {d["id"]: d for d in data}
         except Exception as e:
             # Si hay error en el archivo (formato), iniciamos vacío
             print(f"Error al cargar inventario: {e}")
             self.productos = {}
+            self.generacion, self._base = 0, {}
+        # Un libro recién creado parte del stock cargado; si no, conciliar lo
+        # reportaría todo como diferencia
+        self.libro.abrir_saldos((p.id, p.cantidad) for p in self.productos.values())
+        self.analitica.reconstruir((p.id, p.cantidad, p.precio) for p in self.productos.values())
+        self.orden.reconstruir((p.id, p.nombre, p.precio, p.cantidad) for p in self.productos.values())
+
+    def _fusionar_archivo(self, generacion: int, data: List[dict]) -> List[str]:
+        if generacion == self.generacion:
+            return []
+        mios = {id_: p.to_dict() for id_, p in self.productos.items()}
+        fusion, self.conflictos = fusionar(self._base, mios, {d["id"]: d for d in data})
+        externos = [i for i in list(fusion) + [i for i in mios if i not in fusion]
+                    if fusion.get(i) != mios.get(i)]
+        for id_ in externos:
+            self._aplicar_registro(id_, fusion.get(id_))
+        return externos
+
+    def _aplicar_registro(self, id_: str, datos: Optional[dict]):
+        """Aplica un registro leído del archivo (None = eliminado). No se anota en el
+        libro: el proceso que hizo el cambio ya lo registró."""
+        if datos is None:
+            del self.productos[id_]
+            self.analitica.eliminar(id_)
+            self.orden.eliminar(id_)
+        elif id_ not in self.productos:
+            p = self.productos[id_] = Producto.from_dict(datos)
+            self.analitica.agregar(id_, p.cantidad, p.precio)
+            self.orden.agregar(id_, p.nombre, p.precio, p.cantidad)
+        else:
+            p = self.productos[id_]
+            p.nombre, p.cantidad, p.precio = datos["nombre"], int(datos["cantidad"]), float(datos["precio"])
+            self.analitica.actualizar(id_, p.cantidad, p.precio)
+            self.orden.actualizar(id_, p.nombre, p.precio, p.cantidad)
@@ -0,0 +1,200 @@
+# ledger.py
+"""
+Libro de movimientos de stock (entradas y salidas con fecha y hora).
+
+Cada transacción es una lista de movimientos (id, delta) que se aplica
+completa o no se aplica: primero se validan todas las cantidades
+resultantes y recién después se modifican. En el archivo una transacción
+ocupa una sola línea JSON, así que al leerlo tampoco puede quedar a medias
+(una última línea truncada se descarta).
+
+Las líneas se acumulan en memoria y se escriben por grupos con un único
+flush + fsync (group commit), ya sea al juntar `tamano_grupo`
+transacciones, a más tardar `intervalo` segundos después de la primera
+pendiente (un temporizador escribe aunque no lleguen más transacciones),
+al llamar a confirmar() o cerrar(), y al terminar el programa. Una
+transacción es durable cuando confirmar() retorna. Con ruta=None el libro
+solo valida y aplica transacciones, sin guardar historial.
+
+Un libro nuevo no conoce el stock que ya existía: abrir_saldos() anota esas
+cantidades como movimientos de "apertura" para que los saldos coincidan
+con el inventario cargado.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from instrumentation import activa, medido, registrar_bytes
+
+# diario.py está en la carpeta UNIDAD 4 y lo comparten las aplicaciones de la unidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from diario import abrir_para_agregar
+
+Movimiento = Tuple[str, int]
+
+
+class LibroMovimientos:
+    def __init__(self, ruta: Optional[str], tamano_grupo: int = 1000, intervalo: float = 0.05):
+        self.ruta = ruta
+        self.tamano_grupo = tamano_grupo
+        self.intervalo = intervalo
+        self._pendientes: List[str] = []
+        self._archivo = None
+        self._ultimo_commit = time.monotonic()
+        self._temporizador: Optional[threading.Timer] = None
+        # Serializa las transacciones concurrentes sobre el mismo inventario
+        self._lock = threading.Lock()
+        if ruta is not None:
+            # Lo pendiente se escribe al salir; la referencia débil no retiene el libro
+            atexit.register(_cerrar_al_salir, weakref.ref(self))
+
+    def transaccion(self, movimientos: Sequence[Movimiento], motivo: str,
+                    obtener: Callable[[str], int], fijar: Callable[[str, int], None]) -> None:
+        """Aplica todos los movimientos o ninguno.
+
+        obtener(id) retorna la cantidad actual (KeyError si no existe) y
+        fijar(id, cantidad) actualiza la vista materializada del stock.
+        """
+        with self._lock:
+            nuevas: Dict[str, int] = {}
+            for id_, delta in movimientos:
+                # Un mismo producto puede aparecer varias veces en la transacción
+                nuevas[id_] = (nuevas[id_] if id_ in nuevas else obtener(id_)) + int(delta)
+            faltantes = [id_ for id_, cantidad in nuevas.items() if cantidad < 0]
+            if faltantes:
+                raise ValueError(f"Stock insuficiente para: {', '.join(faltantes)}")
+            for id_, cantidad in nuevas.items():
+                fijar(id_, cantidad)
+            self._anotar(movimientos, motivo)
+
+    def registrar(self, movimientos: Sequence[Movimiento], motivo: str) -> None:
+        """Anota movimientos ya aplicados al inventario (altas, bajas y ajustes)."""
+        with self._lock:
+            self._anotar(movimientos, motivo)
+
+    def confirmar(self) -> None:
+        """Escribe y sincroniza en disco todas las transacciones pendientes."""
+        with self._lock:
+            self._commit()
+
+    def cerrar(self) -> None:
+        with self._lock:
+            self._commit()
+            if self._archivo:
+                self._archivo.close()
+                self._archivo = None
+
+    def vacio(self) -> bool:
+        """True si el libro no tiene ninguna transacción, ni en disco ni pendiente."""
+        with self._lock:
+            if self._pendientes:
+                return False
+            return self.ruta is None or not os.path.exists(self.ruta) or os.path.getsize(self.ruta) == 0
+
+    def abrir_saldos(self, saldos: Iterable[Movimiento]) -> bool:
+        """Si el libro está vacío, anota `saldos` (id, cantidad) como apertura y lo
+        confirma. Retorna True si los anotó; un libro con historial no cambia."""
+        if self.ruta is None or not self.vacio():
+            return False
+        with self._lock:
+            self._anotar(list(saldos), "apertura")
+            self._commit()
+        return True
+
+    def leer(self) -> Iterator[Tuple[float, str, List[Movimiento]]]:
+        """Recorre las transacciones confirmadas: (fecha, motivo, movimientos)."""
+        if self.ruta is None or not os.path.exists(self.ruta):
+            return
+        with open(self.ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                try:
+                    fecha, motivo, movimientos = json.loads(linea)
+                except ValueError:
+                    # Línea truncada por un cierre abrupto: la transacción no se confirmó
+                    continue
+                yield fecha, motivo, [(id_, delta) for id_, delta in movimientos]
+
+    def saldos(self) -> Dict[str, int]:
+        """Reconstruye el stock de cada producto sumando todo el historial."""
+        stock: Dict[str, int] = {}
+        for _, _, movimientos in self.leer():
+            for id_, delta in movimientos:
+                stock[id_] = stock.get(id_, 0) + delta
+        return {id_: cantidad for id_, cantidad in stock.items() if cantidad}
+
+    def _anotar(self, movimientos: Sequence[Movimiento], motivo: str) -> None:
+        movimientos = [(id_, int(delta)) for id_, delta in movimientos if delta]
+        if not movimientos or self.ruta is None:
+            return
+        self._pendientes.append(json.dumps([time.time(), motivo, movimientos], ensure_ascii=False))
+        if (len(self._pendientes) >= self.tamano_grupo
+                or time.monotonic() - self._ultimo_commit >= self.intervalo):
+            self._commit()
+        elif self._temporizador is None:
+            # Sin más transacciones, el grupo igual se escribe tras `intervalo`
+            self._temporizador = threading.Timer(self.intervalo, self._commit_programado)
+            self._temporizador.daemon = True
+            self._temporizador.start()
+
+    def _commit_programado(self) -> None:
+        with self._lock:
+            self._temporizador = None
+            self._commit()
+
+    @medido
+    def _commit(self) -> None:
+        self._ultimo_commit = time.monotonic()
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        if not self._pendientes:
+            return
+        if self._archivo is None:
+            self._archivo = abrir_para_agregar(self.ruta)
+        texto = "\n".join(self._pendientes) + "\n"
+        self._archivo.write(texto)
+        self._archivo.flush()
+        os.fsync(self._archivo.fileno())
+        self._pendientes.clear()
+        if activa():
+            registrar_bytes("LibroMovimientos._commit", len(texto.encode("utf-8")))
+
+
+def _cerrar_al_salir(referencia: "weakref.ref[LibroMovimientos]") -> None:
+    libro = referencia()
+    if libro is not None:
+        libro.cerrar()
+
+
+# ------------------ Benchmark ------------------
+def benchmark(movimientos: int = 1_000_000, skus: int = 10_000) -> None:
+    """Mide movimientos/s con commits agrupados y durables (fsync) a disco."""
+    import random
+    import tempfile
+
+    random.seed(3)
+    ids = [f"SKU{i}" for i in range(skus)]
+    with tempfile.TemporaryDirectory() as carpeta:
+        for por_transaccion in (1, 50):
+            stock = dict.fromkeys(ids, 10**9)
+            libro = LibroMovimientos(os.path.join(carpeta, f"mov{por_transaccion}.jsonl"))
+            transacciones = movimientos // por_transaccion
+            pedidos = [[(ids[i], -1) for i in random.sample(range(skus), por_transaccion)]
+                       for _ in range(transacciones)]
+            inicio = time.perf_counter()
+            for pedido in pedidos:
+                libro.transaccion(pedido, "venta", stock.__getitem__, stock.__setitem__)
+            libro.cerrar()
+            segundos = time.perf_counter() - inicio
+            print(f"{transacciones:,} transacciones de {por_transaccion} movimiento(s): "
+                  f"{segundos:.2f} s -> {movimientos / segundos:,.0f} movimientos/s")
+            assert libro.saldos()[ids[0]] == stock[ids[0]] - 10**9
+
+
+if __name__ == "__main__":
+    benchmark()
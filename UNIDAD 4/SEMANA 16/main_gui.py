@@ -1,23 +1,54 @@
 # main_gui.py
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from inventory import Inventario
 from inventory import Producto
+from ledger import LibroMovimientos
+from file_watcher import VigilanteArchivo
+import instrumentation
+from instrumentation import medido
+
+# historial.py está en la carpeta UNIDAD 4 y lo comparten las aplicaciones de la unidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from historial import Historial, Cambio
 
 ARCHIVO_INVENTARIO = "inventario.json"
+ARCHIVO_MOVIMIENTOS = "movimientos.jsonl"
+# Cada cuánto se revisa si otra instancia modificó el inventario
+REVISION_MS = 500
+# Cada cuánto se escribe la línea de métricas (solo con INVENTARIO_METRICAS=1)
+REGISTRO_METRICAS_MS = 60_000
 
 class App:
     def __init__(self, root):
         self.root = root
         root.title("Sistema de Inventario - POO")
         root.geometry("800x500")
-        self.inventario = Inventario()
+        self.inventario = Inventario(LibroMovimientos(ARCHIVO_MOVIMIENTOS))
         self.inventario.cargar_desde_archivo(ARCHIVO_INVENTARIO)
+        # Treeview y resumen de la ventana de productos (si está abierta)
+        self._tree = None
+        self._lbl_resumen = None
+
+        # Historial de deshacer/rehacer; el archivo se reescribe una vez por operación
+        # (deshacer un lote de cambios no lo reescribe una vez por producto)
+        self.historial = Historial(self._aplicar_cambio)
+        self.historial.suscribir_operaciones(lambda cambios: self._guardar())
 
         self._crear_menu()
         self._crear_pantalla_principal()
+        # Recargar lo que otras instancias guarden en el archivo
+        self._vigilante = VigilanteArchivo(ARCHIVO_INVENTARIO)
+        self._error_revision = None
+        root.after(REVISION_MS, self._revisar_archivo)
+        if instrumentation.activa():
+            root.after(REGISTRO_METRICAS_MS, self._registrar_metricas)
         # Atajos
         root.bind("<Escape>", lambda e: root.quit())
+        root.bind("<Control-z>", lambda e: self.deshacer())
+        root.bind("<Control-y>", lambda e: self.rehacer())
 
     def _crear_menu(self):
         menubar = tk.Menu(self.root)
@@ -26,6 +57,14 @@ class App:
         productos_menu.add_separator()
         productos_menu.add_command(label="Salir", command=self.root.quit)
         menubar.add_cascade(label="Productos", menu=productos_menu)
+        editar_menu = tk.Menu(menubar, tearoff=0)
+        editar_menu.add_command(label="Deshacer (Ctrl+Z)", command=self.deshacer)
+        editar_menu.add_command(label="Rehacer (Ctrl+Y)", command=self.rehacer)
+        menubar.add_cascade(label="Editar", menu=editar_menu)
+        if instrumentation.activa():
+            diagnostico_menu = tk.Menu(menubar, tearoff=0)
+            diagnostico_menu.add_command(label="Métricas", command=self.mostrar_metricas)
+            menubar.add_cascade(label="Diagnóstico", menu=diagnostico_menu)
         self.root.config(menu=menubar)
 
     def _crear_pantalla_principal(self):
@@ -43,7 +82,8 @@ class App:
         lbl_info.pack(anchor="nw")
 
         instrucciones = ("Menú -> Productos -> Gestionar Productos\n"
-                          "Atajos: Delete = Eliminar producto seleccionado | Escape = Salir")
+                          "Atajos: Delete = Eliminar producto seleccionado | Escape = Salir\n"
+                          "Ctrl+Z = Deshacer | Ctrl+Y = Rehacer")
         ttk.Label(frame, text=instrucciones, padding=(0,10)).pack(anchor="nw")
 
     def abrir_ventana_productos(self):
@@ -51,6 +91,8 @@ class App:
         vp.title("Productos")
         vp.geometry("760x420")
         vp.transient(self.root)
+        vp.bind("<Control-z>", lambda e: self.deshacer())
+        vp.bind("<Control-y>", lambda e: self.rehacer())
 
         # Formulario de entrada
         form = ttk.Frame(vp, padding=8)
@@ -82,6 +124,7 @@ class App:
             cantidad_entry.delete(0, tk.END)
             precio_entry.delete(0, tk.END)
 
+        @medido("gui.agregar")
         def agregar():
             id_ = id_entry.get().strip()
             nombre = nombre_entry.get().strip()
@@ -100,9 +143,10 @@ class App:
                 messagebox.showerror("Error", f"El ID {id_} ya existe.")
                 return
             self._refrescar_tree(tree)
-            self.inventario.guardar_en_archivo(ARCHIVO_INVENTARIO)
+            self.historial.registrar("Agregar", [Cambio(producto.id, None, producto.to_dict())])
             limpiar_form()
 
+        @medido("gui.modificar")
         def modificar():
             selected = tree.selection()
             if not selected:
@@ -115,6 +159,8 @@ class App:
             if not id_ or not nombre or not cantidad or not precio:
                 messagebox.showwarning("Validación", "Todos los campos son obligatorios.")
                 return
+            anterior = self.inventario.productos.get(id_)
+            antes = anterior.to_dict() if anterior else None
             try:
                 ok = self.inventario.modificar_producto(id_, nombre, int(cantidad), float(precio))
             except ValueError:
@@ -124,9 +170,10 @@ class App:
                 messagebox.showerror("Error", f"No existe producto con ID {id_}.")
                 return
             self._refrescar_tree(tree)
-            self.inventario.guardar_en_archivo(ARCHIVO_INVENTARIO)
+            self.historial.registrar("Modificar", [Cambio(id_, antes, self.inventario.productos[id_].to_dict())])
             limpiar_form()
 
+        @medido("gui.eliminar")
         def eliminar(seleccion_manual=False):
             selected = tree.selection()
             if not selected:
@@ -134,19 +181,48 @@ class App:
                     return
                 messagebox.showinfo("Info", "Seleccione un producto para eliminar.")
                 return
-            item = selected[0]
-            id_ = tree.item(item, "values")[0]
+            # El iid de la fila es el ID tal cual (los valores de ttk convierten "1" en 1)
+            id_ = selected[0]
             if messagebox.askyesno("Confirmar", f"Eliminar producto ID {id_}?"):
+                antes = self.inventario.productos[id_].to_dict()
                 self.inventario.eliminar_producto(id_)
                 self._refrescar_tree(tree)
-                self.inventario.guardar_en_archivo(ARCHIVO_INVENTARIO)
+                self.historial.registrar("Eliminar", [Cambio(id_, antes, None)])
+
+        @medido("gui.movimiento")
+        def movimiento(signo):
+            """Registra una entrada (+) o salida (-) de stock del producto seleccionado."""
+            selected = tree.selection()
+            if not selected:
+                messagebox.showinfo("Info", "Seleccione un producto.")
+                return
+            id_ = selected[0]  # iid de la fila: el ID como texto
+            tipo = "entrada" if signo > 0 else "salida"
+            unidades = simpledialog.askinteger("Movimiento", f"Unidades de {tipo} para ID {id_}:",
+                                               parent=vp, minvalue=1)
+            if not unidades:
+                return
+            try:
+                antes = self.inventario.productos[id_].to_dict()
+                self.inventario.aplicar_transaccion([(id_, signo * unidades)], tipo)
+            except (KeyError, ValueError) as e:
+                messagebox.showerror("Error", str(e))
+                return
+            self._refrescar_tree(tree)
+            self.historial.registrar(tipo.capitalize(), [Cambio(id_, antes, self.inventario.productos[id_].to_dict())])
 
         ttk.Button(botones, text="Agregar", command=agregar).pack(side="left", padx=6)
         ttk.Button(botones, text="Modificar", command=modificar).pack(side="left", padx=6)
         ttk.Button(botones, text="Eliminar", command=lambda: eliminar(seleccion_manual=True)).pack(side="left", padx=6)
+        ttk.Button(botones, text="Entrada", command=lambda: movimiento(+1)).pack(side="left", padx=6)
+        ttk.Button(botones, text="Salida", command=lambda: movimiento(-1)).pack(side="left", padx=6)
         ttk.Button(botones, text="Limpiar", command=limpiar_form).pack(side="left", padx=6)
         ttk.Button(botones, text="Cerrar", command=vp.destroy).pack(side="right", padx=6)
 
+        # Resumen del inventario (agregados O(1) de la analítica)
+        self._lbl_resumen = ttk.Label(vp, padding=(8, 0, 8, 6))
+        self._lbl_resumen.pack(side="bottom", anchor="w")
+
         # Treeview para listar productos
         cols = ("ID", "Nombre", "Cantidad", "Precio")
         tree = ttk.Treeview(vp, columns=cols, show="headings", selectmode="browse")
@@ -158,6 +234,7 @@ class App:
             else:
                 tree.column(c, width=100, anchor="center")
         tree.pack(fill="both", expand=True, padx=6, pady=6)
+        self._tree = tree
 
         # Rellenar datos
         self._refrescar_tree(tree)
@@ -178,12 +255,102 @@ class App:
         # Atajo de teclado: tecla Delete para eliminar producto seleccionado
         tree.bind("<Delete>", lambda e: eliminar())
 
+    @medido("gui.deshacer")
+    def deshacer(self):
+        if self.historial.deshacer():
+            self._refrescar_tree_abierto()
+
+    @medido("gui.rehacer")
+    def rehacer(self):
+        if self.historial.rehacer():
+            self._refrescar_tree_abierto()
+
+    @medido("gui.guardar")
+    def _guardar(self):
+        # Si otra instancia guardó antes, el inventario trae sus cambios al fusionar
+        externos = self.inventario.guardar_en_archivo(ARCHIVO_INVENTARIO)
+        if externos:
+            self._aplicar_filas(externos)
+        if self.inventario.conflictos:
+            messagebox.showwarning("Conflicto", "Otra instancia modificó los mismos productos; "
+                                   f"se conservaron los datos de esta ventana: {', '.join(self.inventario.conflictos)}")
+            self.inventario.conflictos = []
+
+    def _aplicar_cambio(self, id_, actual, nuevo):
+        """Lleva el producto `id_` de `actual` a `nuevo` (None = no existe)."""
+        if nuevo is None:
+            self.inventario.eliminar_producto(id_)
+        elif actual is None:
+            self.inventario.agregar_producto(Producto.from_dict(nuevo))
+        else:
+            self.inventario.modificar_producto(id_, nuevo["nombre"], nuevo["cantidad"], nuevo["precio"])
+
+    @medido("gui.revisar_archivo")
+    def _revisar_archivo(self):
+        try:
+            if self._vigilante.revisar():
+                externos = self.inventario.recargar_cambios(ARCHIVO_INVENTARIO)
+                if externos:
+                    self._aplicar_filas(externos)
+            self._error_revision = None
+        except Exception as e:
+            # Un archivo ilegible no detiene la vigilancia; el error se informa
+            # una vez y se vuelve a intentar en la siguiente revisión
+            if str(e) != self._error_revision:
+                self._error_revision = str(e)
+                print(f"Error al recargar '{ARCHIVO_INVENTARIO}': {e}", file=sys.stderr, flush=True)
+        finally:
+            self.root.after(REVISION_MS, self._revisar_archivo)
+
+    def mostrar_metricas(self):
+        lineas = [f"{nombre}: {m['llamadas']} llamadas, prom {m['promedio_ms']:.2f} ms, "
+                  f"p95 <= {m['p95_ms']:g} ms, máx {m['maximo_ms']:.1f} ms"
+                  + (f", {m['bytes'] / 1024:.1f} KB escritos" if m["bytes"] else "")
+                  for nombre, m in instrumentation.estadisticas().items()]
+        messagebox.showinfo("Métricas", "\n".join(lineas) or "Sin métricas todavía.")
+
+    def _registrar_metricas(self):
+        print(f"[métricas] {instrumentation.resumen()}", flush=True)
+        self.root.after(REGISTRO_METRICAS_MS, self._registrar_metricas)
+
+    @medido("gui.aplicar_filas")
+    def _aplicar_filas(self, ids):
+        """Actualiza en el Treeview solo las filas de los productos indicados."""
+        tree = self._tree
+        if tree is None or not tree.winfo_exists():
+            return
+        for id_ in ids:
+            p = self.inventario.productos.get(id_)
+            if p is None:
+                if tree.exists(id_):
+                    tree.delete(id_)
+            elif tree.exists(id_):
+                tree.item(id_, values=(p.id, p.nombre, p.cantidad, f"{p.precio:.2f}"))
+            else:
+                tree.insert("", "end", iid=id_, values=(p.id, p.nombre, p.cantidad, f"{p.precio:.2f}"))
+        self._actualizar_resumen()
+
+    def _refrescar_tree_abierto(self):
+        if self._tree is not None and self._tree.winfo_exists():
+            self._refrescar_tree(self._tree)
+
+    @medido("gui.refrescar_tree")
     def _refrescar_tree(self, tree):
         # limpiar
         for i in tree.get_children():
             tree.delete(i)
         for p in self.inventario.obtener_todos():
-            tree.insert("", "end", values=(p.id, p.nombre, p.cantidad, f"{p.precio:.2f}"))
+            # El ID del producto es también el ID de la fila, para actualizarla sola
+            tree.insert("", "end", iid=p.id, values=(p.id, p.nombre, p.cantidad, f"{p.precio:.2f}"))
+        self._actualizar_resumen()
+
+    def _actualizar_resumen(self):
+        if self._lbl_resumen is None:
+            return
+        a = self.inventario.analitica
+        self._lbl_resumen.config(text=f"Productos: {a.numero_productos()} | "
+                                      f"Unidades: {a.total_unidades} | "
+                                      f"Valor total: {a.valor_total:.2f}")
 
 def main():
     root = tk.Tk()
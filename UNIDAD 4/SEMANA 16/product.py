@@ -1,4 +1,10 @@
 # product.py
+
+# Reglas con que el constructor normaliza cada producto; un archivo escrito con
+# este validador se carga con from_dict_confiable. Se incrementa si cambian.
+VALIDADOR = "semana16.Producto/1"
+
+
 class Producto:
     def __init__(self, id_: str, nombre: str, cantidad: int, precio: float):
         self.id = str(id_)
@@ -19,5 +25,14 @@ class Producto:
     def from_dict(d):
         return Producto(d["id"], d["nombre"], d["cantidad"], d["precio"])
 
+    @staticmethod
+    def from_dict_confiable(d):
+        """Construye sin convertir los campos. Solo para registros de un archivo
+        que leer_verificado dio por confiable con VALIDADOR."""
+        p = object.__new__(Producto)
+        # Asignar los atributos uno por uno es más rápido que reemplazar __dict__
+        p.id, p.nombre, p.cantidad, p.precio = d["id"], d["nombre"], d["cantidad"], d["precio"]
+        return p
+
     def __str__(self):
         return f"{self.id} - {self.nombre}: {self.cantidad} unidades @ {self.precio:.2f}"
\ No newline at end of file
@@ -0,0 +1,185 @@
+# sorted_index.py
+"""
+Índices ordenados para listar el inventario por páginas.
+
+IndiceOrdenado guarda claves (valor, id) ordenadas en bloques de tamaño
+acotado: insertar o eliminar busca el bloque con bisect y solo desplaza los
+elementos de ese bloque, en vez de toda la lista. Para saltar a la posición
+N se mantienen los inicios acumulados de cada bloque (se recalculan, en C,
+solo después de un cambio), así una página de k filas cuesta O(log n + k)
+sin copiar ni reordenar el inventario.
+
+IndicesOrden mantiene un IndiceOrdenado por cada campo de orden (nombre,
+precio y cantidad) y se actualiza junto con la analítica en cada operación.
+"""
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from instrumentation import medido
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Clave = Tuple[Any, str]
+
+# Campos por los que se puede ordenar un listado
+CAMPOS_ORDEN = ("nombre", "precio", "cantidad")
+
+
+class IndiceOrdenado:
+    """Lista ordenada de claves (valor, id) dividida en bloques."""
+
+    def __init__(self, tamano_bloque: int = 1000):
+        self.tamano_bloque = tamano_bloque
+        self._bloques: List[List[Clave]] = []
+        self._maximos: List[Clave] = []
+        self._inicios: Optional[List[int]] = None
+        self._n = 0
+
+    def agregar(self, clave: Clave) -> None:
+        self._inicios = None
+        self._n += 1
+        if not self._bloques:
+            self._bloques.append([clave])
+            self._maximos.append(clave)
+            return
+        b = min(bisect_left(self._maximos, clave), len(self._bloques) - 1)
+        bloque = self._bloques[b]
+        insort(bloque, clave)
+        self._maximos[b] = bloque[-1]
+        if len(bloque) > 2 * self.tamano_bloque:
+            # Partir el bloque para que los desplazamientos sigan siendo cortos
+            mitad = len(bloque) // 2
+            self._bloques[b:b + 1] = [bloque[:mitad], bloque[mitad:]]
+            self._maximos[b:b + 1] = [bloque[mitad - 1], bloque[-1]]
+
+    def eliminar(self, clave: Clave) -> None:
+        b = bisect_left(self._maximos, clave)
+        bloque = self._bloques[b] if b < len(self._bloques) else []
+        i = bisect_left(bloque, clave)
+        if i == len(bloque) or bloque[i] != clave:
+            raise KeyError(clave)
+        del bloque[i]
+        if bloque:
+            self._maximos[b] = bloque[-1]
+        else:
+            del self._bloques[b]
+            del self._maximos[b]
+        self._inicios = None
+        self._n -= 1
+
+    def reconstruir(self, claves: Iterable[Clave]) -> None:
+        """Carga todas las claves de una vez: un solo sort en lugar de n inserciones."""
+        ordenadas = sorted(claves)
+        t = self.tamano_bloque
+        self._bloques = [ordenadas[i:i + t] for i in range(0, len(ordenadas), t)]
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+        self._inicios = None
+        self._n = len(ordenadas)
+
+    def rango(self, inicio: int, fin: int) -> List[Clave]:
+        """Claves en las posiciones [inicio, fin) del orden."""
+        inicio, fin = max(inicio, 0), min(fin, self._n)
+        if inicio >= fin:
+            return []
+        if self._inicios is None:
+            self._inicios = list(accumulate(map(len, self._bloques), initial=0))
+        b = bisect_right(self._inicios, inicio) - 1
+        desde = inicio - self._inicios[b]
+        resultado: List[Clave] = []
+        while len(resultado) < fin - inicio:
+            resultado.extend(self._bloques[b][desde:desde + fin - inicio - len(resultado)])
+            b, desde = b + 1, 0
+        return resultado
+
+    def pagina(self, numero: int, tamano: int = 50, descendente: bool = False) -> List[Clave]:
+        if descendente:
+            return self.rango(self._n - (numero + 1) * tamano, self._n - numero * tamano)[::-1]
+        return self.rango(numero * tamano, (numero + 1) * tamano)
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class IndicesOrden:
+    """Un IndiceOrdenado por cada campo de CAMPOS_ORDEN; el ID desempata."""
+
+    def __init__(self, tamano_bloque: int = 1000):
+        self.indices = {campo: IndiceOrdenado(tamano_bloque) for campo in CAMPOS_ORDEN}
+        # Claves actuales de cada producto, para poder quitarlas al cambiar
+        self._claves: Dict[str, Tuple[Clave, ...]] = {}
+
+    @staticmethod
+    def _claves_de(id_: str, nombre: str, precio: float, cantidad: int) -> Tuple[Clave, ...]:
+        # El nombre se ordena sin distinguir mayúsculas, como en el menú de la SEMANA 11
+        return (nombre.lower(), id_), (precio, id_), (cantidad, id_)
+
+    @medido
+    def agregar(self, id_: str, nombre: str, precio: float, cantidad: int) -> None:
+        claves = self._claves[id_] = self._claves_de(id_, nombre, precio, cantidad)
+        for indice, clave in zip(self.indices.values(), claves):
+            indice.agregar(clave)
+
+    @medido
+    def eliminar(self, id_: str) -> None:
+        for indice, clave in zip(self.indices.values(), self._claves.pop(id_)):
+            indice.eliminar(clave)
+
+    @medido
+    def actualizar(self, id_: str, nombre: str, precio: float, cantidad: int) -> None:
+        nuevas = self._claves_de(id_, nombre, precio, cantidad)
+        for indice, anterior, nueva in zip(self.indices.values(), self._claves[id_], nuevas):
+            # Solo se reubica en los índices cuyo campo cambió
+            if anterior != nueva:
+                indice.eliminar(anterior)
+                indice.agregar(nueva)
+        self._claves[id_] = nuevas
+
+    @medido
+    def reconstruir(self, filas: Iterable[Tuple[str, str, float, int]]) -> None:
+        self._claves = {fila[0]: self._claves_de(*fila) for fila in filas}
+        for i, indice in enumerate(self.indices.values()):
+            indice.reconstruir(claves[i] for claves in self._claves.values())
+
+    def pagina(self, campo: str, numero: int, tamano: int = 50, descendente: bool = False) -> List[str]:
+        """IDs de la página `numero` (desde 0) ordenados por `campo`."""
+        if campo not in self.indices:
+            raise ValueError(f"No se puede ordenar por '{campo}'; use uno de {', '.join(CAMPOS_ORDEN)}.")
+        return [id_ for _, id_ in self.indices[campo].pagina(numero, tamano, descendente)]
+
+
+# ------------------ Benchmark ------------------
+def benchmark(n: int = 10_000_000, consultas: int = 10_000, tamano: int = 50) -> None:
+    """Mide la latencia de obtener páginas al azar de un índice con n claves."""
+    import random
+
+    random.seed(5)
+    claves = [(round(random.random() * 200, 2), f"SKU{i}") for i in range(n)]
+    indice = IndiceOrdenado()
+    inicio = time.perf_counter()
+    indice.reconstruir(claves)
+    print(f"Construir índice por precio con {n:,} productos: {time.perf_counter() - inicio:.2f} s")
+
+    paginas = n // tamano
+    numeros = [random.randrange(paginas) for _ in range(consultas)]
+    inicio = time.perf_counter()
+    for numero in numeros:
+        indice.pagina(numero, tamano)
+    t = (time.perf_counter() - inicio) / consultas
+    print(f"Página de {tamano} filas (índice sin cambios): {t * 1e6:.1f} µs")
+
+    inicio = time.perf_counter()
+    for numero in numeros[:1000]:
+        clave = (round(random.random() * 200, 2), f"NUEVO{numero}")
+        indice.agregar(clave)
+        indice.pagina(numero, tamano)
+        indice.eliminar(clave)
+    t = (time.perf_counter() - inicio) / 1000
+    print(f"Agregar + página + eliminar (índice con cambios): {t * 1e6:.1f} µs")
+
+    inicio = time.perf_counter()
+    sorted(claves)[:tamano]
+    print(f"Comparación: copiar y ordenar todo para una página: {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,25 @@
+# diario.py
+"""
+Apertura de diarios (journals) JSON Lines compartida por las aplicaciones de la
+Unidad 4: el diario de tareas (SEMANA 15) y el libro de movimientos (SEMANA 16).
+
+Un diario solo crece: cada registro es una línea nueva al final del archivo. Si
+un cierre abrupto deja la última línea a medias, quien lee la descarta; por eso
+el primer registro nuevo no puede pegarse a ella, porque se perdería con ella.
+"""
+import os
+from typing import TextIO
+
+
+def abrir_para_agregar(ruta: str) -> TextIO:
+    """Abre `ruta` para agregar líneas; si el archivo no termina en un salto de
+    línea (última línea truncada), escribe uno antes del primer registro nuevo."""
+    incompleta = False
+    if os.path.exists(ruta) and os.path.getsize(ruta) > 0:
+        with open(ruta, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            incompleta = f.read(1) != b"\n"
+    archivo = open(ruta, "a", encoding="utf-8")
+    if incompleta:
+        archivo.write("\n")
+    return archivo
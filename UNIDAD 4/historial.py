@@ -0,0 +1,106 @@
+# historial.py
+"""
+Historial de deshacer/rehacer compartido por las aplicaciones GUI de la Unidad 4.
+
+Cada operación se guarda como un Comando con la lista de Cambios que produjo.
+Un Cambio es solo el registro afectado: (clave, antes, despues), donde
+`antes is None` significa que el registro se creó y `despues is None` que se
+eliminó. No se guardan copias completas de la lista o del inventario.
+
+Cada aplicación entrega una función `aplicar(clave, actual, nuevo)` que sabe
+llevar un registro de `actual` a `nuevo`; el historial la usa para deshacer
+(nuevo = antes) y rehacer (nuevo = despues).
+
+Los suscriptores reciben cada cambio aplicado, incluidos los de deshacer y
+rehacer, y pueden usarlos para guardar en disco solo lo que cambió. Quien
+reescribe un archivo completo se suscribe por operación (suscribir_operaciones):
+recibe todos los cambios de un comando juntos y guarda una sola vez.
+"""
+from collections import deque
+from typing import Any, Callable, Deque, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Cambio(NamedTuple):
+    clave: Hashable
+    antes: Any
+    despues: Any
+
+
+class Comando(NamedTuple):
+    descripcion: str
+    cambios: Tuple[Cambio, ...]
+
+
+class Historial:
+    """Pilas de deshacer/rehacer acotadas; cada paso cuesta O(cambios del comando).
+
+    La pila de deshacer es un buffer circular (deque con maxlen): al superar
+    la capacidad se descarta el comando más antiguo sin copiar nada.
+    """
+
+    def __init__(self, aplicar: Callable[[Hashable, Any, Any], None], capacidad: int = 5000):
+        self._aplicar = aplicar
+        self._deshacer: Deque[Comando] = deque(maxlen=capacidad)
+        self._rehacer: List[Comando] = []
+        self._suscriptores: List[Callable[[Hashable, Any], None]] = []
+        self._suscriptores_operacion: List[Callable[[List[Tuple[Hashable, Any]]], None]] = []
+
+    def suscribir(self, funcion: Callable[[Hashable, Any], None]) -> None:
+        """Registra funcion(clave, valor) para cada cambio aplicado (valor None = eliminado)."""
+        self._suscriptores.append(funcion)
+
+    def suscribir_operaciones(self, funcion: Callable[[List[Tuple[Hashable, Any]]], None]) -> None:
+        """Registra funcion(cambios) una vez por operación (registrar, deshacer o
+        rehacer), con los pares (clave, valor) que dejó aplicados."""
+        self._suscriptores_operacion.append(funcion)
+
+    def registrar(self, descripcion: str, cambios: Sequence[Cambio]) -> None:
+        """Guarda una operación que la aplicación ya realizó."""
+        if not cambios:
+            return
+        self._deshacer.append(Comando(descripcion, tuple(cambios)))
+        self._rehacer.clear()
+        for c in cambios:
+            self._notificar(c.clave, c.despues)
+        self._notificar_operacion([(c.clave, c.despues) for c in cambios])
+
+    def deshacer(self) -> Optional[Comando]:
+        if not self._deshacer:
+            return None
+        comando = self._deshacer.pop()
+        # En orden inverso para que las posiciones de las listas sigan siendo válidas
+        for c in reversed(comando.cambios):
+            self._aplicar(c.clave, c.despues, c.antes)
+            self._notificar(c.clave, c.antes)
+        self._notificar_operacion([(c.clave, c.antes) for c in reversed(comando.cambios)])
+        self._rehacer.append(comando)
+        return comando
+
+    def rehacer(self) -> Optional[Comando]:
+        if not self._rehacer:
+            return None
+        comando = self._rehacer.pop()
+        for c in comando.cambios:
+            self._aplicar(c.clave, c.antes, c.despues)
+            self._notificar(c.clave, c.despues)
+        self._notificar_operacion([(c.clave, c.despues) for c in comando.cambios])
+        self._deshacer.append(comando)
+        return comando
+
+    def puede_deshacer(self) -> bool:
+        return bool(self._deshacer)
+
+    def puede_rehacer(self) -> bool:
+        return bool(self._rehacer)
+
+    def limpiar(self) -> None:
+        self._deshacer.clear()
+        self._rehacer.clear()
+
+    def _notificar(self, clave: Hashable, valor: Any) -> None:
+        for funcion in self._suscriptores:
+            funcion(clave, valor)
+
+    def _notificar_operacion(self, cambios: List[Tuple[Hashable, Any]]) -> None:
+        for funcion in self._suscriptores_operacion:
+            funcion(cambios)
@@ -0,0 +1,329 @@
+# benchmark_inventarios.py
+"""
+Benchmark de las cuatro generaciones de Inventario del repositorio:
+
+    - SEMANA 9:  lista de productos en memoria.
+    - SEMANA 10: lista respaldada en un archivo CSV (guarda en cada cambio).
+    - SEMANA 11: dict por ID + índice por nombre, JSON versionado.
+    - SEMANA 16: dict por ID + analítica, JSON versionado (la del GUI).
+
+Para cada implementación y tamaño se crea un inventario con datos sintéticos
+y se mide: memoria por producto, operaciones/s de agregar, actualizar,
+buscar y eliminar (con el inventario ya lleno) y filas/s al guardar y cargar.
+Los resultados se escriben en JSON y se comparan con una base guardada; una
+métrica que empeora más que la tolerancia se marca como regresión y el
+programa termina con código 1.
+
+Las tasas dependen de la máquina, así que cada ejecución mide también una
+carga de referencia fija (calibrar) y la comparación escala la base por la
+razón entre ambas referencias: una máquina la mitad de rápida espera la mitad
+de operaciones/s, y la base sirve en cualquier máquina.
+
+Uso:
+    python benchmark_inventarios.py                      # comparar con la base
+    python benchmark_inventarios.py --guardar-base       # actualizar la base
+    python benchmark_inventarios.py --tamanos 1000 100000 --salida resultados.json
+"""
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+BASE_POR_DEFECTO = os.path.join(RAIZ, "benchmark_inventarios_base.json")
+NOMBRES = ("Lápiz", "Cuaderno", "Borrador", "Regla", "Mochila", "Carpeta", "Marcador", "Tijeras")
+
+
+def _cargar_modulo(nombre, *ruta):
+    """Importa un archivo .py por ruta (los nombres de los ejercicios tienen espacios)."""
+    spec = importlib.util.spec_from_file_location(nombre, os.path.join(RAIZ, *ruta))
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo  # las dataclasses buscan su módulo aquí al crearse
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def generar_productos(n, inicio=0, semilla=1):
+    """Filas (id, nombre, cantidad, precio) con nombres repetidos como en una tienda real."""
+    azar = random.Random(semilla + inicio)
+    return [(i, f"{NOMBRES[i % len(NOMBRES)]} {i % 997}", azar.randrange(500), round(azar.random() * 100, 2))
+            for i in range(inicio, inicio + n)]
+
+
+# ------------------ Adaptadores ------------------
+class Semana9:
+    """Cada adaptador traduce las operaciones comunes a la API de su generación;
+    None en guardar/cargar/buscar significa que la generación no lo ofrece."""
+    nombre = "semana09_lista"
+    modulo = ("s09", "UNIDAD 3", "SEMANA 9", "Sistema de Gestión de Inventarios.py")
+
+    def __init__(self):
+        self.m = _cargar_modulo(*self.modulo)
+
+    def crear(self, ruta):
+        return self.m.Inventario()
+
+    def poblar(self, inv, filas):
+        inv.productos = [self.m.Producto(*f) for f in filas]
+
+    def agregar(self, inv, fila):
+        inv.agregar_producto(self.m.Producto(*fila))
+
+    def actualizar(self, inv, id_, cantidad):
+        inv.actualizar_producto(id_, cantidad)
+
+    def buscar(self, inv, nombre):
+        inv.buscar_producto(nombre)
+
+    def eliminar(self, inv, id_):
+        inv.eliminar_producto(id_)
+
+    guardar = None
+    cargar = None
+
+
+class Semana10(Semana9):
+    nombre = "semana10_archivo"
+    modulo = ("s10", "UNIDAD 3", "SEMANA 10", "Sistema de Gestión de Inventarios Mejorado.py")
+
+    def crear(self, ruta):
+        return self.m.Inventario(ruta)
+
+    def guardar(self, inv, ruta):
+        inv.archivo = ruta
+        inv.guardar_en_archivo()
+
+    def cargar(self, ruta):
+        return self.m.Inventario(ruta)
+
+
+class Semana11:
+    nombre = "semana11_dict_indice"
+
+    def __init__(self):
+        self.m = _cargar_modulo("s11", "UNIDAD 3", "SEMANA 11", "Sistema Avanzado de Gestión de Inventario.py")
+
+    def crear(self, ruta):
+        return self.m.Inventario()
+
+    def poblar(self, inv, filas):
+        for f in filas:
+            self.agregar(inv, f)
+
+    def agregar(self, inv, fila):
+        i, nombre, cantidad, precio = fila
+        inv.agregar(self.m.Producto(str(i), nombre, cantidad, precio))
+
+    def actualizar(self, inv, id_, cantidad):
+        inv.actualizar_cantidad(str(id_), cantidad)
+
+    def buscar(self, inv, nombre):
+        inv.buscar_por_nombre(nombre)
+
+    def eliminar(self, inv, id_):
+        inv.eliminar(str(id_))
+
+    def guardar(self, inv, ruta):
+        inv.guardar_en_archivo(ruta)
+
+    def cargar(self, ruta):
+        inv = self.m.Inventario()
+        inv.cargar_de_archivo(ruta)
+        return inv
+
+
+class Semana16:
+    nombre = "semana16_dict_json"
+
+    def __init__(self):
+        carpeta = os.path.join(RAIZ, "UNIDAD 4", "SEMANA 16")
+        if carpeta not in sys.path:
+            sys.path.append(carpeta)
+        self.inventory = importlib.import_module("inventory")
+        self.product = importlib.import_module("product")
+
+    def crear(self, ruta):
+        return self.inventory.Inventario()
+
+    def poblar(self, inv, filas):
+        for f in filas:
+            self.agregar(inv, f)
+
+    def agregar(self, inv, fila):
+        inv.agregar_producto(self.product.Producto(*fila))
+
+    def actualizar(self, inv, id_, cantidad):
+        p = inv.productos[str(id_)]
+        inv.modificar_producto(p.id, p.nombre, cantidad, p.precio)
+
+    buscar = None
+
+    def eliminar(self, inv, id_):
+        inv.eliminar_producto(str(id_))
+
+    def guardar(self, inv, ruta):
+        inv.guardar_en_archivo(ruta)
+
+    def cargar(self, ruta):
+        inv = self.inventory.Inventario()
+        inv.cargar_desde_archivo(ruta)
+        return inv
+
+
+IMPLEMENTACIONES = (Semana9, Semana10, Semana11, Semana16)
+
+
+# ------------------ Medición ------------------
+def _por_segundo(cantidad, funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return round(cantidad / max(time.perf_counter() - inicio, 1e-9), 1)
+
+
+def medir(impl, n, operaciones, carpeta):
+    """Métricas de una implementación con n productos."""
+    ruta = os.path.join(carpeta, f"{impl.nombre}_{n}.dat")
+    filas = generar_productos(n)
+    nuevas = generar_productos(operaciones, inicio=n)
+    azar = random.Random(n)
+    existentes = [f[0] for f in azar.sample(filas, min(operaciones, n))]
+    nombres = [f[1] for f in azar.sample(filas, min(operaciones, n))]
+    r = {}
+
+    inv = impl.crear(ruta)
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    impl.poblar(inv, filas)
+    r["bytes_por_producto"] = round((tracemalloc.get_traced_memory()[0] - antes) / n, 1)
+    tracemalloc.stop()
+
+    # Con el inventario lleno: las generaciones con listas pagan O(n) por operación
+    r["agregar_por_s"] = _por_segundo(len(nuevas), lambda: [impl.agregar(inv, f) for f in nuevas])
+    r["actualizar_por_s"] = _por_segundo(len(existentes),
+                                         lambda: [impl.actualizar(inv, i, 7) for i in existentes])
+    if impl.buscar:
+        r["buscar_por_s"] = _por_segundo(len(nombres), lambda: [impl.buscar(inv, nom) for nom in nombres])
+    r["eliminar_por_s"] = _por_segundo(len(nuevas), lambda: [impl.eliminar(inv, f[0]) for f in nuevas])
+    if impl.guardar:
+        r["guardar_filas_por_s"] = _por_segundo(n, lambda: impl.guardar(inv, ruta))
+        r["cargar_filas_por_s"] = _por_segundo(n, lambda: impl.cargar(ruta))
+    return r
+
+
+def calibrar(repeticiones=3):
+    """Operaciones/s de una carga fija de Python puro (crear tuplas, un dict y
+    ordenar), parecida a lo que hacen los inventarios. Se guarda la mejor."""
+    def carga():
+        filas = [(i, f"Producto {i % 997}", i % 500, i * 0.5) for i in range(200_000)]
+        por_id = {f[0]: f for f in filas}
+        sorted(por_id.values(), key=lambda f: f[1])
+    return max(_por_segundo(200_000, carga) for _ in range(repeticiones))
+
+
+def mejor_de(mediciones):
+    """Combina varias mediciones quedándose con la mejor de cada métrica: el ruido
+    (otros procesos, el recolector) solo puede empeorar un resultado."""
+    return {metrica: (min if metrica.startswith("bytes") else max)(m[metrica] for m in mediciones)
+            for metrica in mediciones[0]}
+
+
+def ejecutar(tamanos, operaciones, repeticiones=3):
+    referencia = calibrar(repeticiones)
+    resultados = {}
+    with tempfile.TemporaryDirectory() as carpeta, open(os.devnull, "w") as nulo:
+        for clase in IMPLEMENTACIONES:
+            # Las generaciones anteriores imprimen un mensaje por operación
+            with contextlib.redirect_stdout(nulo):
+                impl = clase()
+                metricas = {str(n): mejor_de([medir(impl, n, operaciones, carpeta)
+                                              for _ in range(repeticiones)])
+                            for n in tamanos}
+            resultados[impl.nombre] = metricas
+            print(f"✔ {impl.nombre}")
+    return {
+        "entorno": {"python": platform.python_version(), "sistema": platform.platform(),
+                    "nucleos": os.cpu_count(), "operaciones": operaciones,
+                    "repeticiones": repeticiones, "referencia_por_s": referencia},
+        "resultados": resultados,
+    }
+
+
+def regresiones(actual, base, tolerancia):
+    """Lista de (implementación, tamaño, métrica, base esperada, actual) que empeoraron
+    más que la tolerancia. Las tasas de la base se escalan por la velocidad relativa
+    de esta máquina (referencia_por_s); la memoria no depende de la máquina."""
+    escala = 1.0
+    if base.get("entorno", {}).get("referencia_por_s"):
+        escala = actual["entorno"]["referencia_por_s"] / base["entorno"]["referencia_por_s"]
+    peores = []
+    for impl, por_tamano in actual["resultados"].items():
+        for n, metricas in por_tamano.items():
+            referencia = base.get("resultados", {}).get(impl, {}).get(n, {})
+            for metrica, valor in metricas.items():
+                anterior = referencia.get(metrica)
+                if anterior is None:
+                    continue
+                # La memoria es mejor cuanto menor; el resto son tasas, mejores cuanto mayores
+                if metrica.startswith("bytes"):
+                    empeoro = valor > anterior * (1 + tolerancia)
+                else:
+                    anterior = round(anterior * escala, 1)
+                    empeoro = valor < anterior * (1 - tolerancia)
+                if empeoro:
+                    peores.append((impl, n, metrica, anterior, valor))
+    return peores
+
+
+def imprimir_tabla(datos):
+    for impl, por_tamano in datos["resultados"].items():
+        print(f"\n{impl}")
+        for n, metricas in por_tamano.items():
+            detalle = " | ".join(f"{k}: {v:,.0f}" for k, v in metricas.items())
+            print(f"  n={int(n):>8,}  {detalle}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de las implementaciones de Inventario.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--operaciones", type=int, default=200, help="operaciones medidas por tipo")
+    parser.add_argument("--repeticiones", type=int, default=3, help="se guarda la mejor de cada métrica")
+    parser.add_argument("--salida", default="resultados_inventarios.json")
+    parser.add_argument("--base", default=BASE_POR_DEFECTO)
+    parser.add_argument("--guardar-base", action="store_true", help="guardar estos resultados como la nueva base")
+    parser.add_argument("--tolerancia", type=float, default=0.3, help="empeoramiento relativo permitido")
+    args = parser.parse_args()
+
+    datos = ejecutar(args.tamanos, args.operaciones, args.repeticiones)
+    imprimir_tabla(datos)
+    destino = args.base if args.guardar_base else args.salida
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados guardados en '{destino}'.")
+    if args.guardar_base or not os.path.exists(args.base):
+        return 0
+
+    with open(args.base, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    peores = regresiones(datos, base, args.tolerancia)
+    if base["entorno"].get("referencia_por_s"):
+        print(f"Velocidad de esta máquina frente a la base: "
+              f"{datos['entorno']['referencia_por_s'] / base['entorno']['referencia_por_s']:.2f}x")
+    if not peores:
+        print(f"✔ Sin regresiones frente a '{args.base}' (tolerancia {args.tolerancia:.0%}).")
+        return 0
+    print(f"⚠ {len(peores)} regresión(es) frente a '{args.base}':")
+    for impl, n, metrica, anterior, valor in peores:
+        print(f"  {impl} n={n} {metrica}: {anterior:,.1f} (esperado) -> {valor:,.1f}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())